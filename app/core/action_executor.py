@@ -0,0 +1,153 @@
+"""
+Action Executor - Worker pool for slow command actions
+Steel OS v6.6
+
+Key Design:
+- Every command action carries an ActionSpec: its function, whether it
+  blocks, and its timeout
+- Blocking actions (processes, file ops, network) run on a small thread pool
+- Non-blocking actions run inline on the caller's (Qt) thread
+- Every job gets a cancel Event; INTERRUPTS cancel everything in flight
+- Per-job timeout: the job is cancelled and reported as timed out
+- Results come back as a Qt signal (queued onto the GUI thread)
+"""
+
+import itertools
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+
+MAX_WORKERS = 4
+POLL_INTERVAL = 0.05    # Cancel checks while waiting on a child process
+
+
+class ActionSpec(NamedTuple):
+    """How a command's action runs.
+
+    Blocking actions get `fn(cancel)` on the pool; `announce` is spoken on the
+    GUI thread before the job starts. Non-blocking ones get `fn()` inline.
+    """
+    fn: Callable
+    blocking: bool = False
+    timeout: Optional[float] = None
+    announce: Optional[str] = None
+
+
+class ActionCancelled(Exception):
+    """Raised inside a job that noticed its cancel Event."""
+
+
+def run_process(argv: List[str], cancel: threading.Event, timeout: float = None) -> int:
+    """Run a child process, killing it if `cancel` is set. Returns the exit code."""
+    process = subprocess.Popen(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    waited = 0.0
+    while True:
+        try:
+            return process.wait(POLL_INTERVAL)
+        except subprocess.TimeoutExpired:
+            waited += POLL_INTERVAL
+        if cancel.is_set() or (timeout is not None and waited >= timeout):
+            process.kill()
+            process.wait()
+            raise ActionCancelled(argv[0])
+
+
+class ActionExecutor(QObject):
+    """
+    Runs `fn(cancel, *args)` on the pool for blocking actions and `fn(*args)`
+    inline for the rest (they finish before anything could cancel them).
+    `actionFinished(job_id, name, ok, message)` reports every outcome once.
+    """
+
+    actionFinished = Signal(int, str, bool, str)
+    _workerFinished = Signal(int, str, bool, str)   # Worker thread -> GUI thread hop
+
+    def __init__(self, max_workers: int = MAX_WORKERS, parent: QObject = None):
+        super().__init__(parent)
+        self._workerFinished.connect(self._deliver)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="steel-action")
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._jobs: Dict[int, dict] = {}
+
+    def submit(self, name: str, fn: Callable, *args,
+               blocking: bool = True, timeout: Optional[float] = None) -> int:
+        """Start an action; returns its job id."""
+        job_id = next(self._ids)
+        cancel = threading.Event()
+        job = {"name": name, "cancel": cancel, "future": None}
+        with self._lock:
+            self._jobs[job_id] = job
+
+        if not blocking:
+            self._run(job_id, fn, None, args)
+            return job_id
+
+        job["future"] = self._pool.submit(self._run, job_id, fn, cancel, args)
+        if timeout is not None:
+            QTimer.singleShot(int(timeout * 1000), lambda: self._expire(job_id))
+        return job_id
+
+    def _run(self, job_id: int, fn: Callable, cancel: Optional[threading.Event], args):
+        try:
+            if cancel is None:
+                result = fn(*args)
+            else:
+                result = fn(cancel, *args)
+            if cancel is not None and cancel.is_set():
+                raise ActionCancelled()
+            self._finish(job_id, True, "" if result is None else str(result))
+        except ActionCancelled:
+            self._finish(job_id, False, "cancelled")
+        except Exception as e:
+            self._finish(job_id, False, str(e))
+
+    def _finish(self, job_id: int, ok: bool, message: str):
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job is None:
+            return  # Already reported (timed out / cancelled)
+        self._workerFinished.emit(job_id, job["name"], ok, message)
+
+    @Slot(int, str, bool, str)
+    def _deliver(self, job_id: int, name: str, ok: bool, message: str):
+        self.actionFinished.emit(job_id, name, ok, message)
+
+    def _expire(self, job_id: int):
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job["cancel"].set()
+        self._finish(job_id, False, "timed out")
+
+    def cancel(self, job_id: int):
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job["cancel"].set()
+        if job["future"] is not None and job["future"].cancel():
+            # Never started: no worker will report it
+            self._finish(job_id, False, "cancelled")
+
+    def cancel_all(self):
+        """Cancel every queued and running action (hard interrupt)."""
+        with self._lock:
+            job_ids = list(self._jobs)
+        for job_id in job_ids:
+            self.cancel(job_id)
+        if job_ids:
+            print(f"[ActionExecutor] Cancelled {len(job_ids)} action(s)")
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def shutdown(self):
+        self.cancel_all()
+        self._pool.shutdown(wait=False, cancel_futures=True)
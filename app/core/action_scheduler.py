@@ -0,0 +1,92 @@
+"""
+Action Scheduler - Non-blocking speak/act sequencing
+Steel OS v6.6
+
+Key Design:
+- A queue of steps (calls and pauses) driven by one single-shot QTimer
+- Pauses are timer waits, never time.sleep on the GUI thread
+- Steps queued while a step runs are inserted right after it, so nested
+  sequences (an action that speaks, then acts) keep their order
+- cancel() drops everything pending (hard interrupts)
+- Qt-thread only: call it from slots, not from worker threads
+"""
+
+from collections import deque
+from typing import Callable
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class ActionScheduler(QObject):
+    """Runs queued steps in order, yielding to the event loop on pauses."""
+
+    drained = Signal()      # Queue became empty
+
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        self._steps = deque()
+        self._nested = None     # Steps queued by the step currently running
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run)
+
+    # ─────────────────────────────────────────────────────────────
+    # QUEUEING
+    # ─────────────────────────────────────────────────────────────
+
+    def call(self, fn: Callable, *args):
+        """Queue `fn(*args)`."""
+        self._push((0, fn, args))
+
+    def pause(self, seconds: float):
+        """Queue a non-blocking wait."""
+        if seconds > 0:
+            self._push((int(seconds * 1000), None, ()))
+
+    def _push(self, step):
+        if self._nested is not None:
+            self._nested.append(step)
+            return
+        self._steps.append(step)
+        if not self._timer.isActive():
+            self._timer.start(0)
+
+    def cancel(self):
+        """Drop every pending step."""
+        pending = len(self._steps)
+        self._steps.clear()
+        if self._nested is not None:
+            self._nested.clear()
+        self._timer.stop()
+        if pending:
+            print(f"[ActionScheduler] Cancelled {pending} pending step(s)")
+        if self._nested is None:
+            self.drained.emit()
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._steps) or self._timer.isActive()
+
+    # ─────────────────────────────────────────────────────────────
+    # EXECUTION
+    # ─────────────────────────────────────────────────────────────
+
+    def _run(self):
+        """Run calls until a pause (or the end of the queue)."""
+        while self._steps:
+            delay, fn, args = self._steps.popleft()
+            if fn is None:
+                self._timer.start(delay)
+                return
+
+            self._nested = []
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"[ActionScheduler] Step failed: {e}")
+            finally:
+                nested, self._nested = self._nested, None
+            self._steps.extendleft(reversed(nested))
+
+        self.drained.emit()
@@ -2,10 +2,27 @@
 App State - Reactive State Management
 Steel OS v6.6
 """
+import os
+import threading
 from enum import Enum
-from PySide6.QtCore import QObject, Signal, Property, Slot, QTimer
+from PySide6.QtCore import QByteArray, QObject, Signal, Property, Slot, QTimer
+from .audio_bus import AudioBus, get_audio_bus
 from .mic_monitor import MicMonitor
-from .speech_recognizer import SpeechRecognizer
+from .spectrum import SpectrumAnalyzer
+from .vad import VoiceActivityDetector
+from .echo_gate import get_echo_gate
+from .latency_trace import get_latency_tracer
+from .log_sink import get_log_sink
+from .property_batcher import PropertyBatcher
+from .speech_recognizer import SpeechRecognizer, COMMAND_PHRASES, WAKE_WORD
+
+# Wake-word hand-off: decode from this far before the spotter's hit so the
+# command recognizer hears the whole "steel ..." phrase
+WAKE_PREROLL_SECONDS = 1.0
+
+# Silence after speech while capturing (counted in audio samples by the VAD)
+HOLD_SECONDS = 0.8          # -> HOLDING
+FALLBACK_SECONDS = 2.5      # -> end the utterance if the recognizer never finalized
 
 class AssistantState(str, Enum):
     IDLE = "IDLE"
@@ -18,59 +35,260 @@ class AssistantState(str, Enum):
     ERROR = "ERROR"
 
 class AppState(QObject):
-    def __init__(self):
+    def __init__(self, audio_bus: AudioBus = None):
         super().__init__()
         self._status = "Steel Core Online"
         self._current_theme = "base"
         self._assistant_state = AssistantState.IDLE.value
         self._audio_level = 0.0
+        self._spectrum = b""  # Packed float32 bands (0..1)
         self._partial_transcript = ""
         self._last_intent = ""
         self._confidence = 0.0
         self._current_wallpaper = "ambient_sky.png"  # Default wallpaper
         self._interaction_mode = "COMMAND"  # COMMAND, CONVERSATION
+        self._speech_ready = False  # Vosk model loaded (background)
+        
+        # Updates from worker threads: coalesced, delivered once per frame
+        self.props = PropertyBatcher(parent=self)
+        self.props.add("transcript", lambda: self._partial_transcript, self._apply_transcript)
+        self.props.add("audioLevel", lambda: self._audio_level, self._apply_audio_level)
+        self.props.add("spectrum", lambda: self._spectrum, self._apply_spectrum)
         
         # Audio Logic
-        self.silence_duration = 0.0
-        self.rms_threshold = 0.05
+        self._voice_active = False  # Latest VAD decision (Qt thread copy)
+        
+        # Endpointing: a grammar final + short tail ends the utterance.
+        # The VAD's FALLBACK_SECONDS silence milestone remains the fallback.
+        self.recognizer_endpointing = True
+        self.endpoint_tail = 0.1  # seconds
+        self.endpoint_timer = QTimer()
+        self.endpoint_timer.setSingleShot(True)
+        self.endpoint_timer.timeout.connect(self._finish_utterance)
+        self.endpointDetected.connect(self._on_endpoint_detected)
         
-        # Mic Monitor
-        self.mic = MicMonitor()
+        # Per-interaction latency timelines (VAD trigger -> back to IDLE)
+        self.tracer = get_latency_tracer()
+        self.tracer.add_listener(lambda timeline: self.latencyTimelinesChanged.emit())
+        
+        # Shared capture bus (one device stream for every consumer)
+        self.audio_bus = audio_bus or get_audio_bus()
+        
+        # Mic Monitor (level metering on the bus; notifies only on visible change)
+        self.mic = MicMonitor(self.audio_bus, on_level=lambda level: self.props.set("audioLevel", level))
         self.mic.start()
         
-        self.audio_timer = QTimer()
-        self.audio_timer.timeout.connect(self.update_audio)
-        self.audio_timer.start(16) # ~60fps
+        # Mic spectrum for the orb (one packed property, not one per band);
+        # on the bus only while capturing - the ring is hidden otherwise
+        self.spectrum_analyzer = SpectrumAnalyzer(
+            sample_rate=self.audio_bus.sample_rate,
+            on_bands=lambda data: self.props.set("spectrum", data)
+        )
+        self._spectrum_listener = self.spectrum_analyzer.process  # One bound method for add/remove
+        self._spectrum_on = False
+        
+        # Half-duplex: the assistant's own voice must not trigger listening
+        self.echo_gate = get_echo_gate()
+        self._voice_gated = False  # Current voice segment began during playback
+        
+        # Voice activity (adaptive noise floor) - decides when speech starts/ends
+        self.vad = VoiceActivityDetector(
+            sample_rate=self.audio_bus.sample_rate,
+            on_speech_start=lambda position: self.voiceActivityChanged.emit(True),
+            on_speech_end=lambda position: self.voiceActivityChanged.emit(False),
+            echo_gate=self.echo_gate,
+            on_silence=lambda seconds, position: self.silenceReached.emit(seconds),
+            silence_marks=(HOLD_SECONDS, FALLBACK_SECONDS)
+        )
+        self.voiceActivityChanged.connect(self._on_voice_activity)
+        self.silenceReached.connect(self._on_silence)
+        self.audio_bus.add_listener(self.vad.process)
         
-        # Clear log file on start
-        with open("logs.txt", "w") as f:
-            f.write("=== STEEL SESSION STARTED ===\n")
+        # Session log (new file per run, written off the GUI thread)
+        self.log_sink = get_log_sink()
         
-        # Speech Recognizer (Vosk - offline)
+        # Speech Recognizer (Vosk - offline, model loads in the background)
+        self._speech_loaded.connect(self._on_speech_loaded)
+        self.wakeWordHeard.connect(self._on_wake_word)
         self._init_speech_recognizer()
     
     def _init_speech_recognizer(self):
-        """Initialize the Vosk speech recognizer."""
+        """Create the Vosk speech recognizer; load its model off the UI thread."""
+        # Opt-in wake-word mode: only "Steel ..." starts a command session
+        self.wake_word_mode = os.environ.get("STEEL_WAKE_WORD") == "1"
+        self.wake_spotter = None
+        self._listen_from = None  # Bus position the next session decodes from
+        phrases = COMMAND_PHRASES + [WAKE_WORD] if self.wake_word_mode else None
+        
+        self.speech = SpeechRecognizer(
+            on_partial=self._on_partial_transcript,
+            on_final=self._on_final_transcript,
+            on_endpoint=self._on_recognizer_endpoint,
+            command_phrases=phrases,
+            audio_bus=self.audio_bus,
+            # Opt-in: decode in a child process so Kaldi can't stall the UI
+            out_of_process=os.environ.get("STEEL_DECODER_PROCESS") == "1"
+        )
+        self._status = "Loading voice model"
+        threading.Thread(target=self._load_speech_model, daemon=True, name="steel-model-load").start()
+    
+    def _load_speech_model(self):
+        """Worker thread: the slow Model() load."""
         try:
-            self.speech = SpeechRecognizer(
-                on_partial=self._on_partial_transcript,
-                on_final=self._on_final_transcript
-            )
-            print("[AppState] Speech recognizer initialized")
+            self.speech.load()
+            self._speech_loaded.emit(True)
         except Exception as e:
             print(f"[AppState] Failed to initialize speech recognizer: {e}")
+            self._speech_loaded.emit(False)
+    
+    @Slot(bool)
+    def _on_speech_loaded(self, ok: bool):
+        """Model load finished (delivered on the Qt thread)."""
+        if ok:
+            print("[AppState] Speech recognizer initialized")
+            self._speech_ready = True
+            if self.wake_word_mode:
+                self._init_wake_spotter()
+            self._status = "Steel Core Online"
+            self.speechReadyChanged.emit()
+            self._update_listening()
+        else:
             self.speech = None
+            self._status = "Voice offline"
+        self.statusChanged.emit()
+    
+    def _init_wake_spotter(self):
+        """Wake-word spotter on the shared model, decoding only while the VAD hears voice."""
+        self.wake_spotter = self.speech.create_spotter(
+            [WAKE_WORD], self._on_wake_word_spotted,
+            active_when=lambda: self.vad.is_speech
+        )
+        if self.wake_spotter is None:
+            print("[AppState] Wake word needs the in-process model - using voice activity")
+            return
+        print(f"[AppState] Wake-word mode: say '{WAKE_WORD}'")
+        self._update_wake_spotter(self._assistant_state)
+    
+    def _update_wake_spotter(self, state: str):
+        """The spotter only runs while IDLE."""
+        if not self.wake_spotter:
+            return
+        if state == AssistantState.IDLE.value:
+            self.wake_spotter.start()
+        else:
+            self.wake_spotter.stop()
+    
+    def _update_spectrum(self):
+        """The spectrum analyzer only runs while capturing."""
+        capturing = self.is_capturing()
+        if capturing == self._spectrum_on:
+            return
+        self._spectrum_on = capturing
+        if capturing:
+            self.audio_bus.add_listener(self._spectrum_listener)
+        else:
+            self.audio_bus.remove_listener(self._spectrum_listener)
+            # Bands drop to zero, so the next capture starts from silence
+            self.spectrum_analyzer.reset()
+    
+    def _on_wake_word_spotted(self, keyword: str, position: int):
+        """Spotter thread - hop to the Qt thread."""
+        self.wakeWordHeard.emit(position)
+    
+    @Slot(object)
+    def _on_wake_word(self, position: int):
+        """Hand off to the command recognizer, replaying from before the wake word."""
+        if self._assistant_state != AssistantState.IDLE.value:
+            return
+        self.tracer.begin("wake_word")
+        self._listen_from = position - int(WAKE_PREROLL_SECONDS * self.audio_bus.sample_rate)
+        self.set_state("PRE_LISTEN")
     
     def _on_partial_transcript(self, text: str):
-        """Called when partial transcript is available (live subtitles)."""
-        self._partial_transcript = text
-        self.transcriptChanged.emit()
+        """Called when partial transcript is available (live subtitles, any thread)."""
+        self.props.set("transcript", text)
     
     def _on_final_transcript(self, text: str):
-        """Called when final transcript is available."""
+        """Called when final transcript is available (any thread)."""
+        self.props.set("transcript", text)
+        self.log(f"Transcript: {text}")
+    
+    def _apply_transcript(self, text: str):
+        """Qt thread, at most once per frame."""
         self._partial_transcript = text
         self.transcriptChanged.emit()
-        self.log(f"Transcript: {text}")
+        self.partialHeard.emit(text)
+    
+    @Slot(bool)
+    def _on_voice_activity(self, active: bool):
+        """VAD event, delivered on the Qt thread."""
+        self._voice_active = active
+        if not active:
+            self._voice_gated = False
+        elif self.echo_gate.active:
+            # Most likely the speakers: never let this segment auto-trigger,
+            # even if it outlasts RESPONDING and is still open back in IDLE
+            self._voice_gated = True
+            self.echo_gate.note_suppressed_trigger()
+            self.echoSuppressedChanged.emit()
+            self.log(f"Echo gate: trigger suppressed (#{self.echo_gate.suppressed_triggers})", "DEBUG")
+        self._update_listening()
+    
+    @Slot(float)
+    def _on_silence(self, seconds: float):
+        """VAD silence milestone (counted in samples), delivered on the Qt thread."""
+        if not self.is_capturing() or self._voice_active:
+            return
+        if seconds >= FALLBACK_SECONDS:
+            # Fallback when the recognizer never finalized
+            self._finish_utterance()
+        elif self._assistant_state != AssistantState.HOLDING.value:
+            self.set_state("HOLDING")
+    
+    def _update_listening(self):
+        """Voice activity drives IDLE -> PRE_LISTEN -> LISTENING (no polling)."""
+        state = self._assistant_state
+        if state == AssistantState.IDLE.value:
+            # Nothing to listen with until the model has loaded; in wake-word
+            # mode only the spotter may start a session
+            if (self._voice_active and self._speech_ready and not self._voice_gated
+                    and not self.echo_gate.active and not self.wake_spotter):
+                self.tracer.begin("vad_trigger")
+                self.set_state("PRE_LISTEN")
+        elif self.is_capturing() and self._voice_active and state != AssistantState.LISTENING.value:
+            self.set_state("LISTENING")
+    
+    def _on_recognizer_endpoint(self, text: str):
+        """Called from the recognition thread - hop to the Qt thread."""
+        self.endpointDetected.emit(text)
+    
+    @Slot(str)
+    def _on_endpoint_detected(self, text: str):
+        """Recognizer hit an endpoint (trailing silence): end after a short tail."""
+        if not self.recognizer_endpointing or self._interaction_mode != "COMMAND":
+            return
+        if not self.is_capturing():
+            return
+        self.endpoint_timer.start(int(self.endpoint_tail * 1000))
+    
+    def is_capturing(self) -> bool:
+        """True while an utterance is being captured (PRE_LISTEN/LISTENING/HOLDING)."""
+        return self._assistant_state in [
+            AssistantState.PRE_LISTEN.value,
+            AssistantState.LISTENING.value,
+            AssistantState.HOLDING.value
+        ]
+    
+    def _finish_utterance(self):
+        """End of speech: collect the final transcript, then PROCESSING."""
+        self.endpoint_timer.stop()
+        if not self.is_capturing():
+            return  # Cancelled (e.g. user tapped the orb) during the tail
+        # CRITICAL: Stop speech FIRST to get final transcript
+        # THEN transition to PROCESSING
+        if hasattr(self, 'speech') and self.speech and self.speech.is_running:
+            self.speech.stop()  # Queues the final result (delivered when PROCESSING begins)
+        self.set_state("PROCESSING")
 
     # Signals
     statusChanged = Signal()
@@ -78,12 +296,22 @@ class AppState(QObject):
     assistantStateChanged = Signal()
     listeningImminent = Signal()
     audioLevelChanged = Signal()
+    spectrumChanged = Signal()
     transcriptChanged = Signal()
+    partialHeard = Signal(str)  # Transcript update (Qt thread, frame-coalesced)
     lastIntentChanged = Signal()
     confidenceChanged = Signal()
     wallpaperChanged = Signal()
     reloadUIRequested = Signal()
     interactionModeChanged = Signal()  # COMMAND/CONVERSATION mode changes
+    endpointDetected = Signal(str)  # Recognizer end-of-utterance (queued to Qt thread)
+    voiceActivityChanged = Signal(bool)  # VAD speech start/end (queued to Qt thread)
+    silenceReached = Signal(float)  # VAD silence milestone in seconds (queued to Qt thread)
+    speechReadyChanged = Signal()
+    latencyTimelinesChanged = Signal()
+    echoSuppressedChanged = Signal()
+    wakeWordHeard = Signal(object)  # Bus position of the hit (spotter thread -> Qt thread)
+    _speech_loaded = Signal(bool)  # Worker -> Qt thread hop for model load
 
     # Properties
     @Property(str, notify=statusChanged)
@@ -102,6 +330,11 @@ class AppState(QObject):
     def audioLevel(self):
         return self._audio_level
 
+    @Property(QByteArray, notify=spectrumChanged)
+    def spectrum(self):
+        """Mic band levels 0..1, packed float32 (`new Float32Array(app.spectrum)`)"""
+        return QByteArray(self._spectrum)
+
     @Property(str, notify=transcriptChanged)
     def partialTranscript(self):
         return self._partial_transcript
@@ -118,6 +351,21 @@ class AppState(QObject):
     def currentWallpaper(self):
         return self._current_wallpaper
 
+    @Property(bool, notify=speechReadyChanged)
+    def speechReady(self):
+        """True once the voice model has loaded"""
+        return self._speech_ready
+
+    @Property('QVariantList', notify=latencyTimelinesChanged)
+    def latencyTimelines(self):
+        """Latest interaction timelines (for the debug overlay)"""
+        return self.tracer.timelines()
+
+    @Property(int, notify=echoSuppressedChanged)
+    def echoSuppressed(self):
+        """Auto-triggers blocked because the assistant was speaking"""
+        return self.echo_gate.suppressed_triggers
+
     @Property(str, notify=interactionModeChanged)
     def interactionMode(self):
         """Current interaction mode: COMMAND or CONVERSATION"""
@@ -133,24 +381,34 @@ class AppState(QObject):
             print(f"[AppState] Interaction mode: {mode}")
     @Slot(float)
     def set_audio_level(self, level):
-        if self._audio_level != level:
-            self._audio_level = level
-            self.audioLevelChanged.emit()
+        self.props.set("audioLevel", level)
+    
+    def _apply_audio_level(self, level: float):
+        """Qt thread, at most once per frame."""
+        self._audio_level = level
+        self.audioLevelChanged.emit()
+    
+    def _apply_spectrum(self, data: bytes):
+        """Qt thread, at most once per frame."""
+        self._spectrum = data
+        self.spectrumChanged.emit()
 
     @Slot()
     def request_listening(self):
+        if not self._speech_ready:
+            self.log("Listening requested before voice model is ready", "WARN")
+            return
         self.listeningImminent.emit()
         # Manual trigger jumps to PRE_LISTEN
+        self.tracer.begin("manual_trigger")
         self.set_state("PRE_LISTEN")
-        self.silence_duration = 0.0
 
     @Slot(str)
     def set_transcript(self, text):
         """Set the transcript text (from voice recognition or for testing)."""
         if self._partial_transcript != text:
-            self._partial_transcript = text
-            self.transcriptChanged.emit()
             self.log(f"Transcript: {text}")
+        self.props.set("transcript", text)
 
     @Slot(str, float)
     def set_intent(self, intent, confidence):
@@ -177,25 +435,40 @@ class AppState(QObject):
             if self._assistant_state != valid_state:
                 old_state = self._assistant_state
                 self._assistant_state = valid_state
+                if valid_state == AssistantState.PROCESSING.value:
+                    self.tracer.mark("processing")
+                    # Handlers read partialTranscript right away: deliver the final now
+                    self.props.flush()
                 self.assistantStateChanged.emit()
                 self.log(f"State changed to: {valid_state}")
                 
                 # Start/stop speech recognition based on state
                 self._handle_speech_recognition_state(old_state, valid_state)
+                self._update_wake_spotter(valid_state)
+                self._update_spectrum()
+                
+                if valid_state == AssistantState.PRE_LISTEN.value and old_state == AssistantState.IDLE.value:
+                    # New session: silence counts from now unless the VAD hears voice
+                    self.vad.restart_silence(self.audio_bus.write_position)
+                if valid_state == AssistantState.IDLE.value:
+                    self.tracer.end("idle")
+                if valid_state in (AssistantState.IDLE.value, AssistantState.PRE_LISTEN.value):
+                    # Voice may already be active (e.g. user still talking)
+                    self._update_listening()
         except KeyError:
-            self.log(f"Invalid state requested: {new_state}")
+            self.log(f"Invalid state requested: {new_state}", "WARN")
     
     def _handle_speech_recognition_state(self, old_state: str, new_state: str):
         """Start/stop speech recognition based on state transitions."""
-        if not hasattr(self, 'speech') or not self.speech:
+        if not self._speech_ready or not self.speech:
             return
         
         # Start listening when entering PRE_LISTEN or LISTENING
         if new_state in [AssistantState.PRE_LISTEN.value, AssistantState.LISTENING.value]:
             if not self.speech.is_running:
-                self._partial_transcript = ""  # Clear old transcript
-                self.transcriptChanged.emit()
-                self.speech.start()
+                self.props.set("transcript", "")  # Clear old transcript (drops stale partials)
+                self.speech.start(start_position=self._listen_from)
+                self._listen_from = None
         
         # Stop listening when entering PROCESSING (get final transcript)
         elif new_state == AssistantState.PROCESSING.value:
@@ -232,59 +505,14 @@ class AppState(QObject):
         self.reloadUIRequested.emit()
 
     @Slot(str)
-    def log(self, message):
+    def log(self, message, level="INFO"):
         print(f"[QML Log]: {message}")
-        try:
-            with open("logs.txt", "a") as f:
-                f.write(f"{message}\n")
-        except: pass
-
-    def update_audio(self):
-        # Smooth decay
-        current_decay = self._audio_level * 0.85
-        
-        # Get Mic Level
-        mic_level = 0.0
-        if hasattr(self, 'mic') and self.mic:
-            mic_level = self.mic.level
-            
-        self._audio_level = max(current_decay, mic_level)
-        self.audioLevelChanged.emit()
+        self.log_sink.write(str(message), level)
 
-        # ─────────────────────────────────────────────────────────────
-        # LISTENING LOGIC (Micro-States)
-        # ─────────────────────────────────────────────────────────────
-        dt = 0.016 # 16ms
-        
-        # 1. IDLE -> PRE_LISTEN (Auto-Trigger)
-        if self._assistant_state == AssistantState.IDLE.value:
-            if mic_level > self.rms_threshold:
-                self.set_state("PRE_LISTEN")
-                self.silence_duration = 0.0
-
-        # 2. WATCHING (PRE_LISTEN / LISTENING / HOLDING)
-        elif self._assistant_state in [
-            AssistantState.PRE_LISTEN.value, 
-            AssistantState.LISTENING.value, 
-            AssistantState.HOLDING.value
-        ]:
-            if mic_level > self.rms_threshold:
-                # User is speaking
-                self.silence_duration = 0.0
-                if self._assistant_state != AssistantState.LISTENING.value:
-                    self.set_state("LISTENING")
-            else:
-                # Silence detected
-                self.silence_duration += dt
-                
-                # Check Timers
-                if self.silence_duration > 0.8 and self.silence_duration < 2.5:
-                    if self._assistant_state != AssistantState.HOLDING.value:
-                        self.set_state("HOLDING")
-                
-                elif self.silence_duration > 2.5:
-                    # CRITICAL: Stop speech FIRST to get final transcript
-                    # THEN transition to PROCESSING
-                    if hasattr(self, 'speech') and self.speech and self.speech.is_running:
-                        self.speech.stop()  # This updates _partial_transcript with final result
-                    self.set_state("PROCESSING")
+    @Slot()
+    def shutdown(self):
+        """App teardown: stop the recognizer and its decoder process."""
+        if self.wake_spotter:
+            self.wake_spotter.stop()
+        if self.speech:
+            self.speech.close()
@@ -0,0 +1,232 @@
+"""
+Audio Bus - Single-capture microphone engine
+Steel OS v6.6
+
+Key Design:
+- ONE input stream owns the device (int16, mono, 16 kHz)
+- Preallocated ring buffer, written in place by the audio callback
+- Consumers subscribe with their own read cursor and get zero-copy views
+- Block listeners run inside the callback (level metering, VAD, ...)
+"""
+
+import threading
+from typing import Callable, List, Optional
+
+import numpy as np
+
+try:
+    import sounddevice as sd
+except OSError:  # PortAudio missing (headless boxes)
+    sd = None
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════
+SAMPLE_RATE = 16000
+BLOCK_SIZE = 800        # 50 ms per callback
+RING_SECONDS = 10.0     # History kept in the ring
+
+
+class AudioReader:
+    """
+    Per-consumer read cursor into the AudioBus ring.
+    Positions are absolute sample indices since the bus started.
+    """
+
+    def __init__(self, bus: "AudioBus", position: int):
+        self._bus = bus
+        self.position = position
+        self.overruns = 0
+        self.closed = False
+
+    def available(self) -> int:
+        """Number of unread samples."""
+        return self._bus.write_position - self.position
+
+    def read(self, max_samples: int = None, timeout: float = None) -> List[np.ndarray]:
+        """
+        Return unread audio as views into the ring (1 or 2 segments on wrap).
+        Blocks up to `timeout` seconds when nothing is available.
+        Views are only valid until the writer laps them - copy if kept.
+        """
+        bus = self._bus
+        if self.available() <= 0 and timeout:
+            bus.wait_for_data(self.position, timeout)
+
+        write_pos = bus.write_position
+        # Slow consumer: the writer lapped us, skip to the oldest valid sample
+        if write_pos - self.position > bus.capacity:
+            self.overruns += 1
+            self.position = write_pos - bus.capacity
+
+        count = write_pos - self.position
+        if max_samples is not None:
+            count = min(count, max_samples)
+        if count <= 0 or self.closed:
+            return []
+
+        segments = bus.views(self.position, count)
+        self.position += count
+        return segments
+
+    def seek(self, position: int):
+        """Move the cursor (clamped to what the ring still holds)."""
+        oldest = max(0, self._bus.write_position - self._bus.capacity)
+        self.position = min(max(position, oldest), self._bus.write_position)
+
+    def close(self):
+        self.closed = True
+        self._bus.unsubscribe(self)
+
+
+class AudioBus:
+    """Owns the microphone and fans audio out to every consumer."""
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE,
+                 block_size: int = BLOCK_SIZE,
+                 ring_seconds: float = RING_SECONDS,
+                 capture: bool = True):
+        """`capture=False` never opens a device: audio arrives via write() only."""
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.capacity = int(sample_rate * ring_seconds)
+
+        self._ring = np.zeros(self.capacity, dtype=np.int16)
+        self._write_pos = 0  # Absolute samples written since start
+        self._cond = threading.Condition()
+
+        self._listeners: List[Callable[[np.ndarray, int], None]] = []
+        self._readers: List[AudioReader] = []
+
+        self.capture = capture
+        self.running = False
+        self.stream = None
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # DEVICE
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def start(self):
+        """Open the single capture stream (idempotent)."""
+        if self.running or not self.capture:
+            return
+        if sd is None:
+            print("[AudioBus] sounddevice unavailable - external feed only")
+            return
+        self.running = True
+        try:
+            self.stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                blocksize=self.block_size,
+                dtype='int16',
+                channels=1,
+                callback=self._audio_callback
+            )
+            self.stream.start()
+            print(f"[AudioBus] Capturing at {self.sample_rate} Hz, {self.block_size} frames/block")
+        except Exception as e:
+            print(f"[AudioBus] Failed to start stream: {e}")
+            self.running = False
+            self.stream = None
+
+    def stop(self):
+        self.running = False
+        if self.stream:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+    def _audio_callback(self, indata, frames, time_info, status):
+        if status:
+            print(f"[AudioBus] Audio status: {status}")
+        self.write(indata[:, 0])
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # RING
+    # ═══════════════════════════════════════════════════════════════════════
+
+    @property
+    def write_position(self) -> int:
+        return self._write_pos
+
+    def write(self, samples: np.ndarray):
+        """
+        Push int16 samples into the ring (device callback or file replay),
+        then run block listeners on a view of what was just written.
+        """
+        n = len(samples)
+        if n == 0:
+            return
+        if n > self.capacity:
+            samples = samples[-self.capacity:]
+            n = self.capacity
+
+        start = self._write_pos % self.capacity
+        first = min(n, self.capacity - start)
+        self._ring[start:start + first] = samples[:first]
+        if first < n:
+            self._ring[:n - first] = samples[first:]
+
+        position = self._write_pos
+        with self._cond:
+            self._write_pos += n
+            self._cond.notify_all()
+
+        if self._listeners:
+            block = self._ring[start:start + n] if first == n else np.asarray(samples, dtype=np.int16)
+            for listener in self._listeners:
+                try:
+                    listener(block, position)
+                except Exception as e:
+                    print(f"[AudioBus] Listener error: {e}")
+
+    def views(self, position: int, count: int) -> List[np.ndarray]:
+        """Views of `count` samples starting at absolute `position`."""
+        start = position % self.capacity
+        first = min(count, self.capacity - start)
+        segments = [self._ring[start:start + first]]
+        if first < count:
+            segments.append(self._ring[:count - first])
+        return segments
+
+    def wait_for_data(self, position: int, timeout: float) -> bool:
+        """Block until samples beyond `position` exist (or timeout)."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._write_pos > position, timeout)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # SUBSCRIPTIONS
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def subscribe(self, position: Optional[int] = None) -> AudioReader:
+        """Create a reader. Defaults to "from now on"."""
+        reader = AudioReader(self, self._write_pos if position is None else position)
+        reader.seek(reader.position)
+        self._readers.append(reader)
+        return reader
+
+    def unsubscribe(self, reader: AudioReader):
+        if reader in self._readers:
+            self._readers.remove(reader)
+        # Wake a reader blocked in wait_for_data so it can notice it's closed
+        with self._cond:
+            self._cond.notify_all()
+
+    def add_listener(self, listener: Callable[[np.ndarray, int], None]):
+        """Run `listener(block, position)` inside the audio callback."""
+        if listener not in self._listeners:
+            self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener: Callable[[np.ndarray, int], None]):
+        self._listeners = [l for l in self._listeners if l is not listener]
+
+
+# Global singleton
+_audio_bus = None
+
+def get_audio_bus() -> AudioBus:
+    """Get the global audio bus instance."""
+    global _audio_bus
+    if _audio_bus is None:
+        _audio_bus = AudioBus()
+    return _audio_bus
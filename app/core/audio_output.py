@@ -0,0 +1,113 @@
+"""
+Audio Output - Interruptible PCM playback
+Steel OS v6.6
+
+Key Design:
+- Speech is played through a callback OutputStream in small blocks
+- One stream stays open across clips (reopened only when the sample rate
+  changes): each clip just starts it and lets the callback stop it
+- stop() is a flag the callback checks every block: silence within one
+  block (~6 ms at 22 kHz) plus the device's output latency
+- The cut is timestamped so barge-in latency can be measured and reported
+"""
+
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+try:
+    import sounddevice as sd
+except OSError:  # PortAudio missing (headless boxes)
+    sd = None
+
+BLOCK_FRAMES = 128      # Callback granularity (max time to notice stop())
+
+
+class PcmPlayer:
+    """Plays int16 mono clips; one at a time, cut on demand."""
+
+    def __init__(self, block_frames: int = BLOCK_FRAMES):
+        self.block_frames = block_frames
+        self._stop = threading.Event()
+        self._done = threading.Event()
+        self._done.set()
+        self._stop_requested = 0.0
+        self._stream = None
+        self._stream_rate = 0
+        self._samples = np.zeros(0, dtype=np.int16)
+        self._cursor = 0
+        self._cut = False
+        self.output_latency = 0.0       # Device latency of the open stream (s)
+        self.last_cut_ms: Optional[float] = None
+
+    @property
+    def available(self) -> bool:
+        return sd is not None
+
+    @property
+    def playing(self) -> bool:
+        return not self._done.is_set()
+
+    def play(self, samples: np.ndarray, sample_rate: int, on_start=None) -> bool:
+        """
+        Play a clip, blocking until it ends or stop() is called.
+        Returns True if it played to the end.
+        """
+        stream = self._open(sample_rate)
+        self._samples = samples
+        self._cursor = 0
+        self._cut = False
+        self._stop.clear()
+        self._done.clear()
+        try:
+            stream.start()
+            if on_start:
+                on_start()
+            self._done.wait()
+        finally:
+            self._done.set()
+            # Already inactive (CallbackStop); stop() just re-arms it for start()
+            stream.stop()
+        return not self._cut
+
+    def stop(self):
+        """Cut playback at the next block boundary (any thread)."""
+        if self._done.is_set():
+            return
+        self._stop_requested = time.perf_counter()
+        self._stop.set()
+
+    def close(self):
+        """Release the device (playback thread, when it's done)."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _open(self, sample_rate: int):
+        if self._stream is not None and self._stream_rate != sample_rate:
+            self.close()
+        if self._stream is None:
+            self._stream = sd.OutputStream(samplerate=sample_rate, channels=1, dtype="int16",
+                                           blocksize=self.block_frames, latency="low",
+                                           callback=self._callback,
+                                           finished_callback=self._done.set)
+            self._stream_rate = sample_rate
+            self.output_latency = self._stream.latency
+        return self._stream
+
+    def _callback(self, outdata, frames, time_info, status):
+        out = outdata[:, 0]
+        if self._stop.is_set():
+            out.fill(0)
+            self._cut = True
+            self.last_cut_ms = (time.perf_counter() - self._stop_requested) * 1000.0
+            raise sd.CallbackStop
+        start = self._cursor
+        chunk = self._samples[start:start + frames]
+        out[:len(chunk)] = chunk
+        if len(chunk) < frames:
+            out[len(chunk):] = 0
+            raise sd.CallbackStop
+        self._cursor = start + frames
@@ -0,0 +1,228 @@
+"""
+Command Matcher - Compiled phrase matching for CommandRouter
+Steel OS v6.6
+
+Key Design:
+- Phrases are compiled once into a token-level Aho-Corasick automaton
+- One left-to-right pass over the transcript finds every command in it
+- Ranked candidates with a confidence score, never dict-order dependent
+- Fuzzy fallback: unknown words snap to the nearest vocabulary word
+  (bounded edit distance, cached), then the automaton runs again
+- predict(): prefix-unique lookup on the trie, for speculating on partials
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TUNING
+# ═══════════════════════════════════════════════════════════════════════════
+MIN_SCORE = 0.75        # Candidates below this are dropped
+MIN_FUZZY_LEN = 3       # Shorter words must match exactly ("to", "ui")
+CACHE_LIMIT = 4096      # Remembered word -> vocabulary corrections
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _max_edits(word: str) -> int:
+    """Allowed typos/mishearings for a word of this length."""
+    if len(word) < MIN_FUZZY_LEN:
+        return 0
+    return 1 if len(word) < 6 else 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, giving up (limit + 1) once it exceeds `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        best = i
+        for j, cb in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            current.append(cost)
+            best = min(best, cost)
+        if best > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class CommandMatch(NamedTuple):
+    phrase: str
+    score: float        # 1.0 = exact, lower = fuzzy
+    start: int          # Token span in the transcript
+    end: int
+    exact: bool
+
+
+class CommandMatcher:
+    """Finds registered command phrases inside a transcript."""
+
+    def __init__(self, phrases: Iterable[str] = (), min_score: float = MIN_SCORE):
+        self.min_score = min_score
+        self._phrases: List[str] = []
+        self.compile(phrases)
+
+    # ─────────────────────────────────────────────────────────────
+    # BUILD
+    # ─────────────────────────────────────────────────────────────
+
+    def compile(self, phrases: Iterable[str]):
+        """(Re)build the automaton for `phrases`."""
+        self._phrases = list(dict.fromkeys(p.lower().strip() for p in phrases if p.strip()))
+
+        # Trie over word tokens: node -> {word: child}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._out: List[List[Tuple[str, int]]] = [[]]    # (phrase, token length)
+        self._below: List[set] = [set()]                  # Phrases reachable from a node
+        self._vocab = set()
+        for phrase in self._phrases:
+            words = tokenize(phrase)
+            node = 0
+            self._below[0].add(phrase)
+            for word in words:
+                self._vocab.add(word)
+                child = self._goto[node].get(word)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][word] = child
+                    self._goto.append({})
+                    self._out.append([])
+                    self._below.append(set())
+                node = child
+                self._below[node].add(phrase)
+            self._out[node].append((phrase, len(words)))
+
+        # Failure links (BFS), outputs inherited along them
+        self._fail = [0] * len(self._goto)
+        frontier = list(self._goto[0].values())
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for word, child in self._goto[node].items():
+                    fallback = self._fail[node]
+                    while fallback and word not in self._goto[fallback]:
+                        fallback = self._fail[fallback]
+                    target = self._goto[fallback].get(word, 0)
+                    self._fail[child] = target if target != child else 0
+                    self._out[child] = self._out[child] + self._out[self._fail[child]]
+                    next_frontier.append(child)
+            frontier = next_frontier
+
+        # Vocabulary bucketed by length for the fuzzy fallback
+        self._by_length: Dict[int, List[str]] = {}
+        for word in self._vocab:
+            self._by_length.setdefault(len(word), []).append(word)
+        self._corrections: Dict[str, Optional[Tuple[str, float]]] = {}
+
+    @property
+    def phrases(self) -> List[str]:
+        return list(self._phrases)
+
+    # ─────────────────────────────────────────────────────────────
+    # MATCH
+    # ─────────────────────────────────────────────────────────────
+
+    def match(self, text: str, limit: int = 5) -> List[CommandMatch]:
+        """Ranked candidates (best first) for `text`."""
+        tokens = tokenize(text)
+        if not tokens:
+            return []
+
+        candidates = self._scan(tokens, None)
+        if not candidates:
+            candidates = self._fuzzy(tokens)
+
+        # Best score, then longest phrase (most specific), then earliest
+        candidates.sort(key=lambda m: (-m.score, -(m.end - m.start), m.start))
+        return candidates[:limit]
+
+    def best(self, text: str) -> Optional[CommandMatch]:
+        found = self.match(text, limit=1)
+        return found[0] if found else None
+
+    def predict(self, text: str) -> Optional[str]:
+        """
+        The one phrase `text` can still become, if unique ("restart" ->
+        "restart assistant"). Exact tokens only, anchored at the start.
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return None
+        node = 0
+        for word in tokens:
+            node = self._goto[node].get(word)
+            if node is None:
+                return None
+        below = self._below[node]
+        return next(iter(below)) if len(below) == 1 else None
+
+    def _scan(self, tokens: List[str], similarity: Optional[List[float]]) -> List[CommandMatch]:
+        """One Aho-Corasick pass; `similarity` weights fuzzy-corrected tokens."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = {}
+        node = 0
+        for i, word in enumerate(tokens):
+            while node and word not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(word, 0)
+            for phrase, length in out[node]:
+                start = i - length + 1
+                if similarity is None:
+                    score = 1.0
+                else:
+                    score = sum(similarity[start:i + 1]) / length
+                if score >= self.min_score and score > found.get(phrase, (0.0,))[0]:
+                    found[phrase] = (score, start, i + 1)
+        return [CommandMatch(p, round(s, 3), a, b, similarity is None)
+                for p, (s, a, b) in found.items()]
+
+    def _fuzzy(self, tokens: List[str]) -> List[CommandMatch]:
+        corrected = []
+        similarity = []
+        changed = False
+        for word in tokens:
+            if word in self._vocab:
+                corrected.append(word)
+                similarity.append(1.0)
+                continue
+            hit = self._correct(word)
+            if hit is None:
+                corrected.append(word)
+                similarity.append(0.0)
+            else:
+                corrected.append(hit[0])
+                similarity.append(hit[1])
+                changed = True
+        if not changed:
+            return []
+        return self._scan(corrected, similarity)
+
+    def _correct(self, word: str) -> Optional[Tuple[str, float]]:
+        """Nearest vocabulary word within the edit budget (cached)."""
+        if word in self._corrections:
+            return self._corrections[word]
+        limit = _max_edits(word)
+        best = None
+        best_distance = limit + 1
+        if limit:
+            for length in range(len(word) - limit, len(word) + limit + 1):
+                for candidate in self._by_length.get(length, ()):
+                    if len(candidate) < MIN_FUZZY_LEN:
+                        continue
+                    distance = edit_distance(word, candidate, min(limit, best_distance - 1))
+                    if distance < best_distance:
+                        best, best_distance = candidate, distance
+        result = None
+        if best is not None:
+            result = (best, 1.0 - best_distance / max(len(word), len(best)))
+        if len(self._corrections) >= CACHE_LIMIT:
+            self._corrections.clear()
+        self._corrections[word] = result
+        return result
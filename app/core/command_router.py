@@ -13,14 +13,18 @@ Rules:
 """
 
 import os
-import subprocess
 import sys
 import time
-from typing import Callable, Optional, List
+from typing import Callable, Optional, List, Union
 
-from .tts_engine import speak as tts_speak, interrupt_speech
+from .tts_engine import speak as tts_speak, interrupt_speech, prewarm as tts_prewarm
 from .speech_recognizer import SpeechRecognizer, CONVERSATION_EXIT
 from .memory import get_memory
+from .command_matcher import CommandMatch, CommandMatcher
+from .action_scheduler import ActionScheduler
+from .action_executor import ActionExecutor, ActionSpec, run_process
+from .latency_trace import get_latency_tracer
+from .log_sink import get_log_sink
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CONSTANTS
@@ -28,6 +32,17 @@ from .memory import get_memory
 PAUSE_BEFORE_SPEAK = 0.25
 PAUSE_AFTER_SPEAK = 0.30
 
+# Fixed response vocabulary (pre-rendered by the TTS cache)
+THEME_NAMES = ["bmw", "audi", "bentley"]
+FIXED_RESPONSES = [
+    "Done.", "Command not recognized.", "Reloading.", "Restarting.",
+    "Opening logs.", "Repeating.", "Nothing to repeat.", "I'm listening.",
+    "Alright.", "I understand.", "I'm not sure yet.",
+] + [f"{name.upper()}." for name in THEME_NAMES] + [f"{name.upper()} again." for name in THEME_NAMES]
+
+# Worker-pool actions
+OPEN_LOGS_TIMEOUT = 10.0
+
 # Hard interrupts
 INTERRUPTS = ["stop", "cancel", "never mind", "shut up"]
 
@@ -100,34 +115,132 @@ class CommandRouter:
         self._initiative_offered = False
         self._pending_suggestion_action = None  # Callable if waiting for confirmation
         
-        # Command map
+        # Command map (every action goes through the executor per its spec)
         self.command_actions = {
-            "switch to bmw": lambda: self._set_theme("bmw"),
-            "switch to audi": lambda: self._set_theme("audi"),
-            "switch to bentley": lambda: self._set_theme("bentley"),
-            "reload ui": self._reload_ui,
-            "restart assistant": self._restart_assistant,
-            "open logs": self._open_logs,
-            "repeat that": self._repeat_last,
-            "help": self._show_help,
+            "switch to bmw": ActionSpec(lambda: self._set_theme("bmw")),
+            "switch to audi": ActionSpec(lambda: self._set_theme("audi")),
+            "switch to bentley": ActionSpec(lambda: self._set_theme("bentley")),
+            "reload ui": ActionSpec(self._reload_ui),
+            "restart assistant": ActionSpec(self._restart_assistant),
+            "open logs": ActionSpec(self._open_logs_worker, blocking=True,
+                                    timeout=OPEN_LOGS_TIMEOUT, announce="Opening logs."),
+            "repeat that": ActionSpec(self._repeat_last),
+            "help": ActionSpec(self._show_help),
         }
+        self.matcher = CommandMatcher(self.command_actions)
+        tts_prewarm(FIXED_RESPONSES)
+        
+        # Speculation: replies to render first when a partial predicts the command
+        self.command_replies = {
+            "reload ui": ["Reloading."],
+            "restart assistant": ["Restarting."],
+            "open logs": ["Opening logs."],
+            "repeat that": ["Repeating.", "Nothing to repeat."],
+        }
+        for name in THEME_NAMES:
+            self.command_replies[f"switch to {name}"] = [f"{name.upper()}.", f"{name.upper()} again."]
+        self._speculations = set()  # Commands pre-warmed for the current utterance
+        
+        # Speech/action pipeline (timed, never sleeps on the GUI thread)
+        self.scheduler = ActionScheduler()
+        self._batch = None  # Confirmations collected during a compound command
+        
+        # Slow actions (processes, files, network) run off the GUI thread
+        self.executor = ActionExecutor()
+        self.executor.actionFinished.connect(self._on_action_finished)
     
     @property
     def mode(self) -> str:
         return self._mode
     
+    def register_command(self, phrase: str, action: Union[ActionSpec, Callable]):
+        """Add (or replace) a command and recompile the matcher.
+
+        A bare callable is a non-blocking action.
+        """
+        if not isinstance(action, ActionSpec):
+            action = ActionSpec(action)
+        self.command_actions[phrase] = action
+        self.matcher.compile(self.command_actions)
+    
+    def _match(self, text: str) -> Optional[CommandMatch]:
+        """Best command in `text` that still has an action."""
+        match = self.matcher.best(text)
+        if match is None or match.phrase not in self.command_actions:
+            return None
+        return match
+    
+    def _dispatch(self, match: CommandMatch):
+        """Record the match and queue its action."""
+        get_latency_tracer().mark("router_match", command=match.phrase)
+        self.app_state.set_intent(match.phrase, match.score)
+        if match.phrase != "repeat that":
+            self.memory["last_command"] = match.phrase
+        self.scheduler.call(self._run_action, match.phrase)
+    
+    def _run_action(self, phrase: str):
+        """Hand a command's action to the executor (inline or pooled, per its spec)."""
+        spec = self.command_actions[phrase]
+        if spec.announce:
+            self.speak_intent(spec.announce)
+        self.executor.submit(phrase, spec.fn, blocking=spec.blocking, timeout=spec.timeout)
+    
+    # ═══════════════════════════════════════════════════════════════════════════
+    # SPECULATION (partial transcripts, COMMAND mode)
+    # ═══════════════════════════════════════════════════════════════════════════
+    
+    def speculate(self, text: str):
+        """
+        Partial transcript: pre-warm every command it can only become.
+        Nothing visible happens here - the command itself (e.g. a theme
+        switch) only runs once the final result confirms it.
+        """
+        if self._mode != self.MODE_COMMAND or self._pending_suggestion_action or is_interrupt(text):
+            self.clear_speculation()
+            return
+        predicted = {self.matcher.predict(part) for part in split_commands(text.lower())}
+        predicted = {phrase for phrase in predicted if phrase in self.command_actions}
+        for phrase in predicted - self._speculations:
+            get_latency_tracer().mark("speculated", command=phrase)
+            print(f"[CommandRouter] Speculating: {phrase}")
+            tts_prewarm(self.command_replies.get(phrase, ()), urgent=True)
+        self._speculations = predicted
+    
+    def clear_speculation(self):
+        """Utterance over (routed, cancelled or dropped): start fresh next time."""
+        self._speculations = set()
+    
     # ═══════════════════════════════════════════════════════════════════════════
     # SPEAK INTENT
     # ═══════════════════════════════════════════════════════════════════════════
     
     def speak_intent(self, text: str):
-        """Deliberate speaking with timing discipline."""
+        """Deliberate speaking with timing discipline (scheduled, non-blocking)."""
+        if self._batch is not None:
+            self._batch.append(text)
+            return
+        self.scheduler.call(self._announce, text)
+        self.scheduler.pause(PAUSE_BEFORE_SPEAK)
+        self.scheduler.call(self._speak_now, text)
+        self.scheduler.pause(PAUSE_AFTER_SPEAK)
+    
+    def _announce(self, text: str):
         self.app_state.set_transcript(text)
         print(f"[SPEAK] {text}")
         self.app_state.log(f"[SPEAK] {text}")
-        time.sleep(PAUSE_BEFORE_SPEAK)
+    
+    def _speak_now(self, text: str):
+        get_latency_tracer().mark("tts_enqueue")
         tts_speak(text)
-        time.sleep(PAUSE_AFTER_SPEAK)
+    
+    def _begin_batch(self):
+        self._batch = []
+    
+    def _end_batch(self):
+        """Speak every confirmation collected by a compound command at once."""
+        texts, self._batch = self._batch or [], None
+        get_latency_tracer().mark("action_done")
+        self.speak_intent(" ".join(texts) if texts else "Done.")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # MAIN ENTRY POINT
@@ -135,6 +248,11 @@ class CommandRouter:
     
     def handle_command(self, text: str) -> bool:
         """Handle incoming text based on current mode."""
+        handled = self._route(text)
+        self.clear_speculation()
+        return handled
+    
+    def _route(self, text: str) -> bool:
         # Update activity tracker
         self._last_user_activity = time.time()
         
@@ -176,6 +294,9 @@ class CommandRouter:
     def _handle_interrupt(self):
         """Handle hard interrupt."""
         print("[CommandRouter] INTERRUPT")
+        self.scheduler.cancel()
+        self.executor.cancel_all()
+        self._batch = None
         interrupt_speech()
         self.app_state.set_transcript("")
         
@@ -250,32 +371,25 @@ class CommandRouter:
     
     def _handle_compound(self, parts: List[str]) -> bool:
         """Handle compound command."""
-        matched_any = False
-        
-        for part in parts:
-            for phrase, action in self.command_actions.items():
-                if phrase in part:
-                    if phrase != "repeat that":
-                        self.memory["last_command"] = phrase
-                    action()
-                    matched_any = True
-                    break
-        
-        if matched_any:
-            self.speak_intent("Done.")
-        else:
+        matches = [m for m in (self._match(part) for part in parts) if m]
+        if not matches:
             self.speak_intent("Command not recognized.")
+            return False
         
-        return matched_any
+        # One pipeline: every action, then a single batched confirmation
+        self.scheduler.call(self._begin_batch)
+        for match in matches:
+            self._dispatch(match)
+        self.scheduler.call(self._end_batch)
+        return True
     
     def _handle_single(self, text: str) -> bool:
         """Handle single command."""
-        for phrase, action in self.command_actions.items():
-            if phrase in text:
-                if phrase != "repeat that":
-                    self.memory["last_command"] = phrase
-                action()
-                return True
+        match = self._match(text)
+        if match:
+            self._dispatch(match)
+            self.scheduler.call(get_latency_tracer().mark, "action_done")
+            return True
         
         self.speak_intent("Command not recognized.")
         return False
@@ -402,26 +516,34 @@ class CommandRouter:
         self.speak_intent("Restarting.")
         self.app_state.set_state("IDLE")
     
-    def _open_logs(self):
-        self.speak_intent("Opening logs.")
-        logs_path = os.path.join(os.path.dirname(__file__), "..", "logs.txt")
-        logs_path = os.path.abspath(logs_path)
-        
-        try:
-            if sys.platform == "win32":
-                os.startfile(logs_path)
-            elif sys.platform == "darwin":
-                subprocess.run(["open", logs_path])
-            else:
-                subprocess.run(["xdg-open", logs_path])
-        except Exception as e:
-            print(f"[CommandRouter] Failed to open logs: {e}")
+    @staticmethod
+    def _open_logs_worker(cancel):
+        """Worker thread: flush the log and hand it to the system viewer."""
+        # Buffered writer: push pending lines out before the viewer reads the file
+        sink = get_log_sink()
+        sink.flush()
+        logs_path = sink.path
+        
+        if sys.platform == "win32":
+            os.startfile(logs_path)
+        elif sys.platform == "darwin":
+            run_process(["open", logs_path], cancel)
+        else:
+            run_process(["xdg-open", logs_path], cancel)
+    
+    def _on_action_finished(self, job_id: int, name: str, ok: bool, message: str):
+        """Worker results (delivered on the GUI thread)."""
+        if ok:
+            self.app_state.log(f"Action finished: {name}", "DEBUG")
+        else:
+            print(f"[CommandRouter] Action '{name}' failed: {message}")
+            self.app_state.log(f"Action failed: {name} ({message})", "WARN")
     
     def _repeat_last(self):
         last = self.memory.get("last_command")
         if last and last in self.command_actions:
             self.speak_intent("Repeating.")
-            self.command_actions[last]()
+            self._run_action(last)
         else:
             self.speak_intent("Nothing to repeat.")
     
@@ -0,0 +1,368 @@
+"""
+Decoder Process - Out-of-process Vosk decoding
+Steel OS v6.6
+
+Key Design:
+- Kaldi decoding runs in a child process, away from the Qt event loop
+- Audio goes parent -> child through a shared-memory int16 ring
+- Control messages and results travel over a Pipe
+- Grammar swaps wait for the end of a live COMMAND utterance and fall
+  back to a rebuild on Vosk builds without SetGrammar, like RecognizerPool
+- The child is restarted automatically if it dies, with exponential
+  backoff; after MAX_RESTARTS failures in a row the decoder gives up
+- shutdown() (also run at exit) stops the child and unlinks the ring
+"""
+
+import atexit
+import json
+import multiprocessing as mp
+import threading
+from multiprocessing import shared_memory
+from typing import Callable, Optional
+
+import numpy as np
+
+HEADER_BYTES = 8        # int64 write position
+CHUNK_SAMPLES = 1600    # 100 ms per AcceptWaveform call
+READY_TIMEOUT = 60.0    # Model load in the child
+STOP_TIMEOUT = 1.0      # Waiting for the final result
+RESTART_DELAY = 0.5     # First respawn delay, doubled per failure in a row...
+RESTART_DELAY_MAX = 30.0
+MAX_RESTARTS = 5        # ...until this many failures without a "ready"
+
+
+def _attach_ring(shm: shared_memory.SharedMemory, capacity: int):
+    """Header and ring views over the shared block."""
+    header = np.ndarray((1,), dtype=np.int64, buffer=shm.buf, offset=0)
+    ring = np.ndarray((capacity,), dtype=np.int16, buffer=shm.buf, offset=HEADER_BYTES)
+    return header, ring
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CHILD PROCESS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _decoder_main(shm_name: str, capacity: int, conn, model_path: str,
+                  sample_rate: int, grammar: str, mode: str, endpointer_delays):
+    """Child entry point: load the model, then decode on request."""
+    from vosk import Model, KaldiRecognizer
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    header, ring = _attach_ring(shm, capacity)
+
+    def build(build_mode):
+        if build_mode == "COMMAND":
+            recognizer = KaldiRecognizer(model, sample_rate, grammar)
+        else:
+            recognizer = KaldiRecognizer(model, sample_rate)
+        recognizer.SetWords(True)
+        if hasattr(recognizer, "SetEndpointerDelays"):
+            recognizer.SetEndpointerDelays(*endpointer_delays)
+        return recognizer
+
+    try:
+        model = Model(model_path)
+        recognizers = {"COMMAND": build("COMMAND"), "CONVERSATION": build("CONVERSATION")}
+    except Exception as e:
+        conn.send(("error", str(e)))
+        return
+    conn.send(("ready", None))
+
+    active = False
+    position = 0
+    last_partial = ""
+    recognizer = recognizers[mode]
+    grammar_pending = False     # Like RecognizerPool: held back during a command
+
+    def apply_grammar():
+        """Swap in a pending grammar, without rebuilding when Vosk allows it."""
+        nonlocal grammar_pending, recognizer
+        if not grammar_pending:
+            return
+        grammar_pending = False
+        command = recognizers["COMMAND"]
+        if hasattr(command, "SetGrammar"):
+            command.SetGrammar(grammar)
+            command.Reset()
+        else:
+            recognizers["COMMAND"] = build("COMMAND")
+        recognizer = recognizers[mode]
+
+    def decode_until(end):
+        nonlocal position, last_partial
+        while position < end:
+            count = min(CHUNK_SAMPLES, end - position)
+            start = position % capacity
+            first = min(count, capacity - start)
+            data = ring[start:start + first].tobytes()
+            if first < count:
+                data += ring[:count - first].tobytes()
+            position += count
+
+            if recognizer.AcceptWaveform(data):
+                text = json.loads(recognizer.Result()).get("text", "")
+                if text:
+                    conn.send(("final", text))
+                last_partial = ""
+            else:
+                text = json.loads(recognizer.PartialResult()).get("partial", "")
+                if text and text != last_partial:
+                    last_partial = text
+                    conn.send(("partial", text))
+
+    try:
+        while True:
+            if conn.poll(0.02 if active else 0.2):
+                command, arg = conn.recv()
+                if command == "start":
+                    apply_grammar()
+                    recognizer = recognizers[mode]
+                    recognizer.Reset()
+                    position = arg
+                    last_partial = ""
+                    active = True
+                elif command == "stop":
+                    decode_until(arg)
+                    text = json.loads(recognizer.FinalResult()).get("text", "")
+                    conn.send(("stopped", text))
+                    active = False
+                    apply_grammar()
+                elif command == "mode":
+                    mode = arg
+                    apply_grammar()
+                    recognizer = recognizers[mode]
+                    recognizer.Reset()
+                elif command == "grammar":
+                    grammar = arg
+                    grammar_pending = True
+                    # Mid-command the swap would drop the utterance: wait for stop/mode
+                    if not (active and mode == "COMMAND"):
+                        apply_grammar()
+                elif command == "quit":
+                    break
+            if active:
+                write_pos = int(header[0])
+                # Lapped by the writer: skip to the oldest valid sample
+                position = max(position, write_pos - capacity)
+                decode_until(write_pos)
+    except (EOFError, BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        del header, ring
+        shm.close()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PARENT SIDE
+# ═══════════════════════════════════════════════════════════════════════════
+
+class ProcessDecoder:
+    """
+    Parent handle for the decoder child.
+    `on_result(kind, raw_text)` is called from a reader thread with
+    kind in {"partial", "final"}.
+    """
+
+    def __init__(self, model_path: str, sample_rate: int, grammar: str,
+                 on_result: Callable[[str, str], None],
+                 mode: str = "COMMAND",
+                 endpointer_delays=(5.0, 0.25, 10.0),
+                 ring_seconds: float = 5.0):
+        self.model_path = model_path
+        self.sample_rate = sample_rate
+        self.on_result = on_result
+        self.endpointer_delays = endpointer_delays
+        self._grammar = grammar
+        self._mode = mode
+
+        self.capacity = int(sample_rate * ring_seconds)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=HEADER_BYTES + self.capacity * 2
+        )
+        self._header, self._ring = _attach_ring(self._shm, self.capacity)
+        self._header[0] = 0
+
+        self._ctx = mp.get_context("spawn")
+        self._process = None
+        self._conn = None
+        self._send_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._final_text = ""
+        self._session_active = False
+        self._closing = False
+        self._closed = threading.Event()  # Set by shutdown(); wakes a backoff wait
+        self.restarts = 0
+        self.failures = 0   # Restarts since the child last reported ready
+        self.failed = False # Gave up after MAX_RESTARTS
+        self._reader_thread: Optional[threading.Thread] = None
+
+    # ─────────────────────────────────────────────────────────────
+    # LIFECYCLE
+    # ─────────────────────────────────────────────────────────────
+
+    def start(self, timeout: float = READY_TIMEOUT):
+        """Spawn the child and block until its model is loaded."""
+        atexit.register(self.shutdown)
+        try:
+            self._spawn()
+        except Exception:
+            self.shutdown()
+            raise
+        self._reader_thread = threading.Thread(target=self._read_results, daemon=True, name="steel-decoder-reader")
+        self._reader_thread.start()
+        if not self._ready.wait(timeout) or self._process is None:
+            self.shutdown()
+            raise RuntimeError("Decoder process failed to load the model")
+
+    def _spawn(self):
+        self._ready.clear()
+        parent_conn, child_conn = self._ctx.Pipe()
+        self._process = self._ctx.Process(
+            target=_decoder_main,
+            args=(self._shm.name, self.capacity, child_conn, self.model_path,
+                  self.sample_rate, self._grammar, self._mode, self.endpointer_delays),
+            daemon=True,
+            name="steel-decoder"
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+        print(f"[ProcessDecoder] Decoder process started (pid {self._process.pid})")
+
+    def _restart(self):
+        """Child died: respawn after a backoff and resume any open session (reader thread)."""
+        try:
+            self._conn.close()
+        except OSError:
+            pass
+        while not self._closing:
+            self.failures += 1
+            if self.failures > MAX_RESTARTS:
+                self._give_up(f"{MAX_RESTARTS} restarts without a ready child")
+                return
+            delay = min(RESTART_DELAY * 2 ** (self.failures - 1), RESTART_DELAY_MAX)
+            print(f"[ProcessDecoder] Decoder process died - restarting in {delay:.1f} s "
+                  f"(#{self.restarts + 1}, {self.failures}/{MAX_RESTARTS})")
+            if self._closed.wait(delay):
+                return
+            self.restarts += 1
+            try:
+                self._spawn()
+                return
+            except Exception as e:
+                print(f"[ProcessDecoder] Respawn failed: {e}")
+
+    def _give_up(self, reason: str):
+        """Stop restarting; the session reports empty results from now on."""
+        print(f"[ProcessDecoder] Giving up: {reason}")
+        self.failed = True
+        self._closing = True
+        self._process = None
+        self._ready.set()
+        self._stopped.set()
+
+    def shutdown(self):
+        """Stop the child and free the shared ring (idempotent)."""
+        if self._closed.is_set():
+            return
+        self._closing = True
+        self._closed.set()
+        if self._conn is not None:
+            self._send("quit")
+        if self._process:
+            self._process.join(timeout=1.0)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+        if self._conn is not None:
+            try:
+                self._conn.close()  # Unblocks the reader thread
+            except OSError:
+                pass
+        # Views must go before the block can be closed
+        self._header = self._ring = None
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        atexit.unregister(self.shutdown)
+
+    # ─────────────────────────────────────────────────────────────
+    # RESULTS
+    # ─────────────────────────────────────────────────────────────
+
+    def _read_results(self):
+        while not self._closing:
+            try:
+                kind, text = self._conn.recv()
+            except (EOFError, OSError):
+                if self._closing:
+                    break
+                self._restart()
+                continue
+
+            if kind == "ready":
+                self.failures = 0
+                self._ready.set()
+                if self._session_active:
+                    self._send("start", int(self._header[0]))
+            elif kind == "error":
+                self._give_up(f"child failed: {text}")
+            elif kind == "stopped":
+                self._final_text = text
+                self._stopped.set()
+            else:
+                try:
+                    self.on_result(kind, text)
+                except Exception as e:
+                    print(f"[ProcessDecoder] Result callback error: {e}")
+
+    def _send(self, command: str, arg=None):
+        with self._send_lock:
+            try:
+                self._conn.send((command, arg))
+            except (OSError, ValueError):
+                pass  # Child is gone; the reader thread restarts it
+
+    # ─────────────────────────────────────────────────────────────
+    # AUDIO + SESSION CONTROL
+    # ─────────────────────────────────────────────────────────────
+
+    def write(self, samples: np.ndarray):
+        """Copy int16 samples into the shared ring (single writer)."""
+        n = len(samples)
+        position = int(self._header[0])
+        start = position % self.capacity
+        first = min(n, self.capacity - start)
+        self._ring[start:start + first] = samples[:first]
+        if first < n:
+            self._ring[:n - first] = samples[first:]
+        self._header[0] = position + n
+
+    def begin(self):
+        """Start decoding audio written from now on."""
+        if self.failed:
+            return
+        self._session_active = True
+        self._send("start", int(self._header[0]))
+
+    def end(self, timeout: float = STOP_TIMEOUT) -> str:
+        """Finish the session; returns the raw final text."""
+        if self.failed:
+            return ""
+        self._session_active = False
+        self._stopped.clear()
+        self._final_text = ""
+        self._send("stop", int(self._header[0]))
+        self._stopped.wait(timeout)
+        return self._final_text
+
+    def set_mode(self, mode: str):
+        self._mode = mode
+        self._send("mode", mode)
+
+    def set_grammar(self, grammar: str):
+        self._grammar = grammar
+        self._send("grammar", grammar)
@@ -0,0 +1,69 @@
+"""
+Echo Gate - Half-duplex guard against hearing our own voice
+Steel OS v6.6
+
+Key Design:
+- TTS reports playback start/stop; the gate stays closed for a decay tail
+  afterwards (room reverb, driver buffers)
+- While closed: the VAD needs a much larger margin over the noise floor
+  and stops learning the floor from speaker output
+- Voice segments that begin while closed never auto-trigger listening
+- Counters record what was suppressed (for tuning)
+"""
+
+import threading
+import time
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TUNING
+# ═══════════════════════════════════════════════════════════════════════════
+TAIL_SECONDS = 0.35     # Gate stays closed this long after playback ends
+ONSET_BOOST_DB = 12.0   # Extra VAD onset margin while closed
+
+
+class EchoGate:
+    """Knows when the assistant is (or just was) audible."""
+
+    def __init__(self, tail_seconds: float = TAIL_SECONDS,
+                 onset_boost_db: float = ONSET_BOOST_DB):
+        self.tail_seconds = tail_seconds
+        self.onset_boost_db = onset_boost_db
+        self._lock = threading.Lock()
+        self._playing = 0
+        self._open_at = 0.0
+
+        # Counters
+        self.playbacks = 0
+        self.suppressed_triggers = 0    # Voice segments that began while closed
+        self.gated_frames = 0           # VAD frames that only passed the normal margin
+
+    def playback_started(self):
+        """TTS audio is about to play (any thread)."""
+        with self._lock:
+            self._playing += 1
+            self.playbacks += 1
+
+    def playback_stopped(self):
+        """TTS audio finished or was cut (any thread)."""
+        with self._lock:
+            self._playing = max(0, self._playing - 1)
+            self._open_at = time.monotonic() + self.tail_seconds
+
+    @property
+    def active(self) -> bool:
+        """True while playing or within the decay tail."""
+        return self._playing > 0 or time.monotonic() < self._open_at
+
+    def note_suppressed_trigger(self):
+        self.suppressed_triggers += 1
+
+
+# Global singleton
+_echo_gate = None
+
+def get_echo_gate() -> EchoGate:
+    """Get the global echo gate instance."""
+    global _echo_gate
+    if _echo_gate is None:
+        _echo_gate = EchoGate()
+    return _echo_gate
@@ -0,0 +1,138 @@
+"""
+Keyword Spotter - Always-on small-grammar recognizer
+Steel OS v6.6
+
+Key Design:
+- A tiny grammar (a handful of keywords + [unk]) on the shared Vosk model
+- Reads the AudioBus in 50 ms chunks on its own thread
+- Fires on the first partial that contains a keyword (no endpoint wait)
+- One detection per arm: re-arm() after handling it
+- Optional `active_when` gate (e.g. the VAD): while it's False nothing is
+  decoded, only a short lookback is kept ready for when it opens
+- Used for barge-in while speaking and for the wake word while idle
+"""
+
+import json
+import threading
+import time
+from typing import Callable, List, Optional
+
+from vosk import KaldiRecognizer
+
+from .audio_bus import AudioBus, AudioReader
+
+CHUNK_SAMPLES = 800     # 50 ms per AcceptWaveform call
+LOOKBACK_SECONDS = 0.4  # Audio decoded from before the gate opened
+IDLE_POLL = 0.02        # Gate checks while closed
+
+
+class KeywordSpotter:
+    """
+    Calls `on_keyword(keyword, position)` from its thread when a keyword is
+    heard; `position` is the bus position of the chunk that completed it.
+    """
+
+    def __init__(self, model, keywords: List[str],
+                 on_keyword: Callable[[str, int], None],
+                 audio_bus: AudioBus,
+                 active_when: Optional[Callable[[], bool]] = None):
+        self.keywords = [k.lower() for k in keywords]
+        self.on_keyword = on_keyword
+        self.active_when = active_when
+        self._bus = audio_bus
+        self._lookback = int(LOOKBACK_SECONDS * audio_bus.sample_rate)
+        self._recognizer = KaldiRecognizer(
+            model, audio_bus.sample_rate, json.dumps(self.keywords + ["[unk]"])
+        )
+
+        self._running = False
+        self._armed = True
+        self._rearm = False
+        self._gated = False
+        self._reader: Optional[AudioReader] = None
+        self._thread: Optional[threading.Thread] = None
+        self.detections = 0
+        self.decoded_samples = 0  # CPU proxy: audio actually fed to Kaldi
+
+    # ─────────────────────────────────────────────────────────────
+    # CONTROL
+    # ─────────────────────────────────────────────────────────────
+
+    def start(self, position: Optional[int] = None):
+        """Spot keywords in audio from `position` (default: now)."""
+        if self._running:
+            return
+        self._running = True
+        self._armed = True
+        self._rearm = False
+        self._recognizer.Reset()
+        self._reader = self._bus.subscribe(position=position)
+        self._thread = threading.Thread(target=self._run, daemon=True, name="steel-kws")
+        self._thread.start()
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        if self._reader:
+            self._reader.close()
+        self._reader = None
+
+    def rearm(self):
+        """Listen for the next keyword (applied on the spotter thread)."""
+        self._rearm = True
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    # ─────────────────────────────────────────────────────────────
+    # DECODING
+    # ─────────────────────────────────────────────────────────────
+
+    def _run(self):
+        reader = self._reader
+        while self._running:
+            if self._rearm:
+                self._rearm = False
+                self._recognizer.Reset()
+                self._armed = True
+            if self.active_when is not None and not self.active_when():
+                # Gate closed: skip decoding, keep only a short lookback
+                if not self._gated:
+                    self._gated = True
+                    self._recognizer.Reset()
+                reader.seek(self._bus.write_position - self._lookback)
+                time.sleep(IDLE_POLL)
+                continue
+            self._gated = False
+            for segment in reader.read(max_samples=CHUNK_SAMPLES, timeout=0.1):
+                if self._running and self._armed:
+                    self.decoded_samples += len(segment)
+                    self._accept(segment.tobytes(), reader.position)
+
+    def _accept(self, data: bytes, position: int):
+        if self._recognizer.AcceptWaveform(data):
+            text = json.loads(self._recognizer.Result()).get("text", "")
+        else:
+            text = json.loads(self._recognizer.PartialResult()).get("partial", "")
+        keyword = self._find(text)
+        if keyword is None:
+            return
+        self._armed = False
+        self.detections += 1
+        try:
+            self.on_keyword(keyword, position)
+        except Exception as e:
+            print(f"[KeywordSpotter] Callback error: {e}")
+
+    def _find(self, text: str) -> Optional[str]:
+        if not text:
+            return None
+        padded = f" {text} "
+        for keyword in self.keywords:
+            if f" {keyword} " in padded:
+                return keyword
+        return None
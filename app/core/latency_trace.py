@@ -0,0 +1,132 @@
+"""
+Latency Trace - Per-utterance timeline instrumentation
+Steel OS v6.6
+
+Key Design:
+- One timeline per interaction: trigger -> ... -> back to IDLE
+- Monotonic timestamps, stored as ms since the trigger
+- First occurrence of each event wins (repeats are ignored)
+- Thread-safe: recognizer, TTS and Qt threads all mark events
+- Finished timelines kept in memory (last N) and appended to a JSONL file
+  under data/ through a LogSink: the writer thread does the disk I/O and
+  rotates it like the session log
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, List, Optional
+
+from .log_sink import LogSink
+
+TRACE_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "latency.jsonl")
+TRACE_MAX_BYTES = 512 * 1024
+TRACE_BACKUPS = 2
+HISTORY = 20
+
+# Canonical event order (for display; unknown events are still kept)
+EVENTS = [
+    "vad_trigger",
+    "recognizer_start",
+    "first_partial",
+    "speculated",
+    "final_result",
+    "processing",
+    "router_match",
+    "action_done",
+    "tts_enqueue",
+    "tts_audible",
+    "barge_in",
+    "tts_silenced",
+    "idle",
+]
+
+
+class LatencyTracer:
+    """Collects event timelines for each voice interaction."""
+
+    def __init__(self, history: int = HISTORY, path: Optional[str] = None):
+        """`path` defaults to TRACE_FILE, resolved when the first timeline is written."""
+        self.path = path
+        self._sink: Optional[LogSink] = None
+        self._history = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._current = None
+        self._start = 0.0
+        self._listeners: List[Callable[[dict], None]] = []
+
+    def begin(self, trigger: str = "vad_trigger", **info):
+        """Open a new timeline (an unfinished one is closed as aborted)."""
+        with self._lock:
+            if self._current is not None:
+                self._finish_locked("aborted")
+            self._start = time.monotonic()
+            self._current = {
+                "started": time.time(),
+                "trigger": trigger,
+                "events": {trigger: 0.0},
+                "info": dict(info),
+            }
+
+    def mark(self, event: str, **info):
+        """Record `event` on the open timeline (first occurrence only)."""
+        now = time.monotonic()
+        with self._lock:
+            if self._current is None or event in self._current["events"]:
+                return
+            self._current["events"][event] = round((now - self._start) * 1000.0, 2)
+            if info:
+                self._current["info"].update(info)
+
+    def end(self, event: str = "idle"):
+        """Close the open timeline and publish it."""
+        with self._lock:
+            if self._current is None:
+                return
+            timeline = self._finish_locked(event)
+        self._write(timeline)
+        for listener in self._listeners:
+            try:
+                listener(timeline)
+            except Exception as e:
+                print(f"[LatencyTracer] Listener error: {e}")
+
+    def _finish_locked(self, event: str) -> dict:
+        timeline = self._current
+        timeline["events"][event] = round((time.monotonic() - self._start) * 1000.0, 2)
+        timeline["total_ms"] = timeline["events"][event]
+        self._current = None
+        self._history.append(timeline)
+        return timeline
+
+    def _write(self, timeline: dict):
+        """Hand the line to the sink's writer thread (called on the GUI thread)."""
+        if self._sink is None:
+            self._sink = LogSink(self.path or TRACE_FILE, max_bytes=TRACE_MAX_BYTES,
+                                 backups=TRACE_BACKUPS, header=None)
+        self._sink.write_raw(json.dumps(timeline))
+
+    @property
+    def active(self) -> bool:
+        return self._current is not None
+
+    def timelines(self) -> List[dict]:
+        """Finished timelines, oldest first."""
+        with self._lock:
+            return list(self._history)
+
+    def add_listener(self, listener: Callable[[dict], None]):
+        self._listeners.append(listener)
+
+
+# Global singleton
+_tracer = None
+
+def get_latency_tracer() -> LatencyTracer:
+    """Get the global latency tracer instance."""
+    global _tracer
+    if _tracer is None:
+        _tracer = LatencyTracer()
+    return _tracer
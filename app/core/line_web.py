@@ -0,0 +1,238 @@
+"""
+Line Web - Retained renderer for the orb's node rings
+Steel OS v6.6
+
+Key Design:
+- One QQuickPaintedItem draws the whole ring: nodes on a circle, each
+  linked to the node `step` places ahead (NeuralWebRing, OrbNet)
+- All links go out in one drawLines() call, then one ellipse per node; the
+  item is a single texture in the scenegraph instead of a Canvas plus a
+  Repeater of Rectangles
+- Node drift and pulse are closed-form sines evaluated with numpy; a frame
+  timer runs only while there is motion to show and the item is visible,
+  so a static ring is painted once and then costs nothing per frame
+- QPainter works on every scenegraph backend; a custom QSGGeometryNode
+  path was dropped because it could only be verified on the software
+  backend (which ignores custom geometry)
+"""
+
+import time
+
+import numpy as np
+
+from PySide6.QtCore import Property, QLineF, QRectF, QTimer, Qt, Signal, Slot
+from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtQuick import QQuickItem, QQuickPaintedItem
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TUNING
+# ═══════════════════════════════════════════════════════════════════════════
+FRAME_MS = 33               # Drift/pulse update rate (motion is sub-pixel per frame)
+DRIFT_PERIOD = (12.0, 20.0) # Seconds per drift cycle (random per node)
+PULSE_PERIOD = (4.4, 6.8)   # Seconds per opacity pulse (random per node)
+
+
+class LineWeb(QQuickPaintedItem):
+    """Ring of `nodeCount` nodes, each linked to the node `step` places ahead."""
+
+    nodeCountChanged = Signal()
+    radiusChanged = Signal()
+    stepChanged = Signal()
+    colorChanged = Signal()
+    lineOpacityChanged = Signal()
+    nodeSizeChanged = Signal()
+    nodeOpacityChanged = Signal()
+    pulseChanged = Signal()
+    driftChanged = Signal()
+    runningChanged = Signal()
+
+    def __init__(self, parent: QQuickItem = None):
+        super().__init__(parent)
+        self.setAntialiasing(True)
+
+        self._node_count = 12
+        self._radius = 110.0
+        self._step = 1
+        self._color = QColor("#6FAED9")
+        self._line_opacity = 0.28
+        self._node_size = 4.0
+        self._node_opacity = 0.65
+        self._pulse = 0.0       # Node opacity swing (+/-)
+        self._drift = 0.0       # Node angle swing in degrees (+/-)
+        self._running = True
+
+        self._epoch = time.monotonic()
+        self._frame_t = 0.0     # Motion clock (held while not running)
+        self._layout_nodes()
+
+        self._pen = QPen()
+        self._restyle = True    # Line colour changed
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(FRAME_MS)
+        self._timer.timeout.connect(self.update)
+        self.visibleChanged.connect(self._update_timer)
+        self.windowChanged.connect(self._update_timer)
+
+    # ─────────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ─────────────────────────────────────────────────────────────
+
+    def _set(self, attr: str, value, signal: Signal, restyle: bool = False):
+        if getattr(self, attr) == value:
+            return
+        setattr(self, attr, value)
+        self._restyle |= restyle
+        signal.emit()
+        self._update_timer()
+        self.update()
+
+    def _get_node_count(self):
+        return self._node_count
+
+    def _set_node_count(self, value):
+        count = self._node_count
+        self._set("_node_count", max(int(value), 0), self.nodeCountChanged)
+        if self._node_count != count:
+            self._layout_nodes()
+
+    def _get_step(self):
+        return self._step
+
+    def _set_step(self, value):
+        self._set("_step", max(int(value), 1), self.stepChanged)
+
+    def _get_radius(self):
+        return self._radius
+
+    def _set_radius(self, value):
+        self._set("_radius", float(value), self.radiusChanged)
+
+    def _get_color(self):
+        return self._color
+
+    def _set_color(self, value):
+        self._set("_color", QColor(value), self.colorChanged, restyle=True)
+
+    def _get_line_opacity(self):
+        return self._line_opacity
+
+    def _set_line_opacity(self, value):
+        self._set("_line_opacity", float(value), self.lineOpacityChanged, restyle=True)
+
+    def _get_node_size(self):
+        return self._node_size
+
+    def _set_node_size(self, value):
+        self._set("_node_size", float(value), self.nodeSizeChanged)
+
+    def _get_node_opacity(self):
+        return self._node_opacity
+
+    def _set_node_opacity(self, value):
+        self._set("_node_opacity", float(value), self.nodeOpacityChanged)
+
+    def _get_pulse(self):
+        return self._pulse
+
+    def _set_pulse(self, value):
+        self._set("_pulse", float(value), self.pulseChanged)
+
+    def _get_drift(self):
+        return self._drift
+
+    def _set_drift(self, value):
+        self._set("_drift", float(value), self.driftChanged)
+
+    def _get_running(self):
+        return self._running
+
+    def _set_running(self, value):
+        self._set("_running", bool(value), self.runningChanged)
+
+    nodeCount = Property(int, _get_node_count, _set_node_count, notify=nodeCountChanged)
+    radius = Property(float, _get_radius, _set_radius, notify=radiusChanged)
+    step = Property(int, _get_step, _set_step, notify=stepChanged)
+    color = Property(QColor, _get_color, _set_color, notify=colorChanged)
+    lineOpacity = Property(float, _get_line_opacity, _set_line_opacity, notify=lineOpacityChanged)
+    nodeSize = Property(float, _get_node_size, _set_node_size, notify=nodeSizeChanged)
+    nodeOpacity = Property(float, _get_node_opacity, _set_node_opacity, notify=nodeOpacityChanged)
+    pulse = Property(float, _get_pulse, _set_pulse, notify=pulseChanged)
+    drift = Property(float, _get_drift, _set_drift, notify=driftChanged)
+    running = Property(bool, _get_running, _set_running, notify=runningChanged)
+
+    # ─────────────────────────────────────────────────────────────
+    # MOTION
+    # ─────────────────────────────────────────────────────────────
+
+    def _layout_nodes(self):
+        """Per-node base angle plus random drift/pulse amplitude, rate and phase."""
+        n = self._node_count
+        rng = np.random.default_rng()
+        self._base = np.arange(n) * (2.0 * np.pi / n) if n else np.zeros(0)
+        self._drift_amp = rng.uniform(0.5, 1.0, n)
+        self._drift_rate = 2.0 * np.pi / rng.uniform(*DRIFT_PERIOD, n)
+        self._drift_phase = rng.uniform(0.0, 2.0 * np.pi, n)
+        self._pulse_rate = 2.0 * np.pi / rng.uniform(*PULSE_PERIOD, n)
+        self._pulse_phase = rng.uniform(0.0, 2.0 * np.pi, n)
+
+    def _animated(self) -> bool:
+        return self._running and (self._drift > 0.0 or self._pulse > 0.0)
+
+    @Slot()
+    def _update_timer(self):
+        if self._animated() and self.isVisible() and self.window() is not None:
+            if not self._timer.isActive():
+                self._timer.start()
+        else:
+            self._timer.stop()
+
+    def _positions(self, t: float) -> np.ndarray:
+        """(nodeCount, 2) node centres in item coordinates at time `t`."""
+        angles = self._base
+        if self._drift > 0.0:
+            swing = np.sin(self._drift_rate * t + self._drift_phase) * self._drift_amp
+            angles = angles + np.radians(self._drift) * swing
+        center = np.array([self.width() / 2.0, self.height() / 2.0])
+        return center + self._radius * np.column_stack((np.cos(angles), np.sin(angles)))
+
+    def _alphas(self, t: float) -> np.ndarray:
+        alpha = np.full(self._node_count, self._node_opacity)
+        if self._pulse > 0.0:
+            alpha += self._pulse * np.sin(self._pulse_rate * t + self._pulse_phase)
+        return np.clip(alpha, 0.0, 1.0)
+
+    def _links(self) -> np.ndarray:
+        """Segment end indices, (links, 2)."""
+        start = np.arange(self._node_count)
+        return np.column_stack((start, (start + self._step) % max(self._node_count, 1)))
+
+    # ─────────────────────────────────────────────────────────────
+    # PAINTING (GUI thread, or the render thread for threaded render loops)
+    # ─────────────────────────────────────────────────────────────
+
+    def paint(self, painter: QPainter):
+        if self._running:
+            self._frame_t = time.monotonic() - self._epoch
+        t = self._frame_t
+        points = self._positions(t)
+        if not len(points):
+            return
+        if self._restyle:
+            color = QColor(self._color)
+            color.setAlphaF(self._line_opacity)
+            self._pen = QPen(color, 1.0)
+            self._restyle = False
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._pen)
+        ends = points[self._links()].reshape(-1, 4)
+        painter.drawLines([QLineF(*segment) for segment in ends.tolist()])
+
+        painter.setPen(Qt.NoPen)
+        size = self._node_size
+        color = QColor(self._color)
+        for (x, y), alpha in zip((points - size / 2.0).tolist(), self._alphas(t).tolist()):
+            color.setAlphaF(alpha)
+            painter.setBrush(color)
+            painter.drawEllipse(QRectF(x, y, size, size))
@@ -0,0 +1,188 @@
+"""
+Log Sink - Background, buffered session log
+Steel OS v6.6
+
+Key Design:
+- Callers only append to an in-memory queue (no file I/O on the GUI thread)
+- One writer thread keeps the file open and flushes in batches
+- Size-based rotation: logs.txt -> logs.txt.1 -> ... -> logs.txt.N
+- Structured lines: time, level, message (write_raw() for preformatted
+  records, e.g. the latency trace's JSONL)
+- flush() waits for everything queued so far to hit the disk
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Optional
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════
+LOG_FILE = "logs.txt"
+MAX_BYTES = 1024 * 1024     # Rotate after 1 MB
+BACKUPS = 3                 # logs.txt.1 .. logs.txt.3
+FLUSH_INTERVAL = 0.25       # Max time a line sits in the file buffer
+BATCH_SIZE = 256            # Lines written per wake-up
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
+
+
+class LogSink:
+    """Queue-fed log writer running on its own thread."""
+
+    def __init__(self, path: str = LOG_FILE, max_bytes: int = MAX_BYTES,
+                 backups: int = BACKUPS, level: str = "DEBUG",
+                 header: Optional[str] = "=== STEEL SESSION STARTED ==="):
+        self.path = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.min_level = LEVELS.get(level, 10)
+
+        self._queue = queue.SimpleQueue()
+        self._file = None
+        self._size = 0
+        self.dropped = 0
+
+        # New session: truncate (the old contents go to the first backup)
+        self._open(truncate=True)
+        if header:
+            self._write_lines([header + "\n"])
+
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True, name="steel-log")
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ─────────────────────────────────────────────────────────────
+    # HOT PATH
+    # ─────────────────────────────────────────────────────────────
+
+    def write(self, message: str, level: str = "INFO"):
+        """Queue a line; never blocks on the disk."""
+        if self._closed or LEVELS.get(level, 20) < self.min_level:
+            return
+        self._queue.put((time.time(), level, message))
+
+    def write_raw(self, line: str):
+        """Queue a preformatted line (no timestamp/level prefix)."""
+        if self._closed:
+            return
+        self._queue.put(line if line.endswith("\n") else line + "\n")
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Block until every line queued before this call is on disk."""
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=1.0)
+
+    # ─────────────────────────────────────────────────────────────
+    # WRITER THREAD
+    # ─────────────────────────────────────────────────────────────
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                continue
+
+            lines, waiters, stop = [], [], False
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                elif isinstance(item, str):
+                    lines.append(item)
+                else:
+                    lines.append(self._format(*item))
+                if stop or len(lines) >= BATCH_SIZE:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if lines:
+                self._write_lines(lines)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                break
+
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _format(stamp: float, level: str, message: str) -> str:
+        clock = time.strftime("%H:%M:%S", time.localtime(stamp))
+        return f"{clock}.{int(stamp % 1 * 1000):03d} {level:<5} {message}\n"
+
+    def _write_lines(self, lines):
+        data = "".join(lines)
+        try:
+            if self._size + len(data) > self.max_bytes and self._size > 0:
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+        except (OSError, AttributeError) as e:
+            self.dropped += len(lines)
+            print(f"[LogSink] Write failed: {e}")
+
+    # ─────────────────────────────────────────────────────────────
+    # FILES
+    # ─────────────────────────────────────────────────────────────
+
+    def _open(self, truncate: bool = False):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            if truncate and os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+                self._shift_backups()
+            self._file = open(self.path, "w" if truncate else "a", encoding="utf-8")
+            self._size = self._file.tell()
+        except OSError as e:
+            print(f"[LogSink] Cannot open {self.path}: {e}")
+            self._file = None
+            self._size = 0
+
+    def _rotate(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+        self._open(truncate=True)
+
+    def _shift_backups(self):
+        """logs.txt.(N-1) -> .N, ..., logs.txt -> .1"""
+        if self.backups <= 0:
+            return
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+# Global singleton
+_log_sink = None
+
+def get_log_sink() -> LogSink:
+    """Get the global log sink instance."""
+    global _log_sink
+    if _log_sink is None:
+        _log_sink = LogSink()
+    return _log_sink
@@ -9,13 +9,18 @@ Philosophy:
 - Memory should feel like continuity, not recall
 """
 
-import os
+import atexit
 import json
+import os
+import threading
 from typing import Optional, Any
 
 # Memory file path
 MEMORY_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "memory.json")
 
+# Write-behind tuning
+DEBOUNCE = 0.5          # Seconds of quiet before dirty keys are flushed
+
 # Initial schema - start small, no growth yet
 DEFAULT_MEMORY = {
     "preferred_theme": None,
@@ -32,48 +37,224 @@ class PersistentMemory:
     - Write only when same choice happens twice (prevents accidental memory)
     - Load silently on startup (no announcements)
     - Memory feels like continuity, not recall
+
+    Persistence (write-behind):
+    - Changes land in memory at once and are appended to a small journal
+    - A writer thread coalesces dirty keys and, after a debounce, writes
+      the snapshot via temp file + fsync + atomic rename
+    - The journal is rotated at each snapshot and replayed on load, so a
+      crash at any point loses nothing that was journaled
+    - Rotation runs outside the state lock; changes made meanwhile are
+      journaled as soon as it finishes
     """
     
-    def __init__(self):
+    def __init__(self, path: Optional[str] = None, debounce: float = DEBOUNCE):
+        # Resolved here, not at def time, so MEMORY_FILE can be redirected
+        self.path = os.path.abspath(path or MEMORY_FILE)
+        self.journal_path = self.path + ".journal"
+        self.debounce = debounce
+
         self._data = DEFAULT_MEMORY.copy()
         self._pending = {}  # Tracks choices waiting for confirmation
         self._loaded = False
+
+        self._lock = threading.Lock()
+        self._dirty = set()
+        self._journal = None
+        self._rotating = False
+        self._held = []     # Journal lines that arrived during a rotation
+        self._write_lock = threading.Lock()     # One snapshot writer at a time
+        self._wake = threading.Event()
+        self._closed = False
         
         # Load existing memory silently
         self._load()
+
+        self._thread = threading.Thread(target=self._run, daemon=True, name="steel-memory")
+        self._thread.start()
+        atexit.register(self.close)
     
     def _ensure_dir(self):
         """Ensure data directory exists."""
-        data_dir = os.path.dirname(MEMORY_FILE)
+        data_dir = os.path.dirname(self.path)
         if not os.path.exists(data_dir):
             os.makedirs(data_dir, exist_ok=True)
     
     def _load(self):
-        """Load memory from disk - silently."""
+        """Load snapshot, then replay journals - silently."""
         try:
-            if os.path.exists(MEMORY_FILE):
-                with open(MEMORY_FILE, 'r') as f:
+            if os.path.exists(self.path):
+                with open(self.path, 'r') as f:
                     stored = json.load(f)
-                    # Only load known keys
-                    for key in DEFAULT_MEMORY:
-                        if key in stored:
-                            self._data[key] = stored[key]
-                    print(f"[Memory] Loaded: {self._data}")
-                    self._loaded = True
+                # Only load known keys
+                for key in DEFAULT_MEMORY:
+                    if key in stored:
+                        self._data[key] = stored[key]
+                self._loaded = True
             else:
                 print("[Memory] No existing memory file")
         except Exception as e:
+            # Keep the broken file for inspection; journals may still recover state
             print(f"[Memory] Load failed: {e}")
-    
-    def _save(self):
-        """Save memory to disk."""
+            try:
+                os.replace(self.path, self.path + ".corrupt")
+            except OSError:
+                pass
+
+        replayed = 0
+        for journal in (self.journal_path + ".1", self.journal_path):
+            replayed += self._replay(journal)
+        if replayed:
+            # Fold recovered entries into a fresh snapshot on the first flush
+            self._dirty.update(DEFAULT_MEMORY)
+            self._wake.set()
+            self._loaded = True
+        if self._loaded:
+            print(f"[Memory] Loaded: {self._data}" + (f" (+{replayed} journaled)" if replayed else ""))
+
+    def _replay(self, journal: str) -> int:
+        """Apply journal lines in order; a torn last line is ignored."""
+        count = 0
         try:
+            with open(journal, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    if entry.get("k") in DEFAULT_MEMORY:
+                        self._data[entry["k"]] = entry.get("v")
+                        count += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[Memory] Journal replay failed: {e}")
+        return count
+
+    # ─────────────────────────────────────────────────────────────
+    # WRITE-BEHIND
+    # ─────────────────────────────────────────────────────────────
+
+    def _save(self, key: str):
+        """Record a change: journal it now, snapshot it later (caller holds no I/O)."""
+        with self._lock:
+            try:
+                line = json.dumps({"k": key, "v": self._data[key]}) + "\n"
+                if self._rotating:
+                    self._held.append(line)
+                else:
+                    self._append_locked(line)
+            except (OSError, TypeError) as e:
+                print(f"[Memory] Journal write failed: {e}")
+            self._dirty.add(key)
+        self._wake.set()
+
+    def _append_locked(self, data: str):
+        if self._journal is None:
             self._ensure_dir()
-            with open(MEMORY_FILE, 'w') as f:
-                json.dump(self._data, f, indent=2)
-            print(f"[Memory] Saved: {self._data}")
-        except Exception as e:
-            print(f"[Memory] Save failed: {e}")
+            self._journal = open(self.journal_path, 'a')
+        self._journal.write(data)
+        self._journal.flush()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            # Debounce: restart the wait while changes keep arriving
+            while True:
+                self._wake.clear()
+                if self._closed or not self._wake.wait(self.debounce):
+                    break
+            self._flush_snapshot()
+            if self._closed:
+                break
+
+    def _flush_snapshot(self) -> bool:
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                snapshot = dict(self._data)
+                dirty = sorted(self._dirty)
+                self._dirty.clear()
+                # The old journal covers this snapshot; new appends wait (in memory)
+                # until it has moved aside, then go to a fresh one
+                if self._journal is not None:
+                    self._journal.close()
+                    self._journal = None
+                self._rotating = True
+
+            try:
+                try:
+                    self._rotate_journal()
+                finally:
+                    self._end_rotation()
+                self._write_atomic(snapshot)
+                os.remove(self.journal_path + ".1")
+                print(f"[Memory] Saved: {', '.join(dirty)}")
+                return True
+            except Exception as e:
+                # Journal(s) still hold the changes; retry on the next change/flush
+                print(f"[Memory] Save failed: {e}")
+                with self._lock:
+                    self._dirty.update(dirty)
+                return False
+
+    def _end_rotation(self):
+        """Journal whatever _save() held back while the files were moving."""
+        with self._lock:
+            self._rotating = False
+            held, self._held = self._held, []
+            if held:
+                try:
+                    self._append_locked("".join(held))
+                except OSError as e:
+                    print(f"[Memory] Journal write failed: {e}")
+
+    def _rotate_journal(self):
+        """journal -> journal.1, appending if a failed save left one behind."""
+        rotated = self.journal_path + ".1"
+        if not os.path.exists(self.journal_path):
+            if not os.path.exists(rotated):
+                open(rotated, 'a').close()
+            return
+        if os.path.exists(rotated):
+            with open(self.journal_path, 'r') as src, open(rotated, 'a') as dst:
+                dst.write(src.read())
+            os.remove(self.journal_path)
+        else:
+            os.replace(self.journal_path, rotated)
+
+    def _write_atomic(self, snapshot: dict):
+        self._ensure_dir()
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(snapshot, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        if hasattr(os, "O_DIRECTORY"):
+            # Make the rename itself durable
+            fd = os.open(os.path.dirname(self.path), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def flush(self) -> bool:
+        """Skip the debounce and write the snapshot now (shutdown/tools)."""
+        return self._flush_snapshot()
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._wake.set()
+        self._thread.join(timeout=1.0)
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
     
     def get(self, key: str) -> Optional[Any]:
         """Get a memory value."""
@@ -92,7 +273,7 @@ class PersistentMemory:
         if self._pending.get(key) == value:
             # Confirmed! Persist to disk
             self._data[key] = value
-            self._save()
+            self._save(key)
             del self._pending[key]
             print(f"[Memory] Confirmed and persisted: {key} = {value}")
         else:
@@ -106,7 +287,7 @@ class PersistentMemory:
             return
         
         self._data[key] = value
-        self._save()
+        self._save(key)
     
     @property
     def preferred_theme(self) -> Optional[str]:
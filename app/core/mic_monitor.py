@@ -1,39 +1,61 @@
-import sounddevice as sd
+from typing import Callable, Optional
+
 import numpy as np
-import threading
-import time
+
+from .audio_bus import AudioBus, get_audio_bus
+
+# Meter ballistics: the displayed level falls by DECAY every DECAY_SECONDS
+# of audio (the old 60 fps UI tick), listeners only hear about moves larger
+# than LEVEL_EPSILON, and anything under LEVEL_FLOOR (room noise) reads as 0
+DECAY = 0.85
+DECAY_SECONDS = 0.016
+LEVEL_EPSILON = 0.01
+LEVEL_FLOOR = 0.02
 
 class MicMonitor:
-    def __init__(self):
+    def __init__(self, audio_bus: AudioBus = None,
+                 on_level: Optional[Callable[[float], None]] = None):
         self.level = 0.0
         self.running = False
-        self.stream = None
+        self.bus = audio_bus or get_audio_bus()
+        self.on_level = on_level  # Called from the capture callback
+        self._scratch = np.zeros(self.bus.block_size, dtype=np.float32)
+        self._decay = {}  # Block length -> decay factor
+        self._reported = 0.0
 
-    def audio_callback(self, indata, frames, time_info, status):
-        if status:
-            return
+    def audio_callback(self, block, position):
+        """Bus listener - runs inside the shared capture callback."""
+        n = len(block)
+        if len(self._scratch) < n:
+            self._scratch = np.zeros(n, dtype=np.float32)
+        samples = self._scratch[:n]
+        np.multiply(block, 1.0 / 32768.0, out=samples, casting='unsafe')
         # RMS energy
-        rms = np.sqrt(np.mean(indata**2))
-        # Clamp & smooth
-        self.level = min(max(rms * 10, 0.0), 1.0)
+        rms = np.sqrt(np.dot(samples, samples) / n)
+        # Clamp, then decay by the audio time this block covers
+        decay = self._decay.get(n)
+        if decay is None:
+            decay = self._decay[n] = DECAY ** (n / (self.bus.sample_rate * DECAY_SECONDS))
+        self.level = max(self.level * decay, min(max(float(rms) * 10, 0.0), 1.0))
+
+        if self.on_level:
+            # Settle on an exact zero so the meter rests
+            visible = self.level if self.level >= LEVEL_FLOOR else 0.0
+            if abs(visible - self._reported) > LEVEL_EPSILON or (visible == 0.0 and self._reported):
+                self._reported = visible
+                self.on_level(visible)
 
     def start(self):
         if self.running:
             return
         self.running = True
-        try:
-            self.stream = sd.InputStream(
-                channels=1,
-                callback=self.audio_callback
-            )
-            self.stream.start()
-        except Exception as e:
-            print(f"[MicMonitor] Failed to start stream: {e}")
-            self.running = False
+        self.bus.add_listener(self.audio_callback)
+        self.bus.start()
 
     def stop(self):
         self.running = False
-        if self.stream:
-            self.stream.stop()
-            self.stream.close()
-            self.stream = None
+        self.bus.remove_listener(self.audio_callback)
+        self.level = 0.0
+        if self.on_level and self._reported:
+            self._reported = 0.0
+            self.on_level(0.0)
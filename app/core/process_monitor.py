@@ -0,0 +1,284 @@
+"""
+Process Monitor - Top-N processes and Steel's own threads for QML
+Steel OS v6.6
+
+Key Design:
+- Sampling runs on a worker thread; psutil.Process objects are kept per pid
+  and read inside oneshot() (one /proc pass per process)
+- CPU% comes from cpu_times deltas, so no per-process sleeps
+- Name/ownership are read once per pid; RSS is only re-read for processes
+  that used CPU since the last pass (plus a periodic refresh)
+- The sampler adapts its interval to stay under a CPU budget
+- List models are updated by diffing: only rows that changed are
+  re-emitted, moves/inserts/removes are explicit
+- Steel's own threads are named from threading.enumerate() native ids
+- Steel's footprint (this process + its children) is summed over every
+  process, not just the top N
+- The sampler only runs while `active` is set; the SYSTEM panel binds it
+  to its visibility, so nothing walks /proc while the panel is hidden
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List
+
+import psutil
+from PySide6.QtCore import (QAbstractListModel, QByteArray, QModelIndex, QObject,
+                            Property, Qt, Signal, Slot)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════
+INTERVAL = 2.0          # Seconds between samples (minimum)
+CPU_BUDGET = 0.005      # Sampler may use at most 0.5% of one core
+TOP_N = 8               # Processes shown
+RSS_REFRESH = 5         # Idle processes re-read RSS every Nth pass
+
+
+class DiffListModel(QAbstractListModel):
+    """
+    List model of dict rows keyed by `key`. apply(rows) turns the current
+    contents into `rows` with the minimal set of row signals.
+    """
+
+    def __init__(self, key: str, fields: List[str], parent: QObject = None):
+        super().__init__(parent)
+        self._key = key
+        self._fields = fields
+        self._roles = {Qt.UserRole + 1 + i: name for i, name in enumerate(fields)}
+        self._role_of = {name: role for role, name in self._roles.items()}
+        self._rows: List[dict] = []
+
+    def roleNames(self):
+        return {role: QByteArray(name.encode()) for role, name in self._roles.items()}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        name = self._roles.get(role)
+        return self._rows[index.row()].get(name) if name else None
+
+    def apply(self, rows: List[dict]):
+        key = self._key
+        wanted = {row[key] for row in rows}
+
+        # 1. Drop rows that disappeared (from the bottom, so indices hold)
+        for i in range(len(self._rows) - 1, -1, -1):
+            if self._rows[i][key] not in wanted:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self._rows[i]
+                self.endRemoveRows()
+
+        # 2. Walk the target order: move, insert or update in place
+        for i, row in enumerate(rows):
+            current = self._rows[i] if i < len(self._rows) else None
+            if current is not None and current[key] == row[key]:
+                self._update(i, row)
+                continue
+            j = next((j for j in range(i + 1, len(self._rows)) if self._rows[j][key] == row[key]), None)
+            if j is not None:
+                self.beginMoveRows(QModelIndex(), j, j, QModelIndex(), i)
+                self._rows.insert(i, self._rows.pop(j))
+                self.endMoveRows()
+                self._update(i, row)
+            else:
+                self.beginInsertRows(QModelIndex(), i, i)
+                self._rows.insert(i, dict(row))
+                self.endInsertRows()
+
+    def _update(self, i: int, row: dict):
+        current = self._rows[i]
+        changed = [self._role_of[f] for f in self._fields if current.get(f) != row.get(f)]
+        if changed:
+            current.update(row)
+            index = self.index(i, 0)
+            self.dataChanged.emit(index, index, changed)
+
+
+class ProcessMonitor(QObject):
+    """Owns the sampler thread and the two models exposed to QML."""
+
+    def __init__(self, top_n: int = TOP_N, interval: float = INTERVAL, parent: QObject = None):
+        super().__init__(parent)
+        self.top_n = top_n
+        self.interval = interval
+        self._processes = DiffListModel("pid", ["pid", "name", "cpu", "rssMb", "steel"], self)
+        self._threads = DiffListModel("tid", ["tid", "name", "cpu"], self)
+
+        self._self = psutil.Process(os.getpid())
+        self._procs: Dict[int, psutil.Process] = {}
+        self._last: Dict[int, tuple] = {}     # pid -> (cpu seconds, name, steel, rss MB)
+        self._passes = 0
+        self._last_thread_cpu: Dict[int, float] = {}
+        self._last_time = 0.0
+        self.sample_cost = 0.0      # Seconds spent in the last sample
+        self.steel_cpu = 0.0        # Steel process tree, % of one core
+        self.steel_rss_mb = 0
+
+        self._sampled.connect(self._on_sampled)
+        self._sample_lock = threading.Lock()    # A stopping pass may overlap a restart
+        self._stop = None                       # Event of the running sampler, if any
+
+    _sampled = Signal(object, object, object)  # Worker -> Qt thread hop
+    sampleCostChanged = Signal()
+    steelChanged = Signal()
+    activeChanged = Signal()
+
+    @Property(QObject, constant=True)
+    def processes(self): return self._processes
+
+    @Property(QObject, constant=True)
+    def threads(self): return self._threads
+
+    @Property(float, notify=sampleCostChanged)
+    def sampleCostMs(self): return round(self.sample_cost * 1000.0, 2)
+
+    @Property(float, notify=steelChanged)
+    def steelCpu(self): return self.steel_cpu
+
+    @Property(int, notify=steelChanged)
+    def steelRssMb(self): return self.steel_rss_mb
+
+    def _get_active(self):
+        return self._stop is not None
+
+    def _set_active(self, active: bool):
+        if active == self._get_active():
+            return
+        if active:
+            # Each run gets its own event, so a pass that is still finishing
+            # from the previous run exits instead of sampling twice as often
+            self._stop = threading.Event()
+            threading.Thread(target=self._sample_loop, args=(self._stop,),
+                             daemon=True, name="steel-procmon").start()
+        else:
+            self._stop.set()
+            self._stop = None
+        self.activeChanged.emit()
+
+    active = Property(bool, _get_active, _set_active, notify=activeChanged)
+
+    # ─────────────────────────────────────────────────────────────
+    # SAMPLING (worker thread)
+    # ─────────────────────────────────────────────────────────────
+
+    def _sample_loop(self, stop: threading.Event):
+        # CPU deltas across a pause would average over the time nobody looked
+        with self._sample_lock:
+            self._last_time = 0.0
+        while not stop.is_set():
+            start = time.process_time()
+            try:
+                with self._sample_lock:
+                    result = self.sample()
+                if not stop.is_set():
+                    self._sampled.emit(*result)
+            except Exception as e:
+                print(f"[ProcessMonitor] Sample failed: {e}")
+            self.sample_cost = time.process_time() - start
+            # Stay under the CPU budget on very busy boxes
+            stop.wait(max(self.interval, self.sample_cost / CPU_BUDGET))
+
+    def sample(self):
+        """One pass over all processes + our own threads.
+
+        Returns (top process rows, thread rows, (steel cpu, steel rss MB)).
+        """
+        now = time.monotonic()
+        dt = now - self._last_time if self._last_time else 0.0
+        self._last_time = now
+
+        own_pid = self._self.pid
+        refresh_rss = self._passes % RSS_REFRESH == 0
+        self._passes += 1
+        seen = set()
+        rows = []
+        for pid in psutil.pids():
+            proc = self._procs.get(pid)
+            if proc is None:
+                try:
+                    proc = self._procs[pid] = psutil.Process(pid)
+                except psutil.Error:
+                    continue
+            previous = self._last.get(pid)
+            try:
+                with proc.oneshot():        # cpu_times/ppid/name share one stat read
+                    times = proc.cpu_times()
+                    total = times.user + times.system
+                    if previous is None:
+                        steel = pid == own_pid or proc.ppid() == own_pid
+                        previous = (None, proc.name(), steel, 0)
+                    # Idle processes keep their last RSS until the next refresh
+                    if refresh_rss or total != previous[0] or previous[0] is None:
+                        rss_mb = proc.memory_info().rss >> 20
+                    else:
+                        rss_mb = previous[3]
+            except psutil.Error:
+                self._procs.pop(pid, None)
+                continue
+            seen.add(pid)
+            _, name, steel, _ = previous
+            self._last[pid] = (total, name, steel, rss_mb)
+            cpu = (total - previous[0]) / dt * 100.0 if previous[0] is not None and dt > 0 else 0.0
+            rows.append({
+                "pid": pid,
+                "name": name,
+                "cpu": round(cpu, 1),
+                "rssMb": rss_mb,
+                "steel": steel,
+            })
+
+        # Forget exited processes
+        for pid in list(self._procs):
+            if pid not in seen:
+                self._procs.pop(pid, None)
+                self._last.pop(pid, None)
+
+        own = [r for r in rows if r["steel"]]
+        steel = (round(sum(r["cpu"] for r in own), 1), sum(r["rssMb"] for r in own))
+
+        rows.sort(key=lambda r: (-r["cpu"], -r["rssMb"]))
+        return rows[:self.top_n], self._sample_threads(dt), steel
+
+    def _sample_threads(self, dt: float) -> List[dict]:
+        """Per-thread CPU for this process, named where Python knows the thread."""
+        names = {t.native_id: t.name for t in threading.enumerate() if t.native_id}
+        rows = []
+        current = {}
+        for thread in self._safe(self._self.threads, []):
+            total = thread.user_time + thread.system_time
+            current[thread.id] = total
+            previous = self._last_thread_cpu.get(thread.id)
+            cpu = (total - previous) / dt * 100.0 if previous is not None and dt > 0 else 0.0
+            rows.append({
+                "tid": thread.id,
+                "name": names.get(thread.id, "native"),
+                "cpu": round(cpu, 1),
+            })
+        self._last_thread_cpu = current
+        rows.sort(key=lambda r: (-r["cpu"], r["name"]))
+        return rows
+
+    @staticmethod
+    def _safe(fn, default, **kwargs):
+        try:
+            return fn(**kwargs)
+        except psutil.Error:
+            return default
+
+    @Slot(object, object, object)
+    def _on_sampled(self, processes: List[dict], threads: List[dict], steel: tuple):
+        """Qt thread: diff into the models."""
+        self._processes.apply(processes)
+        self._threads.apply(threads)
+        self.sampleCostChanged.emit()
+        if steel != (self.steel_cpu, self.steel_rss_mb):
+            self.steel_cpu, self.steel_rss_mb = steel
+            self.steelChanged.emit()
+
+    def stop(self):
+        self._set_active(False)
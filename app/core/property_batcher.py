@@ -0,0 +1,84 @@
+"""
+Property Batcher - Frame-coalesced property updates for QML
+Steel OS v6.6
+
+Key Design:
+- set(name, value) is safe from any thread: it records the latest value
+  under a lock and marks the property dirty (no signal is emitted there)
+- The first dirty mark posts one queued wake-up to the owner's thread; a
+  frame timer then applies every dirty property in a single pass
+- Intermediate values within a frame are dropped; a value equal to the
+  one QML already has is dropped too (no notify, no binding re-evaluation)
+- flush() applies pending values at once (owner thread only), for code
+  that must read the latest value synchronously
+"""
+
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal, Slot
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════
+FRAME_MS = 16           # One UI frame at 60 Hz
+
+
+class PropertyBatcher(QObject):
+    """Dirty flags from any thread, delivered once per frame on the owner's thread."""
+
+    def __init__(self, frame_ms: int = FRAME_MS, parent: QObject = None):
+        super().__init__(parent)
+        self._props: Dict[str, Tuple[Callable[[], Any], Callable[[Any], None]]] = {}
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Any] = {}
+        self._scheduled = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(frame_ms)
+        self._timer.timeout.connect(self.flush)
+        self._wake.connect(self._on_wake, Qt.QueuedConnection)
+
+        # Counters
+        self.flushes = 0
+        self.coalesced = 0      # Values replaced before they were delivered
+        self.deduped = 0        # Values equal to the current one
+
+    _wake = Signal()  # Any thread -> owner thread
+
+    def add(self, name: str, current: Callable[[], Any], apply: Callable[[Any], None]):
+        """Register a property: `current()` reads it, `apply(value)` sets it and notifies."""
+        self._props[name] = (current, apply)
+
+    def set(self, name: str, value: Any):
+        """Queue `value` for `name` (any thread)."""
+        with self._lock:
+            if name in self._pending:
+                self.coalesced += 1
+            self._pending[name] = value
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._wake.emit()
+
+    @Slot()
+    def _on_wake(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @Slot()
+    def flush(self):
+        """Apply every pending value now (owner thread)."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._scheduled = False
+        if not pending:
+            return
+        self.flushes += 1
+        for name, value in pending.items():
+            current, apply = self._props[name]
+            if current() == value:
+                self.deduped += 1
+                continue
+            apply(value)
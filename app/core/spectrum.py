@@ -0,0 +1,102 @@
+"""
+Spectrum Analyzer - Log-band mic spectrum for the orb
+Steel OS v6.6
+
+Key Design:
+- AudioBus listener: one windowed rfft per block over the most recent
+  FFT_SIZE samples, no per-band Python loops
+- Bins are folded into log-spaced bands with a precomputed matrix
+  (triangular weights, so narrow low bands never come out empty)
+- Attack/release smoothing per band, scaled by the audio time each block
+  covers (independent of block size)
+- Output is a float32 array in 0..1; listeners get it packed as bytes and
+  only when some band moved by more than EPSILON
+"""
+
+from typing import Callable, Optional
+
+import numpy as np
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TUNING
+# ═══════════════════════════════════════════════════════════════════════════
+BANDS = 24
+FFT_SIZE = 512          # 32 ms at 16 kHz
+F_MIN = 80.0
+F_MAX = 7600.0
+FLOOR_DB = -75.0        # Maps to 0.0
+CEIL_DB = -15.0         # Maps to 1.0
+ATTACK = 0.015          # Seconds (rise time constant)
+RELEASE = 0.180         # Seconds (fall time constant)
+EPSILON = 0.02          # Smallest band change worth a UI update
+
+
+def log_filterbank(bands: int, fft_size: int, sample_rate: int,
+                   f_min: float = F_MIN, f_max: float = F_MAX) -> np.ndarray:
+    """(bands x bins) triangular weights on log-spaced centers, rows sum to 1."""
+    freqs = np.fft.rfftfreq(fft_size, 1.0 / sample_rate)
+    edges = np.geomspace(f_min, min(f_max, sample_rate / 2), bands + 2)
+    bank = np.zeros((bands, len(freqs)), dtype=np.float32)
+    for i in range(bands):
+        low, center, high = edges[i], edges[i + 1], edges[i + 2]
+        rise = (freqs - low) / (center - low)
+        fall = (high - freqs) / (high - center)
+        bank[i] = np.clip(np.minimum(rise, fall), 0.0, None)
+        if not bank[i].any():
+            # Band narrower than a bin: take the nearest bin
+            bank[i, np.argmin(np.abs(freqs - center))] = 1.0
+    bank /= bank.sum(axis=1, keepdims=True)
+    return bank
+
+
+class SpectrumAnalyzer:
+    """Streaming band energies, smoothed, in 0..1."""
+
+    def __init__(self, sample_rate: int = 16000, bands: int = BANDS,
+                 fft_size: int = FFT_SIZE,
+                 on_bands: Optional[Callable[[bytes], None]] = None):
+        self.sample_rate = sample_rate
+        self.fft_size = fft_size
+        self.on_bands = on_bands  # Called from the capture callback
+
+        self._bank = log_filterbank(bands, fft_size, sample_rate)
+        self._window = np.hanning(fft_size).astype(np.float32)
+        # Power of a full-scale sine through the window -> 0 dBFS
+        self._scale = 4.0 / (self._window.sum() ** 2)
+        self._history = np.zeros(fft_size, dtype=np.float32)
+        self._coefs = {}  # Block length -> (attack, release)
+
+        self.bands = np.zeros(bands, dtype=np.float32)
+        self._reported = self.bands.copy()
+
+    def process(self, block: np.ndarray, position: int):
+        """AudioBus listener: update the bands from one block."""
+        n = len(block)
+        if n >= self.fft_size:
+            self._history[:] = block[-self.fft_size:]
+        else:
+            self._history[:-n] = self._history[n:]
+            self._history[-n:] = block
+        # (int16 scale folded into the dB offset below)
+        power = np.abs(np.fft.rfft(self._history * self._window)) ** 2
+        energy = self._bank @ power
+        db = 10.0 * np.log10(energy * (self._scale / (32768.0 ** 2)) + 1e-12)
+        target = np.clip((db - FLOOR_DB) / (CEIL_DB - FLOOR_DB), 0.0, 1.0)
+
+        coefs = self._coefs.get(n)
+        if coefs is None:
+            dt = n / self.sample_rate
+            coefs = self._coefs[n] = (1.0 - np.exp(-dt / ATTACK), 1.0 - np.exp(-dt / RELEASE))
+        rate = np.where(target > self.bands, coefs[0], coefs[1])
+        self.bands += (target - self.bands) * rate
+
+        if self.on_bands and np.max(np.abs(self.bands - self._reported)) > EPSILON:
+            self._reported[:] = self.bands
+            self.on_bands(self.bands.tobytes())
+
+    def reset(self):
+        self._history[:] = 0.0
+        self.bands[:] = 0.0
+        if self.on_bands and self._reported.any():
+            self._reported[:] = 0.0
+            self.on_bands(self.bands.tobytes())
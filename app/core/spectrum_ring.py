@@ -0,0 +1,124 @@
+"""
+Spectrum Ring - Retained renderer for the orb's live mic bands
+Steel OS v6.6
+
+Key Design:
+- Takes AppState.spectrum as is (packed float32 bands, 0..1) and draws one
+  radial bar per band, mirrored left/right with the low bands at the top
+- Bar ends are computed with numpy and go out in a single drawLines() call
+- Repaints only when the bands change and the item is visible; the
+  analyzer only posts bands while capturing, so an idle orb costs nothing
+- A QQuickPaintedItem like LineWeb, so it renders on every backend
+"""
+
+import numpy as np
+
+from PySide6.QtCore import Property, QByteArray, QLineF, Qt, Signal
+from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtQuick import QQuickItem, QQuickPaintedItem
+
+
+class SpectrumRing(QQuickPaintedItem):
+    """Radial band bars starting at `innerRadius`, up to `maxLength` long."""
+
+    spectrumChanged = Signal()
+    innerRadiusChanged = Signal()
+    maxLengthChanged = Signal()
+    colorChanged = Signal()
+    lineWidthChanged = Signal()
+
+    def __init__(self, parent: QQuickItem = None):
+        super().__init__(parent)
+        self.setAntialiasing(True)
+
+        self._spectrum = QByteArray()
+        self._bands = np.zeros(0, dtype=np.float32)
+        self._inner_radius = 64.0
+        self._max_length = 22.0
+        self._color = QColor("#00D4FF")
+        self._line_width = 2.0
+        self._angles = None     # (cos, sin) per bar, cached per band count
+
+    # ─────────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ─────────────────────────────────────────────────────────────
+
+    def _set(self, attr: str, value, signal: Signal):
+        if getattr(self, attr) == value:
+            return
+        setattr(self, attr, value)
+        signal.emit()
+        self.update()
+
+    def _get_spectrum(self):
+        return self._spectrum
+
+    def _set_spectrum(self, value):
+        value = QByteArray(value) if value is not None else QByteArray()
+        if value == self._spectrum:
+            return
+        self._spectrum = value
+        self._bands = np.frombuffer(value.data(), dtype=np.float32) if value.size() % 4 == 0 else self._bands[:0]
+        self.spectrumChanged.emit()
+        if self.isVisible():
+            self.update()
+
+    def _get_inner_radius(self):
+        return self._inner_radius
+
+    def _set_inner_radius(self, value):
+        self._set("_inner_radius", float(value), self.innerRadiusChanged)
+
+    def _get_max_length(self):
+        return self._max_length
+
+    def _set_max_length(self, value):
+        self._set("_max_length", float(value), self.maxLengthChanged)
+
+    def _get_color(self):
+        return self._color
+
+    def _set_color(self, value):
+        self._set("_color", QColor(value), self.colorChanged)
+
+    def _get_line_width(self):
+        return self._line_width
+
+    def _set_line_width(self, value):
+        self._set("_line_width", float(value), self.lineWidthChanged)
+
+    spectrum = Property(QByteArray, _get_spectrum, _set_spectrum, notify=spectrumChanged)
+    innerRadius = Property(float, _get_inner_radius, _set_inner_radius, notify=innerRadiusChanged)
+    maxLength = Property(float, _get_max_length, _set_max_length, notify=maxLengthChanged)
+    color = Property(QColor, _get_color, _set_color, notify=colorChanged)
+    lineWidth = Property(float, _get_line_width, _set_line_width, notify=lineWidthChanged)
+
+    # ─────────────────────────────────────────────────────────────
+    # PAINTING
+    # ─────────────────────────────────────────────────────────────
+
+    def _directions(self, n: int) -> np.ndarray:
+        """(2n, 2) unit vectors: band i at +/-(i + 0.5)/n of a half turn from the top."""
+        if self._angles is None or len(self._angles) != 2 * n:
+            offsets = (np.arange(n) + 0.5) * np.pi / n
+            angles = -np.pi / 2 + np.concatenate((-offsets, offsets))
+            self._angles = np.column_stack((np.cos(angles), np.sin(angles)))
+        return self._angles
+
+    def paint(self, painter: QPainter):
+        bands = self._bands
+        n = len(bands)
+        if n == 0:
+            return
+        directions = self._directions(n)
+        lengths = np.tile(2.0 + bands * self._max_length, 2)[:, None]
+        center = np.array([self.width() / 2.0, self.height() / 2.0])
+        starts = center + directions * self._inner_radius
+        ends = center + directions * (self._inner_radius + lengths)
+
+        pen = QPen(self._color, self._line_width)
+        pen.setCapStyle(Qt.RoundCap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(pen)
+        segments = np.hstack((starts, ends)).tolist()
+        painter.drawLines([QLineF(*segment) for segment in segments])
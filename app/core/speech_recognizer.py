@@ -11,13 +11,16 @@ Features:
 
 import os
 import json
-import queue
 import threading
 from typing import Callable, Optional, List
 
-import sounddevice as sd
 from vosk import Model, KaldiRecognizer
 
+from .audio_bus import AudioBus, AudioReader, get_audio_bus
+from .decoder_process import ProcessDecoder
+from .keyword_spotter import KeywordSpotter
+from .latency_trace import get_latency_tracer
+
 # ═══════════════════════════════════════════════════════════════════════════
 # COMMAND VOCABULARY - Grammar phrases for Command Mode
 # ═══════════════════════════════════════════════════════════════════════════
@@ -50,6 +53,14 @@ COMMAND_PHRASES = [
     "nah"
 ]
 
+# Audio kept from before the trigger and replayed into a fresh recognizer.
+# The VAD fires after speech has begun, so without this the first syllables
+# of every command are lost.
+PREROLL_SECONDS = 0.75
+
+# Wake phrase for the optional wake-word mode ("Steel, switch to BMW")
+WAKE_WORD = "steel"
+
 # Conversation exit phrases (recognized in full model)
 CONVERSATION_EXIT = [
     "that's enough",
@@ -76,9 +87,73 @@ def normalize_transcript(text: str) -> str:
     text = text.replace("reload you eye", "reload ui")
     text = text.replace("let us talk", "let's talk")
     
+    # Wake-word mode decodes from before the wake word: drop it
+    if text == WAKE_WORD or text.startswith(WAKE_WORD + " "):
+        text = text[len(WAKE_WORD):].strip()
+    
     return text
 
 
+class RecognizerPool:
+    """
+    Warm recognizers, one per mode, reused across utterances.
+    
+    Building a KaldiRecognizer compiles the grammar FST; doing it per
+    utterance (and on every mode switch) is pure setup latency. The pool
+    builds each recognizer once and hands it out again after Reset().
+    
+    `lock` guards every call into a recognizer. The one held by a live
+    utterance keeps its grammar until release(), so a hot swap never
+    resets audio the recognition thread is still decoding.
+    """
+    
+    def __init__(self, factory: Callable[[str], KaldiRecognizer], modes: List[str]):
+        self._factory = factory
+        self._recognizers = {mode: factory(mode) for mode in modes}
+        self.lock = threading.Lock()
+        self._held: Optional[str] = None    # Mode of the recognizer being fed
+        self._pending = {}                  # Mode -> grammar waiting for release()
+    
+    def acquire(self, mode: str, hold: bool = False) -> KaldiRecognizer:
+        """Get the recognizer for `mode`, cleared for a new utterance (`hold`: being fed)."""
+        with self.lock:
+            if mode != self._held:
+                self._apply_grammar(mode)
+            recognizer = self._recognizers[mode]
+            recognizer.Reset()
+            if hold:
+                self._held = mode
+            return recognizer
+    
+    def release(self):
+        """The utterance is over: apply a grammar swap deferred meanwhile."""
+        with self.lock:
+            mode, self._held = self._held, None
+            if mode is not None:
+                self._apply_grammar(mode)
+    
+    def set_grammar(self, mode: str, grammar: str) -> bool:
+        """Hot-swap the phrase list. False if deferred until release()."""
+        with self.lock:
+            self._pending[mode] = grammar
+            if mode == self._held:
+                return False
+            self._apply_grammar(mode)
+            return True
+    
+    def _apply_grammar(self, mode: str):
+        """Swap in a pending grammar, without rebuilding when Vosk allows it (lock held)."""
+        grammar = self._pending.pop(mode, None)
+        if grammar is None:
+            return
+        recognizer = self._recognizers[mode]
+        if hasattr(recognizer, "SetGrammar"):
+            recognizer.SetGrammar(grammar)
+            recognizer.Reset()
+        else:
+            self._recognizers[mode] = self._factory(mode)
+
+
 class SpeechRecognizer:
     """Offline speech recognition with Command and Conversation modes."""
     
@@ -86,43 +161,120 @@ class SpeechRecognizer:
     MODE_COMMAND = "COMMAND"
     MODE_CONVERSATION = "CONVERSATION"
     
+    # Audio handed to Kaldi per AcceptWaveform call (100 ms)
+    CHUNK_SAMPLES = 1600
+    
+    # Kaldi endpointer delays (start timeout, trailing silence, max utterance),
+    # applied when the installed Vosk exposes SetEndpointerDelays
+    ENDPOINTER_DELAYS = (5.0, 0.25, 10.0)
+    
     def __init__(self, 
                  on_partial: Optional[Callable[[str], None]] = None,
                  on_final: Optional[Callable[[str], None]] = None,
-                 sample_rate: int = 16000,
-                 command_phrases: List[str] = None):
-        """Initialize the speech recognizer."""
+                 on_endpoint: Optional[Callable[[str], None]] = None,
+                 command_phrases: List[str] = None,
+                 audio_bus: AudioBus = None,
+                 preroll_seconds: float = PREROLL_SECONDS,
+                 out_of_process: bool = False):
+        """
+        Initialize the speech recognizer.
+        With `out_of_process`, Kaldi decoding runs in a child process
+        (see decoder_process.py); callbacks behave the same either way.
+        """
         self.on_partial = on_partial
         self.on_final = on_final
-        self.sample_rate = sample_rate
+        self.on_endpoint = on_endpoint  # Recognizer endpoint (COMMAND mode)
         self.command_phrases = command_phrases or COMMAND_PHRASES
         
+        # Audio comes from the shared capture bus (no stream of our own)
+        self._bus = audio_bus or get_audio_bus()
+        self.sample_rate = self._bus.sample_rate
+        self._preroll_samples = int(preroll_seconds * self.sample_rate)
+        self._last_stop_position = 0  # Never replay audio a previous session consumed
+        self._last_partial_json = None  # Raw PartialResult() of the previous block
+        
         self._mode = self.MODE_COMMAND  # Start in command mode
         self._running = False
-        self._audio_queue = queue.Queue()
+        self._reader: Optional[AudioReader] = None
         self._thread: Optional[threading.Thread] = None
         
         # Build grammar JSON for Command Mode
         self._grammar = json.dumps(self.command_phrases)
         print(f"[SpeechRecognizer] Command grammar loaded ({len(self.command_phrases)} phrases)")
         
-        # Load model
-        model_path = os.path.join(
+        # Model is loaded by load() - slow, so callers run it off the UI thread
+        self._model: Optional[Model] = None
+        self._pool: Optional[RecognizerPool] = None
+        self._recognizer: Optional[KaldiRecognizer] = None
+        self._ready = threading.Event()
+        self.out_of_process = out_of_process
+        self._decoder: Optional[ProcessDecoder] = None
+        
+        self.model_path = os.environ.get("STEEL_VOSK_MODEL") or os.path.abspath(os.path.join(
             os.path.dirname(__file__), 
             "..", "models", "vosk-model-small-en-us-0.15"
-        )
-        model_path = os.path.abspath(model_path)
-        
+        ))
+    
+    def load(self):
+        """
+        Load the Vosk model and build the warm recognizers.
+        Blocking (seconds) - safe to call from a worker thread.
+        """
+        model_path = self.model_path
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"Vosk model not found at: {model_path}")
         
+        if self.out_of_process:
+            print(f"[SpeechRecognizer] Loading model in decoder process: {model_path}")
+            self._decoder = ProcessDecoder(
+                model_path, self.sample_rate, self._grammar,
+                on_result=self._on_decoder_result,
+                mode=self._mode,
+                endpointer_delays=self.ENDPOINTER_DELAYS
+            )
+            self._decoder.start()
+            self._ready.set()
+            print(f"[SpeechRecognizer] Ready in {self._mode} MODE (out of process)")
+            return
+        
         print(f"[SpeechRecognizer] Loading model from: {model_path}")
         self._model = Model(model_path)
         
-        # Create initial recognizer (Command Mode)
-        self._recognizer = KaldiRecognizer(self._model, sample_rate, self._grammar)
-        self._recognizer.SetWords(True)
-        print("[SpeechRecognizer] Ready in COMMAND MODE")
+        # Build both recognizers once; utterances reuse them via Reset()
+        self._pool = RecognizerPool(
+            self._new_recognizer, [self.MODE_COMMAND, self.MODE_CONVERSATION]
+        )
+        self._recognizer = self._pool.acquire(self._mode)
+        self._ready.set()
+        print(f"[SpeechRecognizer] Ready in {self._mode} MODE")
+    
+    @property
+    def is_ready(self) -> bool:
+        """True once load() has finished."""
+        return self._ready.is_set()
+    
+    def create_spotter(self, keywords: List[str],
+                       on_keyword: Callable[[str, int], None],
+                       active_when: Optional[Callable[[], bool]] = None) -> Optional[KeywordSpotter]:
+        """
+        Small-grammar spotter sharing this model and bus.
+        None until loaded, or when the model lives in the decoder process.
+        """
+        if self._model is None:
+            return None
+        return KeywordSpotter(self._model, keywords, on_keyword, self._bus, active_when)
+    
+    def _new_recognizer(self, mode: str) -> KaldiRecognizer:
+        """Build a recognizer for `mode` with the shared settings applied."""
+        if mode == self.MODE_COMMAND:
+            recognizer = KaldiRecognizer(self._model, self.sample_rate, self._grammar)
+        else:
+            # Full language model for conversation
+            recognizer = KaldiRecognizer(self._model, self.sample_rate)
+        recognizer.SetWords(True)
+        if hasattr(recognizer, "SetEndpointerDelays"):
+            recognizer.SetEndpointerDelays(*self.ENDPOINTER_DELAYS)
+        return recognizer
     
     @property
     def mode(self) -> str:
@@ -139,83 +291,126 @@ class SpeechRecognizer:
         
         self._mode = mode
         
-        # Recreate recognizer with appropriate settings
+        # Swap to the warm recognizer for this mode
+        if self._decoder:
+            self._decoder.set_mode(mode)
+        elif self.is_ready:
+            if self._running:
+                self._pool.release()
+            self._recognizer = self._pool.acquire(mode, hold=self._running)
         if mode == self.MODE_COMMAND:
-            self._recognizer = KaldiRecognizer(self._model, self.sample_rate, self._grammar)
             print("[SpeechRecognizer] Switched to COMMAND MODE (grammar)")
         else:
-            # Full language model for conversation
-            self._recognizer = KaldiRecognizer(self._model, self.sample_rate)
             print("[SpeechRecognizer] Switched to CONVERSATION MODE (open)")
-        
-        self._recognizer.SetWords(True)
     
-    def _audio_callback(self, indata, frames, time, status):
-        """Callback for sounddevice audio stream."""
-        if status:
-            print(f"[SpeechRecognizer] Audio status: {status}")
-        self._audio_queue.put(bytes(indata))
+    def set_command_phrases(self, phrases: List[str]):
+        """Replace the COMMAND grammar (e.g. new apps or macros)."""
+        self.command_phrases = list(phrases)
+        self._grammar = json.dumps(self.command_phrases)
+        if not self.is_ready:
+            return  # load() will build with the new grammar
+        if self._decoder:
+            self._decoder.set_grammar(self._grammar)
+            return
+        if not self._pool.set_grammar(self.MODE_COMMAND, self._grammar):
+            print("[SpeechRecognizer] Command grammar update deferred to the end of the utterance")
+            return
+        if self._mode == self.MODE_COMMAND and not self._running:
+            self._recognizer = self._pool.acquire(self.MODE_COMMAND)
+        print(f"[SpeechRecognizer] Command grammar updated ({len(self.command_phrases)} phrases)")
     
     def _recognition_thread(self):
         """Background thread for speech recognition."""
         print(f"[SpeechRecognizer] Recognition thread started ({self._mode})")
         
+        reader = self._reader
         while self._running:
-            try:
-                data = self._audio_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
-            
-            if self._recognizer.AcceptWaveform(data):
-                result = json.loads(self._recognizer.Result())
-                raw_text = result.get("text", "")
-                text = normalize_transcript(raw_text)
-                
-                if text:
-                    print(f"[SpeechRecognizer] [{self._mode}] '{raw_text}' -> '{text}'")
-                    if self.on_final:
-                        self.on_final(text)
-            else:
-                partial = json.loads(self._recognizer.PartialResult())
-                text = partial.get("partial", "")
-                if text and self.on_partial:
-                    self.on_partial(normalize_transcript(text))
+            for segment in reader.read(max_samples=self.CHUNK_SAMPLES, timeout=0.1):
+                self._consume(segment)
         
         print("[SpeechRecognizer] Recognition thread stopped")
     
-    def start(self):
-        """Start listening and recognizing speech."""
-        if self._running:
+    def _consume(self, segment):
+        """Hand one chunk of bus audio to the decoder (local or child process)."""
+        if self._decoder:
+            self._decoder.write(segment)
+        else:
+            self._accept(segment.tobytes())
+    
+    def _accept(self, data: bytes):
+        """Feed one chunk of int16 audio to the active recognizer."""
+        with self._pool.lock:
+            recognizer = self._recognizer
+            final = recognizer.AcceptWaveform(data)
+            raw = recognizer.Result() if final else recognizer.PartialResult()
+        if final:
+            self._last_partial_json = None
+            self._handle_final(json.loads(raw).get("text", ""))
+        else:
+            # Most blocks don't change the hypothesis: skip the parse
+            if raw == self._last_partial_json:
+                return
+            self._last_partial_json = raw
+            self._handle_partial(json.loads(raw).get("partial", ""))
+    
+    def _on_decoder_result(self, kind: str, raw_text: str):
+        """Results from the decoder process (its reader thread)."""
+        if kind == "final":
+            self._handle_final(raw_text)
+        else:
+            self._handle_partial(raw_text)
+    
+    def _handle_final(self, raw_text: str):
+        text = normalize_transcript(raw_text)
+        if text:
+            get_latency_tracer().mark("final_result", transcript=text)
+            print(f"[SpeechRecognizer] [{self._mode}] '{raw_text}' -> '{text}'")
+            if self.on_final:
+                self.on_final(text)
+            # Kaldi finalizes on an endpoint (trailing silence past the
+            # endpointer delay), not on the grammar reaching a complete
+            # phrase - a final means the speaker paused, not finished
+            if self._mode == self.MODE_COMMAND and self.on_endpoint:
+                self.on_endpoint(text)
+    
+    def _handle_partial(self, raw_text: str):
+        if raw_text:
+            get_latency_tracer().mark("first_partial")
+        if raw_text and self.on_partial:
+            self.on_partial(normalize_transcript(raw_text))
+    
+    def start(self, start_position: Optional[int] = None):
+        """
+        Start listening and recognizing speech.
+        Decoding begins at `start_position` (absolute bus sample) or,
+        by default, PREROLL_SECONDS before now so the onset isn't clipped.
+        """
+        if self._running or not self.is_ready:
             return
         
         self._running = True
+        self._last_partial_json = None
         
-        # Clear queue
-        while not self._audio_queue.empty():
-            self._audio_queue.get()
+        # Subscribe with pre-roll: the ring already holds the recent past
+        if start_position is None:
+            start_position = self._bus.write_position - self._preroll_samples
+        start_position = max(start_position, self._last_stop_position)
+        self._reader = self._bus.subscribe(position=start_position)
+        preroll_ms = self._reader.available() * 1000 // self.sample_rate
         
-        # Reset recognizer based on mode
-        if self._mode == self.MODE_COMMAND:
-            self._recognizer = KaldiRecognizer(self._model, self.sample_rate, self._grammar)
+        # Reuse the warm recognizer for this mode
+        if self._decoder:
+            self._decoder.begin()
         else:
-            self._recognizer = KaldiRecognizer(self._model, self.sample_rate)
-        self._recognizer.SetWords(True)
+            self._recognizer = self._pool.acquire(self._mode, hold=True)
+        
+        get_latency_tracer().mark("recognizer_start", preroll_ms=preroll_ms)
         
         # Start recognition thread
-        self._thread = threading.Thread(target=self._recognition_thread, daemon=True)
+        self._thread = threading.Thread(target=self._recognition_thread, daemon=True, name="steel-recognizer")
         self._thread.start()
         
-        # Start audio stream
-        self._stream = sd.RawInputStream(
-            samplerate=self.sample_rate,
-            blocksize=8000,
-            dtype='int16',
-            channels=1,
-            callback=self._audio_callback
-        )
-        self._stream.start()
-        
-        print(f"[SpeechRecognizer] Started listening ({self._mode})")
+        print(f"[SpeechRecognizer] Started listening ({self._mode}, {preroll_ms} ms pre-roll)")
     
     def stop(self):
         """Stop listening."""
@@ -224,16 +419,24 @@ class SpeechRecognizer:
         
         self._running = False
         
-        if hasattr(self, '_stream'):
-            self._stream.stop()
-            self._stream.close()
-        
         if self._thread:
             self._thread.join(timeout=1.0)
         
+        # Drain whatever the thread hadn't consumed yet, then release the bus
+        if self._reader:
+            for segment in self._reader.read():
+                self._consume(segment)
+            self._last_stop_position = self._reader.position
+            self._reader.close()
+        self._reader = None
+        
         # Get final result
-        result = json.loads(self._recognizer.FinalResult())
-        raw_text = result.get("text", "")
+        if self._decoder:
+            raw_text = self._decoder.end()
+        else:
+            with self._pool.lock:
+                raw_text = json.loads(self._recognizer.FinalResult()).get("text", "")
+            self._pool.release()
         text = normalize_transcript(raw_text)
         
         if text and self.on_final:
@@ -242,6 +445,13 @@ class SpeechRecognizer:
         
         print("[SpeechRecognizer] Stopped listening")
     
+    def close(self):
+        """App teardown: stop listening and shut the decoder process down."""
+        self.stop()
+        if self._decoder:
+            self._decoder.shutdown()
+            self._decoder = None
+    
     @property
     def is_running(self) -> bool:
         return self._running
@@ -1,9 +1,14 @@
-from PySide6.QtCore import QObject, QTimer, Slot
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
 from .app_state import AppState
-from .command_router import CommandRouter
+from .command_router import CommandRouter, INTERRUPTS
+from .latency_trace import get_latency_tracer
+from .tts_engine import interrupt_speech
 
 
 class SteelCore(QObject):
+    # Interrupt keyword heard while speaking (spotter thread -> Qt thread)
+    bargeInHeard = Signal(str)
+    
     def __init__(self, app_state: AppState):
         super().__init__()
         self.app_state = app_state
@@ -11,6 +16,15 @@ class SteelCore(QObject):
         # Initialize command router (pass speech recognizer for mode switching)
         speech = getattr(app_state, 'speech', None)
         self.router = CommandRouter(app_state, speech_recognizer=speech)
+        self.router.scheduler.drained.connect(self._on_pipeline_drained)
+        
+        # Barge-in: interrupt keywords stay live while RESPONDING, but only
+        # decoded while the VAD hears speech over our own playback
+        self.barge_in = None  # KeywordSpotter, created once the model is loaded
+        self.bargeInHeard.connect(self._on_barge_in)
+        
+        # Speculative execution from partial transcripts
+        self.app_state.partialHeard.connect(self._on_partial_heard)
         
         # Connect to state changes
         self.app_state.assistantStateChanged.connect(self.on_state_changed)
@@ -34,12 +48,19 @@ class SteelCore(QObject):
     def on_state_changed(self):
         current_state = self.app_state.assistantState
         
+        if current_state == "RESPONDING":
+            self._start_barge_in()
+        else:
+            self._stop_barge_in()
+        
         if current_state == "LISTENING":
             self.start_listening_flow()
         elif current_state == "PROCESSING":
             # Route the command when entering PROCESSING state
             self.process_voice_command()
         elif current_state == "IDLE":
+            # Utterance ended without a command: drop its predictions
+            self.router.clear_speculation()
             # Cancel any pending operations if user reset
             if self.processing_timer.isActive():
                 print("[SteelCore] Operation cancelled by user.")
@@ -54,24 +75,76 @@ class SteelCore(QObject):
         print(f"[DEBUG] RAW TRANSCRIPT: '{transcript}'")
         print(f"[SteelCore] Processing command: '{transcript}'")
         
-        # Route the command
+        # Route the command (queues speech/actions, returns immediately)
         matched = self.router.handle_command(transcript)
         
-        # Transition to RESPONDING then IDLE
+        # RESPONDING while the pipeline runs, IDLE shortly after it drains
         self.app_state.set_state("RESPONDING")
         try:
             self.processing_timer.timeout.disconnect()
         except RuntimeError:
             pass  # No connections to disconnect
         self.processing_timer.timeout.connect(self.transition_to_idle)
-        self.processing_timer.start(1500)  # Brief response state
+        if not self.router.scheduler.busy:
+            self.processing_timer.start(1500)  # Brief response state
+    
+    @Slot(str)
+    def _on_partial_heard(self, text: str):
+        """Partial transcript while capturing: let the router pre-warm."""
+        if self.app_state.is_capturing():
+            self.router.speculate(text)
+    
+    @Slot()
+    def _on_pipeline_drained(self):
+        """Router finished speaking/acting: hold RESPONDING briefly, then IDLE."""
+        if self.app_state.assistantState == "RESPONDING":
+            self.processing_timer.start(1500)
             
+    # ─────────────────────────────────────────────────────────────
+    # BARGE-IN
+    # ─────────────────────────────────────────────────────────────
+    
+    def _start_barge_in(self):
+        if self.barge_in is None:
+            speech = self.app_state.speech
+            if speech is None or not speech.is_ready:
+                return
+            # The echo gate is active while we speak, so the VAD's onset margin
+            # is raised and replies like "...or stop." don't open the spotter
+            vad = self.app_state.vad
+            self.barge_in = speech.create_spotter(INTERRUPTS, self._on_interrupt_keyword,
+                                                  active_when=lambda: vad.is_speech)
+            if self.barge_in is None:
+                print("[SteelCore] Barge-in unavailable (model not loaded in-process)")
+                self.barge_in = False
+                return
+        if self.barge_in:
+            self.barge_in.start()
+    
+    def _stop_barge_in(self):
+        if self.barge_in:
+            self.barge_in.stop()
+    
+    def _on_interrupt_keyword(self, keyword: str, position: int):
+        """Spotter thread: silence first, then let the router clean up."""
+        get_latency_tracer().mark("barge_in", keyword=keyword)
+        interrupt_speech()
+        self.bargeInHeard.emit(keyword)
+    
+    @Slot(str)
+    def _on_barge_in(self, keyword: str):
+        print(f"[SteelCore] Barge-in: '{keyword}'")
+        self.router.handle_command(keyword)
+    
     def start_listening_flow(self):
         """Called when LISTENING state is entered. 
         
         Note: We no longer use a timer here. The natural flow is:
         PRE_LISTEN -> LISTENING -> HOLDING -> PROCESSING
-        This is handled by RMS-based silence detection in app_state.py.
+        This is handled by endpointing in app_state.py: the adaptive VAD's
+        silence milestones drive HOLDING, the COMMAND recognizer's endpoint
+        ends the utterance, and the FALLBACK_SECONDS milestone ends it when
+        the recognizer never finalizes.
         """
         print("[SteelCore] Listening... (waiting for silence to trigger PROCESSING)")
 
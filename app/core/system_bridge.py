@@ -1,41 +1,156 @@
-from PySide6.QtCore import QObject, Signal, Property, Slot, QTimer
+"""
+System Bridge - Host metrics for the dashboard
+Steel OS v6.6
+
+Key Design:
+- psutil sampling runs on a worker thread, never on the GUI thread
+- Each metric has its own interval (battery is slow and rarely changes)
+- *Changed signals fire only when a value actually changes
+- Last N samples per metric kept in a float32 ring, exposed to QML as a
+  QByteArray (read it with `new Float32Array(system.cpuHistory)`)
+"""
+
+import threading
+import time
+
+import numpy as np
 import psutil
+from PySide6.QtCore import QByteArray, QObject, Property, Signal, Slot
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════
+INTERVALS = {           # Seconds between samples
+    "cpu": 1.0,
+    "ram": 2.0,
+    "battery": 30.0,
+}
+HISTORY = 120           # Samples kept per metric
+
+
+class MetricHistory:
+    """Fixed-size float32 ring of recent samples."""
+
+    def __init__(self, size: int = HISTORY):
+        self._ring = np.zeros(size, dtype=np.float32)
+        self._next = 0
+        self.count = 0
+
+    def append(self, value: float):
+        self._ring[self._next] = value
+        self._next = (self._next + 1) % len(self._ring)
+        self.count = min(self.count + 1, len(self._ring))
+
+    def to_bytes(self) -> QByteArray:
+        """Samples oldest -> newest as packed float32 (one copy, no lists)."""
+        size = len(self._ring)
+        if self.count < size:
+            return QByteArray(self._ring[:self.count].tobytes())
+        return QByteArray(self._ring[self._next:].tobytes() + self._ring[:self._next].tobytes())
+
+
+def _sample_cpu() -> int:
+    return int(psutil.cpu_percent())
+
+
+def _sample_ram() -> int:
+    return int(psutil.virtual_memory().percent)
+
+
+def _sample_battery() -> int:
+    try:
+        bat = psutil.sensors_battery()
+        return int(bat.percent) if bat else 100
+    except Exception:
+        return 100
+
+
+SAMPLERS = {
+    "cpu": _sample_cpu,
+    "ram": _sample_ram,
+    "battery": _sample_battery,
+}
+
 
 class SystemBridge(QObject):
-    def __init__(self):
+    def __init__(self, intervals: dict = None):
         super().__init__()
-        self._cpu = 0
-        self._ram = 0
-        self._battery = 0
-        
-        # Timer for polling
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_stats)
-        self.timer.start(2000) # 2s
+        self._values = {name: 0 for name in SAMPLERS}
+        self._values["battery"] = 100
+        self._history = {name: MetricHistory() for name in SAMPLERS}
+        self._intervals = dict(INTERVALS, **(intervals or {}))
+
+        self._changed = {
+            "cpu": self.cpuChanged,
+            "ram": self.ramChanged,
+            "battery": self.batteryChanged,
+        }
+        self._history_changed = {
+            "cpu": self.cpuHistoryChanged,
+            "ram": self.ramHistoryChanged,
+            "battery": self.batteryHistoryChanged,
+        }
+        self._sampled.connect(self._on_sample)
+
+        # Sampling thread
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True, name="steel-sysstats")
+        self._thread.start()
 
     # Signals
     cpuChanged = Signal()
     ramChanged = Signal()
     batteryChanged = Signal()
+    cpuHistoryChanged = Signal()
+    ramHistoryChanged = Signal()
+    batteryHistoryChanged = Signal()
+    _sampled = Signal(str, int)  # Worker -> Qt thread hop
 
     @Property(int, notify=cpuChanged)
-    def cpu(self): return self._cpu
+    def cpu(self): return self._values["cpu"]
 
     @Property(int, notify=ramChanged)
-    def ram(self): return self._ram
+    def ram(self): return self._values["ram"]
 
     @Property(int, notify=batteryChanged)
-    def battery(self): return self._battery
+    def battery(self): return self._values["battery"]
+
+    @Property(QByteArray, notify=cpuHistoryChanged)
+    def cpuHistory(self): return self._history["cpu"].to_bytes()
+
+    @Property(QByteArray, notify=ramHistoryChanged)
+    def ramHistory(self): return self._history["ram"].to_bytes()
+
+    @Property(QByteArray, notify=batteryHistoryChanged)
+    def batteryHistory(self): return self._history["battery"].to_bytes()
+
+    # ─────────────────────────────────────────────────────────────
+    # SAMPLING (worker thread)
+    # ─────────────────────────────────────────────────────────────
+
+    def _sample_loop(self):
+        due = {name: 0.0 for name in SAMPLERS}
+        while not self._stop.is_set():
+            now = time.monotonic()
+            for name, sampler in SAMPLERS.items():
+                if now >= due[name]:
+                    due[name] = now + self._intervals[name]
+                    self._sampled.emit(name, sampler())
+            self._stop.wait(max(0.0, min(due.values()) - time.monotonic()))
+
+    @Slot(str, int)
+    def _on_sample(self, name: str, value: int):
+        """Qt thread: record history, notify only on change."""
+        self._history[name].append(value)
+        self._history_changed[name].emit()
+        if self._values[name] != value:
+            self._values[name] = value
+            self._changed[name].emit()
 
     def update_stats(self):
-        self._cpu = int(psutil.cpu_percent())
-        self._ram = int(psutil.virtual_memory().percent)
-        try:
-            bat = psutil.sensors_battery()
-            self._battery = int(bat.percent) if bat else 100
-        except:
-            self._battery = 100
-            
-        self.cpuChanged.emit()
-        self.ramChanged.emit()
-        self.batteryChanged.emit()
+        """Sample everything now (blocking - tests/tools only)."""
+        for name, sampler in SAMPLERS.items():
+            self._on_sample(name, sampler())
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,165 @@
+"""
+TTS Cache - Pre-rendered speech for the fixed response vocabulary
+Steel OS v6.6
+
+Key Design:
+- Phrases are synthesized once to PCM (int16) and kept in memory
+- The fixed vocabulary ("Done.", "Reloading.", ...) is pinned and rendered
+  while the TTS thread is idle; everything else lives in an LRU
+- Lookups never render: a miss is spoken live by the caller and the
+  missing sentences are rendered into the LRU on the next idle pass
+- Replies are cached per sentence, so "AUDI. Opening logs." reuses both clips
+- Rendering is injected (the engine owns the synthesizer and its thread)
+"""
+
+import re
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════
+CAPACITY = 64               # Dynamic (unpinned) clips kept
+SENTENCE_GAP = 0.12         # Seconds of silence between joined sentences
+
+_SENTENCE = re.compile(r"(?<=[.!?])\s+")
+
+Clip = Tuple[np.ndarray, int]   # (int16 samples, sample rate)
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE.split(text.strip()) if s.strip()]
+
+
+class PhraseCache:
+    """
+    In-memory PCM cache. `render(text) -> (samples, rate) | None` is only
+    ever called from the thread that calls warm_one().
+    """
+
+    def __init__(self, render: Callable[[str], Optional[Clip]], capacity: int = CAPACITY):
+        self._render = render
+        self.capacity = capacity
+        self._pinned: Dict[str, Clip] = {}
+        self._lru: "OrderedDict[str, Clip]" = OrderedDict()
+        self._to_warm = deque()
+        self._to_learn = deque(maxlen=capacity)    # Missed dynamic sentences
+        self._pinned_keys = set()
+        self._lock = threading.Lock()
+        self._failed = set()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def pin(self, phrases: Iterable[str], urgent: bool = False):
+        """
+        Mark phrases as permanent; they are rendered by warm_one().
+        `urgent` moves not-yet-rendered phrases to the front of the queue.
+        """
+        with self._lock:
+            for phrase in phrases:
+                for sentence in split_sentences(phrase):
+                    key = self._key(sentence)
+                    if urgent and key not in self._pinned:
+                        self._pinned_keys.add(key)
+                        self._to_warm.appendleft(sentence)
+                    elif key not in self._pinned_keys:
+                        self._pinned_keys.add(key)
+                        self._to_warm.append(sentence)
+
+    def warm_one(self) -> bool:
+        """
+        Render one pending sentence, pinned phrases before missed ones.
+        Returns False when none are left.
+        """
+        with self._lock:
+            if self._to_warm:
+                sentence = self._to_warm.popleft()
+            elif self._to_learn:
+                sentence = self._to_learn.popleft()
+            else:
+                return False
+        if self._lookup(self._key(sentence)) is None:
+            self._render_sentence(sentence)
+        return True
+
+    # ─────────────────────────────────────────────────────────────
+    # LOOKUP
+    # ─────────────────────────────────────────────────────────────
+
+    def get(self, text: str) -> Optional[Clip]:
+        """
+        PCM for `text` if every sentence is cached, else None. Missing
+        sentences are queued for warm_one() rather than rendered here.
+        """
+        sentences = split_sentences(text)
+        clips = [self._lookup(self._key(sentence)) for sentence in sentences]
+        missing = [s for s, clip in zip(sentences, clips) if clip is None]
+        if missing:
+            self.misses += 1
+            self._learn(missing)
+            return None
+        if not clips:
+            return None
+        self.hits += 1
+        if len(clips) == 1:
+            return clips[0]
+
+        rate = clips[0][1]
+        if any(r != rate for _, r in clips):
+            return None
+        gap = np.zeros(int(rate * SENTENCE_GAP), dtype=np.int16)
+        parts = []
+        for samples, _ in clips:
+            parts.extend((samples, gap))
+        return np.concatenate(parts[:-1]), rate
+
+    def _lookup(self, key: str) -> Optional[Clip]:
+        with self._lock:
+            clip = self._pinned.get(key)
+            if clip is None:
+                clip = self._lru.get(key)
+                if clip is not None:
+                    self._lru.move_to_end(key)
+        return clip
+
+    def _learn(self, sentences: List[str]):
+        """Queue missed sentences for rendering into the LRU."""
+        with self._lock:
+            for sentence in sentences:
+                key = self._key(sentence)
+                # Pinned keys are already in _to_warm
+                if key in self._failed or key in self._pinned_keys:
+                    continue
+                if all(self._key(s) != key for s in self._to_learn):
+                    self._to_learn.append(sentence)
+
+    def _render_sentence(self, sentence: str) -> Optional[Clip]:
+        key = self._key(sentence)
+        if key in self._failed:
+            return None
+
+        clip = self._render(sentence)
+        if clip is None:
+            if len(self._failed) >= self.capacity:
+                self._failed.clear()
+            self._failed.add(key)
+            return None
+
+        with self._lock:
+            if key in self._pinned_keys:
+                self._pinned[key] = clip
+            else:
+                self._lru[key] = clip
+                while len(self._lru) > self.capacity:
+                    self._lru.popitem(last=False)
+        return clip
+
+    def __len__(self) -> int:
+        return len(self._pinned) + len(self._lru)
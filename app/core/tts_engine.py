@@ -6,11 +6,30 @@ Key Design:
 - Engine initialized ONCE globally
 - Queue-based thread safety (commands come from background threads)
 - Runs TTS in dedicated thread to not block UI
+- Known phrases are pre-rendered to PCM and played from memory; anything
+  not cached yet is spoken live and rendered into the cache when idle
+- PCM playback is block-by-block, so interrupts cut it within one block
 """
 
+import os
 import queue
+import tempfile
 import threading
-import pyttsx3
+import wave
+from typing import Iterable
+
+import numpy as np
+
+from .audio_output import PcmPlayer
+from .echo_gate import get_echo_gate
+from .latency_trace import get_latency_tracer
+from .tts_cache import PhraseCache
+
+try:
+    import pyttsx3
+except ImportError:  # Headless/benchmark environments
+    pyttsx3 = None
+
 
 class TTSEngine:
     """Thread-safe text-to-speech engine."""
@@ -34,9 +53,15 @@ class TTSEngine:
         self._initialized = True
         self._queue = queue.Queue()
         self._running = True
+        self._rendering = False
+        self._cache = None
+        self._player = None
+        self._render_dir = None     # TemporaryDirectory for render.wav
         
         # Initialize engine
         try:
+            if pyttsx3 is None:
+                raise RuntimeError("pyttsx3 not installed")
             self._engine = pyttsx3.init()
             self._engine.setProperty("rate", 170)  # Words per minute
             self._engine.setProperty("volume", 1.0)
@@ -49,6 +74,16 @@ class TTSEngine:
                     self._engine.setProperty("voice", voice.id)
                     break
             
+            # Driver reports when audio actually starts
+            self._engine.connect("started-utterance", self._on_utterance_started)
+            
+            # PCM cache needs a direct output path
+            self._player = PcmPlayer()
+            if self._player.available:
+                # Removed when the TTS thread stops (or at exit, via its finalizer)
+                self._render_dir = tempfile.TemporaryDirectory(prefix="steel-tts-")
+                self._cache = PhraseCache(self._render)
+            
             print("[TTSEngine] Initialized successfully")
         except Exception as e:
             print(f"[TTSEngine] Failed to initialize: {e}")
@@ -56,7 +91,7 @@ class TTSEngine:
             return
         
         # Start TTS thread
-        self._thread = threading.Thread(target=self._tts_loop, daemon=True)
+        self._thread = threading.Thread(target=self._tts_loop, daemon=True, name="steel-tts")
         self._thread.start()
     
     def _tts_loop(self):
@@ -71,16 +106,85 @@ class TTSEngine:
                     
                 if self._engine:
                     print(f"[TTSEngine] Speaking: {text}")
-                    self._engine.say(text)
-                    self._engine.runAndWait()
+                    gate = get_echo_gate()
+                    gate.playback_started()
+                    try:
+                        if not self._play_cached(text):
+                            self._engine.say(text)
+                            self._engine.runAndWait()
+                    finally:
+                        gate.playback_stopped()
                     
             except queue.Empty:
+                # Idle: render the next pinned or missed phrase
+                if self._cache is not None:
+                    self._cache.warm_one()
                 continue
             except Exception as e:
                 print(f"[TTSEngine] Error speaking: {e}")
         
+        if self._player:
+            self._player.close()
+        if self._render_dir:
+            self._render_dir.cleanup()
         print("[TTSEngine] TTS thread stopped")
     
+    def _on_utterance_started(self, name):
+        if not self._rendering:
+            get_latency_tracer().mark("tts_audible")
+    
+    # ─────────────────────────────────────────────────────────────
+    # PCM CACHE (TTS thread only)
+    # ─────────────────────────────────────────────────────────────
+    
+    def _render(self, text: str):
+        """Synthesize `text` to a WAV file and load it as int16 PCM."""
+        path = os.path.join(self._render_dir.name, "render.wav")
+        self._rendering = True
+        try:
+            self._engine.save_to_file(text, path)
+            self._engine.runAndWait()
+            with wave.open(path, "rb") as wav:
+                if wav.getsampwidth() != 2:
+                    return None
+                channels = wav.getnchannels()
+                rate = wav.getframerate()
+                samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+            if channels > 1:
+                samples = samples.reshape(-1, channels)[:, 0].copy()
+            return (samples, rate) if len(samples) else None
+        except Exception as e:
+            # Some drivers (e.g. macOS) write formats the wave module can't read
+            print(f"[TTSEngine] Render failed, using live speech: {e}")
+            return None
+        finally:
+            self._rendering = False
+    
+    def _play_cached(self, text: str) -> bool:
+        """Play `text` from the PCM cache. False if it isn't cached (yet)."""
+        if self._cache is None:
+            return False
+        clip = self._cache.get(text)
+        if clip is None:
+            return False
+        samples, rate = clip
+        tracer = get_latency_tracer()
+        try:
+            completed = self._player.play(samples, rate, on_start=lambda: tracer.mark("tts_audible"))
+        except Exception as e:
+            print(f"[TTSEngine] Playback failed: {e}")
+            return False
+        if not completed:
+            cut_ms = self._player.last_cut_ms + self._player.output_latency * 1000.0
+            tracer.mark("tts_silenced", cut_ms=round(cut_ms, 1))
+            print(f"[TTSEngine] Cut after {cut_ms:.1f} ms (stop -> silence)")
+        return True
+    
+    def prewarm(self, phrases: Iterable[str], urgent: bool = False):
+        """Pin phrases in the cache; rendered whenever the TTS thread is idle."""
+        if self._cache is not None:
+            self._cache.pin(phrases, urgent)
+    
     def speak(self, text: str):
         """
         Queue text for speech. Thread-safe - can be called from any thread.
@@ -113,6 +217,10 @@ def speak(text: str):
     """Convenience function - speak text using global engine."""
     get_tts_engine().speak(text)
 
+def prewarm(phrases: Iterable[str], urgent: bool = False):
+    """Pre-render phrases the assistant says often (`urgent`: render next)."""
+    get_tts_engine().prewarm(phrases, urgent)
+
 def interrupt_speech():
     """Immediately stop any speaking. Used for hard interrupts."""
     engine = get_tts_engine()
@@ -122,7 +230,9 @@ def interrupt_speech():
             engine._queue.get_nowait()
         except:
             break
-    # Stop current speech
+    # Stop current speech (PCM playback first - it stops within one block)
+    if engine._player:
+        engine._player.stop()
     if engine._engine:
         engine._engine.stop()
     print("[TTS] Speech interrupted")
@@ -0,0 +1,256 @@
+"""
+Voice Activity Detector - Adaptive noise-floor VAD
+Steel OS v6.6
+
+Key Design:
+- Runs inside the AudioBus callback, vectorized over 10 ms frames
+- Tracks the room's noise floor instead of a fixed RMS threshold
+- Two features must agree: energy above the floor AND speech-band dominance
+- Hysteresis (onset/offset margins + hangover) so speech doesn't flicker
+- Publishes speech start/end events, not a raw level
+- Silence milestones are counted in samples, so listeners get "N seconds
+  of silence" events without polling a clock
+- Steady sound (a tone, a fan) can't hold a segment open: the floor
+  re-learns it once it is stationary. Anything else (TV, music) is cut at
+  MAX_SPEECH_SECONDS and then masks onsets until the room quiets down
+"""
+
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from .echo_gate import EchoGate
+
+# ═══════════════════════════════════════════════════════════════════════════
+# TUNING
+# ═══════════════════════════════════════════════════════════════════════════
+FRAME_MS = 10
+ONSET_DB = 9.0          # Above floor to count as speech-like
+OFFSET_DB = 4.0         # Above floor to stay in speech
+MIN_SPEECH_DB = -55.0   # Absolute gate (dBFS) for very quiet rooms
+BAND_RATIO = 0.55       # Share of energy in 300-3400 Hz
+ONSET_FRAMES = 3        # 30 ms of speech-like frames to trigger
+HANGOVER_FRAMES = 30    # 300 ms below offset to end speech
+FLOOR_RISE = 0.02       # Per-frame floor tracking when rising (slow)
+FLOOR_FALL = 0.3        # Per-frame floor tracking when falling (fast)
+WARMUP_FRAMES = 100     # First second: learn the room quickly
+STATIONARY_FRAMES = 100 # 1 s window for the in-speech stationarity check
+STATIONARY_DB = 1.5     # Energy spread (std) below this is not speech
+MAX_SPEECH_SECONDS = 15.0
+UNMASK_DB = 12.0        # Masking lifts once the room stays this far below it...
+UNMASK_FRAMES = 100     # ...for 1 s
+
+
+class VoiceActivityDetector:
+    """Streaming speech/non-speech decisions with an adaptive floor."""
+
+    def __init__(self, sample_rate: int = 16000,
+                 on_speech_start: Optional[Callable[[int], None]] = None,
+                 on_speech_end: Optional[Callable[[int], None]] = None,
+                 echo_gate: Optional[EchoGate] = None,
+                 on_silence: Optional[Callable[[float, int], None]] = None,
+                 silence_marks: Sequence[float] = ()):
+        """
+        `echo_gate` raises the onset margin while the assistant is audible.
+        `on_silence(seconds, position)` fires once per entry of `silence_marks`
+        after speech ends (or after restart_silence()).
+        """
+        self.sample_rate = sample_rate
+        self.echo_gate = echo_gate
+        self.on_speech_start = on_speech_start
+        self.on_speech_end = on_speech_end
+        self.on_silence = on_silence
+        self.silence_marks = sorted(silence_marks)
+
+        self.frame_len = sample_rate * FRAME_MS // 1000
+        self._window = np.hanning(self.frame_len).astype(np.float32)
+        freqs = np.fft.rfftfreq(self.frame_len, 1.0 / sample_rate)
+        self._band = (freqs >= 300) & (freqs <= 3400)
+
+        # Leftover samples that didn't fill a frame
+        self._carry = np.zeros(0, dtype=np.int16)
+
+        self.noise_floor_db = -60.0
+        self.onset_db = ONSET_DB
+        self.offset_db = OFFSET_DB
+        self.is_speech = False
+        self.speech_start_position = 0
+        self.speech_end_position = 0
+
+        self._frames_seen = 0
+        self._onset_run = 0
+        self._quiet_run = 0
+        self._recent = np.zeros(0, dtype=np.float32)  # Energies in this segment (last 1 s)
+        self._masking_db = None  # Level of a source that outlasted MAX_SPEECH_SECONDS
+        self._unmask_run = 0
+
+        # Silence milestones: counted from this bus position
+        self._silence_from = 0
+        self._next_mark = len(self.silence_marks)  # Disarmed
+
+        # Counters (for tuning/diagnostics)
+        self.triggers = 0
+        self.rejected_onsets = 0
+        self.stationary_ends = 0   # Segments ended because the sound was steady
+        self.forced_ends = 0       # Segments cut at MAX_SPEECH_SECONDS
+
+    def process(self, block: np.ndarray, position: int):
+        """AudioBus listener: classify every full frame in the block."""
+        if len(self._carry):
+            samples = np.concatenate((self._carry, block))
+            position -= len(self._carry)
+        else:
+            samples = block
+        n_frames = len(samples) // self.frame_len
+        used = n_frames * self.frame_len
+        self._carry = np.array(samples[used:], dtype=np.int16)
+        if n_frames == 0:
+            return
+
+        frames = samples[:used].reshape(n_frames, self.frame_len).astype(np.float32)
+        frames *= 1.0 / 32768.0
+
+        # Feature 1: frame energy (dBFS)
+        energy = np.einsum('ij,ij->i', frames, frames) / self.frame_len
+        energy_db = 10.0 * np.log10(energy + 1e-10)
+
+        # Feature 2: speech-band energy ratio
+        power = np.abs(np.fft.rfft(frames * self._window, axis=1)) ** 2
+        total = power.sum(axis=1) + 1e-12
+        band_ratio = power[:, self._band].sum(axis=1) / total
+
+        if self._masking_db is not None and not self.is_speech:
+            self._update_masking(energy_db)
+        floor = self.noise_floor_db if self._masking_db is None else max(self.noise_floor_db, self._masking_db)
+        speech_like = (energy_db > MIN_SPEECH_DB) & (band_ratio > BAND_RATIO)
+        onset_like = speech_like & (energy_db > floor + self.onset_db)
+        above_offset = energy_db > floor + self.offset_db
+
+        gate = self.echo_gate
+        if gate is not None and gate.active:
+            # Our own voice is in the room: demand more, and don't learn the
+            # floor from speaker output
+            boosted = speech_like & (energy_db > floor + self.onset_db + gate.onset_boost_db)
+            gate.gated_frames += int(np.count_nonzero(onset_like & ~boosted))
+            self._run_hysteresis(boosted, above_offset, position)
+        else:
+            self._update_floor(energy_db, onset_like)
+            self._run_hysteresis(onset_like, above_offset, position)
+            if self.is_speech:
+                self._check_stationary(energy_db)
+        self._check_silence(position + used)
+
+    def restart_silence(self, position: int):
+        """Count silence milestones from `position` (e.g. a manual trigger)."""
+        self._silence_from = position
+        self._next_mark = 0
+
+    def _check_silence(self, position: int):
+        if self.is_speech or self._next_mark >= len(self.silence_marks):
+            return
+        silent = (position - self._silence_from) / self.sample_rate
+        while self._next_mark < len(self.silence_marks) and silent >= self.silence_marks[self._next_mark]:
+            mark = self.silence_marks[self._next_mark]
+            self._next_mark += 1
+            if self.on_silence:
+                self.on_silence(mark, position)
+
+    def _update_floor(self, energy_db: np.ndarray, onset_like: np.ndarray):
+        """Follow the floor on non-speech frames: fall fast, rise slowly."""
+        quiet = energy_db[~onset_like] if not self.is_speech else energy_db[:0]
+        self._frames_seen += len(energy_db)
+        if len(quiet) == 0:
+            return
+        target = float(np.median(quiet))
+        if target < self.noise_floor_db:
+            rate = FLOOR_FALL
+        elif self._frames_seen < WARMUP_FRAMES:
+            rate = FLOOR_FALL
+        else:
+            rate = FLOOR_RISE
+        # Per-frame rate compounded over the quiet frames in this block
+        alpha = 1.0 - (1.0 - rate) ** len(quiet)
+        self.noise_floor_db += alpha * (target - self.noise_floor_db)
+
+    def _update_masking(self, energy_db: np.ndarray):
+        """Lift the masking once the source has been gone for UNMASK_FRAMES."""
+        low = energy_db < self._masking_db - UNMASK_DB
+        if low.all():
+            self._unmask_run += len(low)
+        else:
+            self._unmask_run = len(low) - 1 - int(np.flatnonzero(~low)[-1])
+        if self._unmask_run >= UNMASK_FRAMES:
+            self._masking_db = None
+
+    def _check_stationary(self, energy_db: np.ndarray):
+        """Speech varies by several dB per second; a steady source doesn't.
+
+        Once the last second is that flat, take its level as the new floor:
+        the frames fall under the offset margin and the hangover ends the
+        segment as usual.
+        """
+        self._recent = np.concatenate((self._recent, energy_db))[-STATIONARY_FRAMES:]
+        if len(self._recent) < STATIONARY_FRAMES or float(np.std(self._recent)) >= STATIONARY_DB:
+            return
+        level = float(np.median(self._recent))
+        if level > self.noise_floor_db:
+            self.noise_floor_db = level
+            self.stationary_ends += 1
+        self._recent = self._recent[:0]
+
+    def _run_hysteresis(self, onset_like: np.ndarray, above_offset: np.ndarray, position: int):
+        """Small per-frame state machine (a block holds only a few frames)."""
+        for i in range(len(onset_like)):
+            frame_pos = position + i * self.frame_len
+            if not self.is_speech:
+                if onset_like[i]:
+                    self._onset_run += 1
+                    if self._onset_run >= ONSET_FRAMES:
+                        self._start_speech(frame_pos - (ONSET_FRAMES - 1) * self.frame_len)
+                elif self._onset_run:
+                    self.rejected_onsets += 1
+                    self._onset_run = 0
+            else:
+                if frame_pos - self.speech_start_position >= MAX_SPEECH_SECONDS * self.sample_rate:
+                    # Nobody talks to us this long: it's the room. Its loud
+                    # end masks onsets, so it doesn't retrigger at once
+                    if len(self._recent):
+                        self._masking_db = float(np.percentile(self._recent, 90))
+                        self._unmask_run = 0
+                    self.forced_ends += 1
+                    self._end_speech(frame_pos)
+                    self.restart_silence(frame_pos)
+                    return  # Rest of the block was classified against the old floor
+                if above_offset[i]:
+                    self._quiet_run = 0
+                else:
+                    self._quiet_run += 1
+                    if self._quiet_run >= HANGOVER_FRAMES:
+                        self._end_speech(frame_pos - (HANGOVER_FRAMES - 1) * self.frame_len)
+                        # Milestones count from when the end was decided
+                        self.restart_silence(frame_pos + self.frame_len)
+
+    def _start_speech(self, position: int):
+        self.is_speech = True
+        self.triggers += 1
+        self._next_mark = len(self.silence_marks)
+        self._onset_run = 0
+        self._quiet_run = 0
+        self._recent = self._recent[:0]
+        self.speech_start_position = position
+        if self.on_speech_start:
+            self.on_speech_start(position)
+
+    def _end_speech(self, position: int):
+        self.is_speech = False
+        self._quiet_run = 0
+        self.speech_end_position = position
+        if self.on_speech_end:
+            self.on_speech_end(position)
+
+    def reset(self):
+        """Forget the current segment (keeps the learned floor)."""
+        self.is_speech = False
+        self._masking_db = None
+        self._onset_run = 0
+        self._quiet_run = 0
@@ -5,10 +5,13 @@ Entry point for the application.
 import sys
 import os
 from PySide6.QtGui import QGuiApplication
-from PySide6.QtQml import QQmlApplicationEngine
+from PySide6.QtQml import QQmlApplicationEngine, qmlRegisterType
 from PySide6.QtQuickControls2 import QQuickStyle
 from core.app_state import AppState
 from core.system_bridge import SystemBridge
+from core.process_monitor import ProcessMonitor
+from core.line_web import LineWeb
+from core.spectrum_ring import SpectrumRing
 
 if __name__ == "__main__":
     QQuickStyle.setStyle("Basic")
@@ -25,7 +28,11 @@ if __name__ == "__main__":
         traceback.print_exc()
         sys.exit(1)
 
+    app.aboutToQuit.connect(app_state.shutdown)
+
     system = SystemBridge()
+    runtime = ProcessMonitor()
+    app.aboutToQuit.connect(runtime.stop)
     
     # Initialize Core Logic (State Machine)
     print("[DEBUG] Initializing SteelCore...")
@@ -33,6 +40,10 @@ if __name__ == "__main__":
     core = SteelCore(app_state)
     print("[DEBUG] SteelCore Initialized")
 
+    # Scenegraph items
+    qmlRegisterType(LineWeb, "Steel.Render", 1, 0, "LineWeb")
+    qmlRegisterType(SpectrumRing, "Steel.Render", 1, 0, "SpectrumRing")
+
     engine = QQmlApplicationEngine()
     
     # Add UI modules path (Theme, etc.)
@@ -44,6 +55,7 @@ if __name__ == "__main__":
     engine.rootContext().setContextProperty("app", app_state)
     print("[DEBUG] Context Property Set")
     engine.rootContext().setContextProperty("system", system)
+    engine.rootContext().setContextProperty("runtime", runtime)
     
     # Load QML
     qml_file = os.path.join(os.path.dirname(__file__), "ui/main.qml")
@@ -1,5 +1,6 @@
 import QtQuick 2.15
 import Theme 1.0
+import Steel.Render 1.0
 
 Item {
     id: root
@@ -29,6 +30,7 @@ Item {
     property string assistantState: "IDLE"
     property string activeTab: "CORE"
     property real audioLevel: 0.0
+    property var spectrum: null // Packed float32 band levels (0..1)
     property string assistantText: "" // Output text from Assistant
     property string interactionMode: "COMMAND"  // COMMAND or CONVERSATION
     signal clicked()
@@ -248,6 +250,25 @@ Item {
         Behavior on scale { NumberAnimation { duration: 400; easing.type: Easing.OutQuad } }
     }
 
+    // ═══════════════════════════════════════════════════════
+    // LAYER 2.5: SPECTRUM RING (Live mic bands, mirrored)
+    // ═══════════════════════════════════════════════════════
+    SpectrumRing {
+        id: spectrumRing
+        width: 180
+        height: 180
+        x: (parent.width - width)/2
+        y: 100 - (height/2)
+        visible: listening
+        opacity: 0.8
+
+        spectrum: root.spectrum
+        innerRadius: 64
+        maxLength: 22
+        lineWidth: 2
+        color: Qt.rgba(accentColor.r, accentColor.g, accentColor.b, 0.9)
+    }
+
     // ═══════════════════════════════════════════════════════
     // LAYER 3: CORE SPHERE (The physical object)
     // ═══════════════════════════════════════════════════════
@@ -0,0 +1,130 @@
+import QtQuick 2.15
+import Theme 1.0
+
+
+// Debug overlay: the last few voice timelines (app.latencyTimelines).
+// Each row is one interaction - a bar scaled to its total with a tick per
+// event, and the event offsets in ms underneath.
+Rectangle {
+    id: root
+    width: 380
+    height: content.implicitHeight + 24
+    radius: 10
+    color: Qt.rgba(0, 0, 0, 0.72)
+    border.color: Qt.rgba(1, 1, 1, 0.12)
+    border.width: 1
+
+    property var timelines: []
+    property int rows: 5
+
+    // Newest first
+    readonly property var _shown: timelines ? timelines.slice(-rows).reverse() : []
+
+    // Events of one timeline sorted by time: [{name, ms}]
+    function sortedEvents(timeline) {
+        var list = []
+        for (var name in timeline.events)
+            list.push({ name: name, ms: timeline.events[name] })
+        list.sort(function(a, b) { return a.ms - b.ms })
+        return list
+    }
+
+    function eventColor(name) {
+        if (name === "barge_in" || name === "aborted") return Theme.colorWarning
+        if (name === "tts_audible") return Theme.colorSuccess
+        if (name === "final_result" || name === "router_match") return Theme.accentColor
+        return Theme.textSecondary
+    }
+
+    Column {
+        id: content
+        anchors.fill: parent
+        anchors.margins: 12
+        spacing: 10
+
+        Text {
+            text: "LATENCY  ·  last " + root._shown.length + " of " + (root.timelines ? root.timelines.length : 0)
+            font.pixelSize: 11
+            font.weight: Font.DemiBold
+            font.letterSpacing: 1.2
+            color: "#F5F7FA"
+            opacity: 0.9
+            font.family: FontRegistry.current.name
+        }
+
+        Text {
+            visible: root._shown.length === 0
+            text: "No finished interactions yet"
+            font.pixelSize: 10
+            color: "#CBD1D8"
+            opacity: 0.6
+            font.family: FontRegistry.current.name
+        }
+
+        Repeater {
+            model: root._shown
+
+            Column {
+                width: content.width
+                spacing: 4
+
+                property var timeline: modelData
+                property var events: root.sortedEvents(modelData)
+                property real total: Math.max(1, modelData.total_ms)
+
+                Item {
+                    width: parent.width
+                    height: 14
+
+                    Text {
+                        anchors.left: parent.left
+                        anchors.verticalCenter: parent.verticalCenter
+                        text: timeline.trigger
+                        font.pixelSize: 10
+                        color: "#CBD1D8"
+                        opacity: 0.75
+                        font.family: FontRegistry.current.name
+                    }
+                    Text {
+                        anchors.right: parent.right
+                        anchors.verticalCenter: parent.verticalCenter
+                        text: Math.round(timeline.total_ms) + " ms"
+                        font.pixelSize: 11
+                        font.weight: Font.DemiBold
+                        color: "#F5F7FA"
+                        font.family: FontRegistry.current.name
+                    }
+                }
+
+                // Timeline bar
+                Rectangle {
+                    id: track
+                    width: parent.width
+                    height: 6
+                    radius: 3
+                    color: Qt.rgba(1, 1, 1, 0.08)
+
+                    Repeater {
+                        model: events
+                        Rectangle {
+                            x: Math.min(track.width - width, modelData.ms / total * track.width)
+                            width: 2
+                            height: track.height + 4
+                            y: -2
+                            color: root.eventColor(modelData.name)
+                        }
+                    }
+                }
+
+                Text {
+                    width: parent.width
+                    wrapMode: Text.WordWrap
+                    text: events.slice(1).map(function(e) { return e.name + " " + Math.round(e.ms) }).join("  ·  ")
+                    font.pixelSize: 9
+                    color: "#9AA2AD"
+                    font.family: FontRegistry.current.name
+                }
+            }
+        }
+    }
+}
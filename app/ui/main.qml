@@ -367,6 +367,7 @@ Window {
         
         activeTab: root.activeTab
         audioLevel: (app && app.audioLevel) ? app.audioLevel : 0.0
+        spectrum: app ? app.spectrum : null
 
         onClicked: {
             if (app.assistantState === "IDLE") {
@@ -384,7 +385,23 @@ Window {
         id: wallpaperPanel
         z: 200
     }
-    
+
+    // Debug: per-interaction latency timelines (Ctrl+Shift+L)
+    LatencyOverlay {
+        id: latencyOverlay
+        anchors.top: parent.top
+        anchors.right: parent.right
+        anchors.margins: 16
+        z: 900
+        visible: false
+        timelines: (app && visible) ? app.latencyTimelines : []
+    }
+
+    Shortcut {
+        sequence: "Ctrl+Shift+L"
+        onActivated: latencyOverlay.visible = !latencyOverlay.visible
+    }
+
     function openWallpaperPanel() {
         wallpaperPanel.show()
     }
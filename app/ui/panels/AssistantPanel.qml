@@ -44,8 +44,10 @@ Item {
             Layout.fillWidth: true
             Layout.preferredHeight: 110
             title: "VOICE INTERFACE"
-            value: app && app.assistantState === "LISTENING" ? "Listening" : "Standby"
-            subtitle: app && app.assistantState === "LISTENING" ? "Audio streaming" : "Awaiting activation"
+            value: app && app.assistantState === "LISTENING" ? "Listening"
+                 : app && !app.speechReady ? "Starting" : "Standby"
+            subtitle: app && app.assistantState === "LISTENING" ? "Audio streaming"
+                    : app && !app.speechReady ? "Loading voice model" : "Awaiting activation"
             statusHint: app && app.assistantState === "LISTENING" ? "LIVE" : ""
             highlighted: app && app.assistantState === "LISTENING"
             icon: "../../assets/icons/mic.svg"
@@ -56,9 +58,11 @@ Item {
             Layout.fillWidth: true
             Layout.preferredHeight: 110
             title: "RUNTIME"
-            value: "Nominal"
-            subtitle: "CPU 12% · RAM 4.2 GB"
-            statusHint: "OK"
+            // Steel's own process tree (ProcessMonitor)
+            value: runtime ? "CPU " + runtime.steelCpu.toFixed(1) + "%" : "Nominal"
+            subtitle: runtime ? "RAM " + runtime.steelRssMb + " MB · sampler "
+                                + runtime.sampleCostMs.toFixed(1) + " ms" : ""
+            statusHint: runtime && runtime.steelCpu > 50 ? "BUSY" : "OK"
             icon: "../../assets/icons/vehicle.svg"
             uiScale: ui.scale
 
@@ -40,7 +40,7 @@ Item {
             
             title: "SYSTEM"
             value: "Nominal"
-            subtitle: "CPU 12% · RAM 4.2 GB · 62°C"
+            subtitle: system ? "CPU " + system.cpu + "% · RAM " + system.ram + "%" : ""
             statusHint: "OK"
             icon: "../../assets/icons/vehicle.svg"
             uiScale: 1.0
@@ -57,9 +57,11 @@ Item {
             value: app && app.assistantState === "LISTENING" ? "Listening" 
                  : app && app.assistantState === "THINKING" ? "Processing"
                  : app && app.assistantState === "RESPONDING" ? "Speaking"
+                 : app && !app.speechReady ? "Starting"
                  : "Standby"
             subtitle: app && app.assistantState !== "IDLE" 
                 ? "Voice input active" 
+                : app && !app.speechReady ? "Loading voice model"
                 : "Click orb to activate"
             statusHint: app && app.assistantState !== "IDLE" ? "ACTIVE" : ""
             highlighted: app && app.assistantState !== "IDLE"
@@ -1,4 +1,5 @@
 import QtQuick 2.15
+import "../components"
 import Theme 1.0
 
 
@@ -12,9 +13,21 @@ Item {
         z: -1
     }
 
+    // The process sampler only runs while this panel is on screen
+    Binding {
+        target: runtime
+        property: "active"
+        value: root.visible
+    }
+
     Column {
+        id: content
+        anchors.fill: parent
+        anchors.leftMargin: Theme.padding
+        anchors.rightMargin: Theme.padding
+        anchors.topMargin: 20
+        anchors.bottomMargin: 20
         spacing: 16
-        anchors.centerIn: parent
 
         Text {
             text: "SYSTEM"
@@ -24,29 +37,97 @@ Item {
             opacity: Theme.opMuted
             color: Theme.textMuted
             font.family: FontRegistry.current.name
-            horizontalAlignment: Text.AlignHCenter
-            anchors.horizontalCenter: parent.horizontalCenter
         }
 
-        Text {
-            text: "EVENT LOGS"
-            font.pixelSize: 24
-            font.weight: Font.Medium
-            opacity: Theme.opPrimary
-            color: Theme.textPrimary
-            font.family: FontRegistry.current.name
-            horizontalAlignment: Text.AlignHCenter
-            anchors.horizontalCenter: parent.horizontalCenter
+        // ─────────────────────────────────────────────────────
+        // Steel's own footprint (this process + its children)
+        // ─────────────────────────────────────────────────────
+        GlassTile {
+            width: parent.width
+            height: 100
+
+            title: "RUNTIME"
+            value: runtime ? "CPU " + runtime.steelCpu.toFixed(1) + "%" : "Nominal"
+            subtitle: runtime ? "RAM " + runtime.steelRssMb + " MB · sampler "
+                                + runtime.sampleCostMs.toFixed(1) + " ms" : ""
+            statusHint: runtime && runtime.steelCpu > 50 ? "BUSY" : "OK"
+            icon: "../../assets/icons/vehicle.svg"
+            uiScale: 1.0
         }
-        
-        Text {
-            text: "System diagnostics and runtime events"
-            font.pixelSize: 13
-            opacity: Theme.opMuted
-            color: Theme.textSecondary
-            font.family: FontRegistry.current.name
-            horizontalAlignment: Text.AlignHCenter
-            anchors.horizontalCenter: parent.horizontalCenter
+
+        // ─────────────────────────────────────────────────────
+        // Top processes | Steel threads
+        // ─────────────────────────────────────────────────────
+        Row {
+            width: parent.width
+            height: parent.height - y
+            spacing: 16
+
+            Repeater {
+                model: [
+                    { title: "TOP PROCESSES", rows: runtime ? runtime.processes : null },
+                    { title: "STEEL THREADS", rows: runtime ? runtime.threads : null }
+                ]
+
+                Column {
+                    width: (parent.width - parent.spacing) / 2
+                    height: parent.height
+                    spacing: 8
+
+                    Text {
+                        id: listTitle
+                        text: modelData.title
+                        font.pixelSize: 11
+                        font.weight: Font.Medium
+                        font.letterSpacing: 1.4
+                        opacity: Theme.opMuted
+                        color: Theme.textMuted
+                        font.family: FontRegistry.current.name
+                    }
+
+                    ListView {
+                        width: parent.width
+                        height: parent.height - listTitle.height - parent.spacing
+                        clip: true
+                        interactive: false
+                        spacing: 4
+                        model: modelData.rows
+
+                        delegate: Item {
+                            width: ListView.view.width
+                            height: 20
+
+                            // Processes have rssMb/steel roles, threads don't
+                            property bool own: model.steel === true
+
+                            Text {
+                                anchors.left: parent.left
+                                anchors.right: figures.left
+                                anchors.rightMargin: 8
+                                anchors.verticalCenter: parent.verticalCenter
+                                text: model.name
+                                elide: Text.ElideRight
+                                font.pixelSize: 12
+                                color: own ? Theme.accentColor : Theme.textSecondary
+                                opacity: Theme.opSecondary
+                                font.family: FontRegistry.current.name
+                            }
+
+                            Text {
+                                id: figures
+                                anchors.right: parent.right
+                                anchors.verticalCenter: parent.verticalCenter
+                                text: model.cpu.toFixed(1) + "%"
+                                      + (model.rssMb !== undefined ? " · " + model.rssMb + " MB" : "")
+                                font.pixelSize: 12
+                                color: Theme.textPrimary
+                                opacity: Theme.opSecondary
+                                font.family: FontRegistry.current.name
+                            }
+                        }
+                    }
+                }
+            }
         }
     }
 }
@@ -18,6 +18,7 @@ Item {
         StatCard { 
             title: "CPU LOAD"
             value: system.cpu + "%"
+            history: system.cpuHistory
             icon: "cpu"
         }
         
@@ -25,6 +26,7 @@ Item {
         StatCard { 
             title: "MEMORY"
             value: system.ram + "%"
+            history: system.ramHistory
             icon: "memory"
         }
         
@@ -32,6 +34,7 @@ Item {
         StatCard { 
             title: "BATTERY"
             value: system.battery + "%"
+            history: system.batteryHistory
             icon: "battery_full"
         }
         
@@ -43,6 +46,9 @@ Item {
         property string title
         property string value
         property string icon
+        property var history  // packed float32 samples, oldest first
+        
+        onHistoryChanged: spark.requestPaint()
         
         Layout.preferredWidth: 300
         Layout.preferredHeight: 180
@@ -73,5 +79,34 @@ Item {
                 Layout.alignment: Qt.AlignHCenter
             }
         }
+        
+        // Sparkline of recent samples (0-100)
+        Canvas {
+            id: spark
+            anchors.left: parent.left
+            anchors.right: parent.right
+            anchors.bottom: parent.bottom
+            anchors.margins: 16
+            height: 28
+            opacity: 0.6
+            
+            onPaint: {
+                var ctx = getContext("2d")
+                ctx.clearRect(0, 0, width, height)
+                if (!parent.history) return
+                var samples = new Float32Array(parent.history)
+                if (samples.length < 2) return
+                var step = width / (samples.length - 1)
+                ctx.strokeStyle = root.theme.primaryColor
+                ctx.lineWidth = 1.5
+                ctx.beginPath()
+                for (var i = 0; i < samples.length; i++) {
+                    var y = height - (samples[i] / 100) * height
+                    if (i === 0) ctx.moveTo(0, y)
+                    else ctx.lineTo(i * step, y)
+                }
+                ctx.stroke()
+            }
+        }
     }
 }
@@ -0,0 +1,158 @@
+"""
+Barge-in latency benchmark
+Steel OS v6.6
+
+"Stop" -> silence, in two measured parts:
+
+1. Detection: a recorded interrupt word is replayed (real time, headless)
+   through AudioBus -> KeywordSpotter. Measured from the end of the word
+   to the spotter callback.
+2. Cut: PcmPlayer plays a tone and is stopped at a random point. Measured
+   from stop() to the silenced block, plus the device output latency.
+   Needs an audio output device; skipped otherwise.
+
+Usage:
+    python benchmarks/bench_barge_in.py --stop stop.wav [--model PATH]
+                                        [--runs N] [--json OUT]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app"))
+sys.path.insert(0, APP_DIR)
+
+import numpy as np  # noqa: E402
+from vosk import Model, SetLogLevel  # noqa: E402
+
+from core.audio_bus import AudioBus  # noqa: E402
+from core.audio_output import PcmPlayer  # noqa: E402
+from core.command_router import INTERRUPTS  # noqa: E402
+from core.keyword_spotter import KeywordSpotter  # noqa: E402
+
+from bench_e2e_latency import BLOCK, SAMPLE_RATE, load_wav, room_tone, speech_end  # noqa: E402
+
+DEFAULT_MODEL = os.path.join(APP_DIR, "models", "vosk-model-small-en-us-0.15")
+LEAD_IN = 1.0
+TAIL = 1.0
+TONE_RATE = 22050
+
+
+def percentiles(values):
+    if not values:
+        return {"n": 0}
+    return {
+        "n": len(values),
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "max": float(np.max(values)),
+    }
+
+
+def measure_detection(model, word: np.ndarray, runs: int, rng):
+    bus = AudioBus(capture=False)
+    heard = threading.Event()
+    detected_at = [0.0]
+
+    def on_keyword(keyword, position):
+        detected_at[0] = time.perf_counter()
+        heard.set()
+
+    spotter = KeywordSpotter(model, INTERRUPTS, on_keyword, bus)
+    block_time = BLOCK / SAMPLE_RATE
+    results = []
+    for _ in range(runs):
+        heard.clear()
+        lead = room_tone(LEAD_IN, rng)
+        clip = np.concatenate((lead, word, room_tone(TAIL, rng)))
+        end_of_word = len(lead) + len(word)
+        spotter.start()
+        # Paced on a fixed schedule, so the block holding the word's end
+        # is written at a known time even if detection comes first
+        t0 = time.perf_counter()
+        word_end_at = t0 + ((end_of_word - 1) // BLOCK) * block_time
+        for k, start in enumerate(range(0, len(clip), BLOCK)):
+            delay = t0 + k * block_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            bus.write(clip[start:start + BLOCK])
+            if heard.is_set():
+                break
+        heard.wait(0.5)
+        spotter.stop()
+        if heard.is_set():
+            # Negative: fired on a partial before the word's tail was written
+            results.append((detected_at[0] - word_end_at) * 1000.0)
+    return results, spotter.detections
+
+
+def measure_cut(runs: int, rng):
+    player = PcmPlayer()
+    if not player.available:
+        return None
+    t = np.arange(int(TONE_RATE * 2.0)) / TONE_RATE
+    tone = (np.sin(2 * np.pi * 440.0 * t) * 8000).astype(np.int16)
+    results = []
+    for _ in range(runs):
+        timer = threading.Timer(rng.uniform(0.2, 1.0), player.stop)
+        timer.start()
+        completed = player.play(tone, TONE_RATE)
+        timer.cancel()
+        if not completed and player.last_cut_ms is not None:
+            results.append(player.last_cut_ms + player.output_latency * 1000.0)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--stop", required=True, help="16-bit WAV of an interrupt word")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--json", default=None)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model):
+        sys.exit(f"Vosk model not found at: {args.model}")
+
+    SetLogLevel(-1)
+    model = Model(args.model)
+    rng = np.random.default_rng(0)
+    word = load_wav(args.stop)
+    word = word[:speech_end(word)]
+
+    detection, hits = measure_detection(model, word, args.runs, rng)
+    cut = measure_cut(args.runs, rng)
+
+    summary = {
+        "detection_ms": percentiles(detection),
+        "detection_rate": hits / max(args.runs, 1),
+        "cut_ms": percentiles(cut) if cut is not None else None,
+    }
+    if detection and cut:
+        summary["total_p50_ms"] = summary["detection_ms"]["p50"] + summary["cut_ms"]["p50"]
+
+    print(f"\nDetection (word end -> spotter)   {args.runs} runs, {hits} detected")
+    d = summary["detection_ms"]
+    if d["n"]:
+        print(f"  p50 {d['p50']:7.1f} ms   p95 {d['p95']:7.1f} ms   max {d['max']:7.1f} ms")
+    if cut is None:
+        print("Cut (stop() -> silence)           skipped: no audio output device")
+    else:
+        c = summary["cut_ms"]
+        print(f"Cut (stop() -> silence)           {c['n']} runs")
+        if c["n"]:
+            print(f"  p50 {c['p50']:7.1f} ms   p95 {c['p95']:7.1f} ms   max {c['max']:7.1f} ms")
+    if "total_p50_ms" in summary:
+        print(f"\"stop\" -> silence (p50)          {summary['total_p50_ms']:7.1f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
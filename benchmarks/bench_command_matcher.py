@@ -0,0 +1,89 @@
+"""
+Command matching microbenchmark
+Steel OS v6.6
+
+Per-transcript routing cost as the command set grows:
+- BEFORE: `phrase in text` over every entry of command_actions
+- AFTER:  CommandMatcher (token Aho-Corasick, fuzzy fallback on a miss)
+
+Usage:
+    python benchmarks/bench_command_matcher.py [--commands 10,100,1000,5000] [--iterations N]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app"))
+sys.path.insert(0, APP_DIR)
+
+from core.command_matcher import CommandMatcher  # noqa: E402
+
+VERBS = ["open", "close", "switch to", "launch", "show", "hide", "start", "stop playing", "run"]
+NOUNS = ["bmw", "audi", "bentley", "logs", "browser", "terminal", "music", "weather",
+         "calendar", "settings", "camera", "notes", "mail", "maps", "photos", "clock"]
+
+
+def make_commands(count, rng):
+    commands = set()
+    while len(commands) < count:
+        noun = rng.choice(NOUNS)
+        suffix = f" {rng.randrange(10000)}" if len(commands) >= len(VERBS) * len(NOUNS) else ""
+        commands.add(f"{rng.choice(VERBS)} {noun}{suffix}")
+    return sorted(commands)
+
+
+def substring_match(commands, text):
+    for phrase in commands:
+        if phrase in text:
+            return phrase
+    return None
+
+
+def timed(fn, texts, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text)
+        samples.append((time.perf_counter() - start) * 1e6 / len(texts))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--commands", default="10,100,1000,5000")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'commands':>9}{'compile ms':>12}{'substr us':>12}{'exact us':>11}{'fuzzy us':>11}{'miss us':>10}")
+    for count in (int(c) for c in args.commands.split(",") if c):
+        commands = make_commands(count, rng)
+        actions = dict.fromkeys(commands)
+
+        start = time.perf_counter()
+        matcher = CommandMatcher(commands)
+        compile_ms = (time.perf_counter() - start) * 1000.0
+
+        picks = [rng.choice(commands) for _ in range(50)]
+        exact = [f"hey steel please {p} now" for p in picks]
+        fuzzy = [p[:-1] + "x" if len(p.split()[-1]) >= 3 else p for p in picks]
+        misses = ["what is the meaning of life"] * 50
+
+        # Warm the fuzzy cache the way a live session would
+        for text in fuzzy:
+            matcher.match(text)
+
+        print(f"{count:>9}{compile_ms:>12.1f}"
+              f"{timed(lambda t: substring_match(actions, t), exact, args.iterations):>12.2f}"
+              f"{timed(matcher.match, exact, args.iterations):>11.2f}"
+              f"{timed(matcher.match, fuzzy, args.iterations):>11.2f}"
+              f"{timed(matcher.match, misses, args.iterations):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
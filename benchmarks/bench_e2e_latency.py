@@ -0,0 +1,307 @@
+"""
+End-to-end voice latency benchmark
+Steel OS v6.6
+
+Replays recorded commands through the real pipeline, headless, with no
+audio device:
+
+    WAV -> AudioBus -> VAD / SpeechRecognizer -> AppState endpointing
+        -> SteelCore.process_voice_command -> CommandRouter -> TTS (stubbed)
+
+Corpus: one 16 kHz mono WAV per phrase, named after it
+(e.g. "switch_to_bmw.wav", "lets_talk.wav"). Each recording is replayed
+in real time with several silence tails appended.
+
+Reports p50/p95/p99 per stage and recognition accuracy.
+
+Usage:
+    python benchmarks/bench_e2e_latency.py --corpus DIR [--tails 0.3,0.8,1.5,3.0]
+                                          [--model PATH] [--json OUT]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import wave
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app"))
+sys.path.insert(0, APP_DIR)
+
+import numpy as np  # noqa: E402
+from PySide6.QtCore import QCoreApplication, QEventLoop, Qt, QTimer  # noqa: E402
+
+import core.command_router as command_router  # noqa: E402
+import core.latency_trace as latency_trace  # noqa: E402
+import core.memory as memory  # noqa: E402
+from core.app_state import AppState  # noqa: E402
+from core.audio_bus import AudioBus  # noqa: E402
+from core.speech_recognizer import COMMAND_PHRASES  # noqa: E402
+
+SAMPLE_RATE = 16000
+BLOCK = 800              # 50 ms, same as the live bus
+LEAD_IN = 1.0            # Room tone before each utterance (VAD floor + pre-roll)
+NOISE_DBFS = -60.0       # Level of the synthetic room tone
+SETTLE_TIMEOUT = 8.0     # Max wait for the pipeline after the tail ends
+
+STAGES = [
+    ("endpoint", "end of speech -> PROCESSING"),
+    ("dispatch", "PROCESSING -> handle_command"),
+    ("route", "handle_command duration"),
+    ("tts", "end of speech -> TTS enqueue"),
+]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CORPUS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _phrase_key(text: str) -> str:
+    return "".join(c for c in text.lower() if c.isalnum() or c == " ").strip()
+
+
+def load_wav(path: str) -> np.ndarray:
+    """Read a WAV as 16 kHz mono int16 (mixes down and resamples if needed)."""
+    with wave.open(path, "rb") as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: expected 16-bit PCM")
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+        data = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+    if channels > 1:
+        data = data.reshape(-1, channels).mean(axis=1)
+    if rate != SAMPLE_RATE:
+        positions = np.arange(0, len(data), rate / SAMPLE_RATE)
+        data = np.interp(positions, np.arange(len(data)), data)
+    return data.astype(np.int16)
+
+
+def speech_end(samples: np.ndarray) -> int:
+    """Last 10 ms frame within 35 dB of the loudest frame."""
+    frame = SAMPLE_RATE // 100
+    n = len(samples) // frame
+    frames = samples[:n * frame].reshape(n, frame).astype(np.float32)
+    energy_db = 10 * np.log10((frames ** 2).mean(axis=1) + 1e-3)
+    voiced = np.nonzero(energy_db > energy_db.max() - 35.0)[0]
+    return int((voiced[-1] + 1) * frame) if len(voiced) else len(samples)
+
+
+def load_corpus(directory: str):
+    phrases = {_phrase_key(p): p for p in COMMAND_PHRASES}
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        if not name.lower().endswith(".wav"):
+            continue
+        key = _phrase_key(os.path.splitext(name)[0].replace("_", " "))
+        if key not in phrases:
+            print(f"[bench] Skipping {name}: not a COMMAND_PHRASES entry")
+            continue
+        samples = load_wav(os.path.join(directory, name))
+        corpus.append((phrases[key], samples[:speech_end(samples)]))
+    return corpus
+
+
+def room_tone(seconds: float, rng) -> np.ndarray:
+    amplitude = 32768.0 * 10 ** (NOISE_DBFS / 20.0)
+    return rng.normal(0.0, amplitude, int(seconds * SAMPLE_RATE)).astype(np.int16)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# HARNESS
+# ═══════════════════════════════════════════════════════════════════════════
+
+class LatencyHarness:
+    """Drives AppState/SteelCore with replayed audio and records timings."""
+
+    def __init__(self, app: QCoreApplication, model_path: str = None):
+        self.app = app
+        self.bus = AudioBus(capture=False)
+
+        # Keep the benchmark away from user data and the app's log file
+        self._workdir = tempfile.mkdtemp(prefix="steel-bench-")
+        os.chdir(self._workdir)
+        memory.MEMORY_FILE = os.path.join(self._workdir, "memory.json")
+        latency_trace.TRACE_FILE = os.path.join(self._workdir, "latency.jsonl")
+
+        # TTS stub: record the enqueue instead of speaking
+        command_router.tts_speak = self._on_tts
+
+        if model_path:
+            os.environ["STEEL_VOSK_MODEL"] = model_path
+        self.state = AppState(audio_bus=self.bus)
+        self._wait(lambda: self.state.speechReady or self.state.speech is None, 120.0)
+        if not self.state.speechReady:
+            raise RuntimeError("Speech recognizer failed to load")
+
+        # Connected before SteelCore so PROCESSING is seen before it's handled
+        self.state.assistantStateChanged.connect(self._on_state)
+
+        from core.steel_core import SteelCore
+        self.core = SteelCore(self.state)
+        self.core.initiative_timer.stop()  # No unsolicited suggestions mid-run
+        router = self.core.router
+        router.register_command("open logs", lambda: router.speak_intent("Opening logs."))
+
+        handle_command = router.handle_command
+
+        def timed_handle_command(text):
+            self._mark("handle_start")
+            self.transcript = text
+            result = handle_command(text)
+            self._mark("handle_end")
+            return result
+
+        router.handle_command = timed_handle_command
+        self.rng = np.random.default_rng(0)
+
+    # ─────────────────────────────────────────────────────────────
+    # HOOKS
+    # ─────────────────────────────────────────────────────────────
+
+    def _mark(self, name):
+        self.marks.setdefault(name, time.perf_counter())
+
+    def _on_tts(self, text):
+        self._mark("tts")
+
+    def _on_state(self):
+        if self.state.assistantState == "PROCESSING":
+            self._mark("processing")
+
+    def _wait(self, predicate, timeout):
+        deadline = time.perf_counter() + timeout
+        while not predicate() and time.perf_counter() < deadline:
+            self.app.processEvents(QEventLoop.AllEvents, 10)
+            time.sleep(0.002)
+
+    # ─────────────────────────────────────────────────────────────
+    # REPLAY
+    # ─────────────────────────────────────────────────────────────
+
+    def _play(self, samples: np.ndarray, end_of_speech: int):
+        """Write blocks in real time; mark when the last speech block lands."""
+        loop = QEventLoop()
+        cursor = [0]
+
+        def feed():
+            start = cursor[0]
+            if start >= len(samples):
+                timer.stop()
+                loop.quit()
+                return
+            self.bus.write(samples[start:start + BLOCK])
+            cursor[0] = start + BLOCK
+            if start < end_of_speech <= start + BLOCK:
+                self._mark("speech_end")
+
+        timer = QTimer()
+        timer.setTimerType(Qt.PreciseTimer)
+        timer.timeout.connect(feed)
+        timer.start(BLOCK * 1000 // SAMPLE_RATE)
+        loop.exec()
+
+    def run_one(self, phrase: str, speech: np.ndarray, tail: float) -> dict:
+        self.marks = {}
+        self.transcript = ""
+        lead = room_tone(LEAD_IN, self.rng)
+        clip = np.concatenate((lead, speech, room_tone(tail, self.rng)))
+        self._play(clip, len(lead) + len(speech))
+
+        # Keep room tone flowing until the reply is queued (or we give up)
+        deadline = time.perf_counter() + SETTLE_TIMEOUT
+        while "tts" not in self.marks and time.perf_counter() < deadline:
+            self._play(room_tone(0.1, self.rng), -1)
+
+        # Back to IDLE for the next utterance
+        self.state.set_state("IDLE")
+        self._wait(lambda: self.state.assistantState == "IDLE", 2.0)
+
+        m = self.marks
+        result = {
+            "phrase": phrase,
+            "tail": tail,
+            "transcript": self.transcript,
+            "correct": _phrase_key(self.transcript) == _phrase_key(phrase),
+        }
+        if "speech_end" in m and "processing" in m:
+            result["endpoint"] = (m["processing"] - m["speech_end"]) * 1000
+        if "processing" in m and "handle_start" in m:
+            result["dispatch"] = (m["handle_start"] - m["processing"]) * 1000
+        if "handle_start" in m and "handle_end" in m:
+            result["route"] = (m["handle_end"] - m["handle_start"]) * 1000
+        if "speech_end" in m and "tts" in m:
+            result["tts"] = (m["tts"] - m["speech_end"]) * 1000
+        return result
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# REPORT
+# ═══════════════════════════════════════════════════════════════════════════
+
+def percentile(values, p):
+    return float(np.percentile(values, p)) if values else float("nan")
+
+
+def summarize(results):
+    summary = {"utterances": len(results)}
+    for key, _ in STAGES:
+        values = [r[key] for r in results if key in r]
+        summary[key] = {
+            "n": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+        }
+    summary["accuracy"] = sum(r["correct"] for r in results) / max(len(results), 1)
+    return summary
+
+
+def print_summary(summary, tails):
+    print(f"\nUtterances: {summary['utterances']}  (tails: {', '.join(f'{t:g}s' for t in tails)})")
+    print(f"{'stage':<34}{'n':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for key, label in STAGES:
+        s = summary[key]
+        print(f"{label:<34}{s['n']:>5}{s['p50']:>10.1f}{s['p95']:>10.1f}{s['p99']:>10.1f}")
+    print(f"Recognition accuracy: {summary['accuracy'] * 100:.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steel end-to-end voice latency benchmark")
+    parser.add_argument("--corpus", required=True, help="Directory of <phrase>.wav recordings")
+    parser.add_argument("--tails", default="0.3,0.8,1.5,3.0",
+                        help="Comma-separated silence tails in seconds")
+    parser.add_argument("--model", default=None, help="Vosk model directory")
+    parser.add_argument("--json", default=None, help="Write per-utterance results + summary")
+    args = parser.parse_args()
+
+    corpus_dir = os.path.abspath(args.corpus)
+    json_path = os.path.abspath(args.json) if args.json else None
+    tails = [float(t) for t in args.tails.split(",") if t]
+
+    app = QCoreApplication(sys.argv)
+    corpus = load_corpus(corpus_dir)
+    if not corpus:
+        sys.exit(f"No usable recordings in {corpus_dir}")
+
+    harness = LatencyHarness(app, model_path=args.model and os.path.abspath(args.model))
+    results = []
+    for phrase, speech in corpus:
+        for tail in tails:
+            result = harness.run_one(phrase, speech, tail)
+            results.append(result)
+            print(f"[bench] {phrase!r:<24} tail {tail:>4.1f}s -> {result['transcript']!r:<24}"
+                  f" endpoint {result.get('endpoint', float('nan')):7.1f} ms")
+
+    summary = summarize(results)
+    print_summary(summary, tails)
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump({"summary": summary, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
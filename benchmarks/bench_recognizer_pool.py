@@ -0,0 +1,86 @@
+"""
+Recognizer setup microbenchmark
+Steel OS v6.6
+
+Per-utterance recognizer setup cost:
+- BEFORE: new KaldiRecognizer per utterance (grammar FST compiled each time)
+- AFTER:  RecognizerPool.acquire() -> Reset() on a warm recognizer
+
+Usage:
+    python benchmarks/bench_recognizer_pool.py [--model PATH] [--iterations N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app"))
+sys.path.insert(0, APP_DIR)
+
+from vosk import Model, KaldiRecognizer, SetLogLevel  # noqa: E402
+
+from core.speech_recognizer import COMMAND_PHRASES, RecognizerPool  # noqa: E402
+
+DEFAULT_MODEL = os.path.join(APP_DIR, "models", "vosk-model-small-en-us-0.15")
+SAMPLE_RATE = 16000
+
+
+def timed(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    samples.sort()
+    return {
+        "mean": statistics.fmean(samples),
+        "p50": samples[len(samples) // 2],
+        "p95": samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+def report(label, stats):
+    print(f"  {label:<34} mean {stats['mean']:8.3f} ms   "
+          f"p50 {stats['p50']:8.3f} ms   p95 {stats['p95']:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model):
+        sys.exit(f"Vosk model not found at: {args.model}")
+
+    SetLogLevel(-1)
+    model = Model(args.model)
+    grammar = json.dumps(COMMAND_PHRASES)
+
+    def build(mode):
+        if mode == "COMMAND":
+            recognizer = KaldiRecognizer(model, SAMPLE_RATE, grammar)
+        else:
+            recognizer = KaldiRecognizer(model, SAMPLE_RATE)
+        recognizer.SetWords(True)
+        return recognizer
+
+    pool = RecognizerPool(build, ["COMMAND", "CONVERSATION"])
+
+    print(f"Recognizer setup per utterance ({args.iterations} iterations)")
+    for mode in ["COMMAND", "CONVERSATION"]:
+        print(f"{mode}:")
+        report("before: new KaldiRecognizer", timed(lambda: build(mode), args.iterations))
+        report("after:  pool.acquire() (Reset)", timed(lambda: pool.acquire(mode), args.iterations))
+
+    print("Grammar hot-swap:")
+    report("before: rebuild recognizer", timed(lambda: build("COMMAND"), args.iterations))
+    report("after:  pool.set_grammar() (SetGrammar)",
+           timed(lambda: pool.set_grammar("COMMAND", grammar), args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Orb web rendering benchmark
+Steel OS v6.6
+
+Idle cost of the orb's node rings (NeuralWebRing + OrbNet, both active):
+- BEFORE: JS Canvas repaints (60 ms timer, one beginPath/stroke per link,
+          itemAt() per node; one Canvas per OrbNet link)
+- AFTER:  LineWeb painted item (one drawLines per ring, timer only while
+          something moves)
+
+Reports process CPU (% of one core, all threads) and per-frame work time
+(beforeSynchronizing -> frameSwapped). The BEFORE components are the
+Canvas versions vendored in benchmarks/web_canvas_baseline/.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_web_render.py [--seconds S] [--copies N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app"))
+sys.path.insert(0, APP_DIR)
+
+from PySide6.QtCore import QEventLoop, QTimer, QUrl  # noqa: E402
+from PySide6.QtGui import QGuiApplication  # noqa: E402
+from PySide6.QtQml import qmlRegisterType  # noqa: E402
+from PySide6.QtQuick import QQuickView  # noqa: E402
+
+from core.line_web import LineWeb  # noqa: E402
+
+COMPONENTS = ("NeuralWebRing.qml", "OrbNet.qml")
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "web_canvas_baseline")
+
+SCENE = """
+import QtQuick 2.15
+import "components"
+
+Rectangle {
+    width: 480; height: 480
+    color: "#0B0F14"
+    Repeater {
+        model: %d
+        Item {
+            anchors.fill: parent
+            NeuralWebRing { anchors.centerIn: parent; radius: 130; active: true }
+            OrbNet { anchors.centerIn: parent; radius: 110; active: true }
+        }
+    }
+}
+"""
+
+
+def write_scene(directory, copies, baseline=None):
+    components = os.path.join(directory, "components")
+    os.makedirs(components)
+    for name in COMPONENTS:
+        source_dir = baseline or os.path.join(APP_DIR, "ui", "components")
+        with open(os.path.join(source_dir, name)) as f:
+            source = f.read()
+        with open(os.path.join(components, name), "w") as f:
+            f.write(source)
+    path = os.path.join(directory, "scene.qml")
+    with open(path, "w") as f:
+        f.write(SCENE % copies)
+    return path
+
+
+def run(path, seconds, warmup, grab=None):
+    view = QQuickView()
+    view.setSource(QUrl.fromLocalFile(path))
+    if view.errors():
+        raise SystemExit("\n".join(e.toString() for e in view.errors()))
+
+    frames = []
+    started = {}
+    view.beforeSynchronizing.connect(lambda: started.setdefault("t", time.perf_counter()))
+    view.frameSwapped.connect(lambda: frames.append((time.perf_counter() - started.pop("t", time.perf_counter())) * 1000.0))
+
+    def wait(duration):
+        loop = QEventLoop()
+        QTimer.singleShot(int(duration * 1000), loop.quit)
+        loop.exec()
+
+    view.show()
+    wait(warmup)
+    frames.clear()
+    cpu, wall = time.process_time(), time.perf_counter()
+    wait(seconds)
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    if grab:
+        view.grabWindow().save(grab)
+    view.close()
+    view.deleteLater()
+
+    frames.sort()
+    return {
+        "cpu": cpu / wall * 100.0,
+        "fps": len(frames) / wall,
+        "median": statistics.median(frames) if frames else 0.0,
+        "p95": frames[int(len(frames) * 0.95)] if frames else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--copies", type=int, default=1, help="Ring pairs in the scene")
+    parser.add_argument("--baseline", default=BASELINE_DIR, help="Directory with the BEFORE components")
+    parser.add_argument("--grab", help="Save a frame of each run as <prefix>-before/after.png")
+    args = parser.parse_args()
+
+    app = QGuiApplication(sys.argv)
+    qmlRegisterType(LineWeb, "Steel.Render", 1, 0, "LineWeb")
+
+    print(f"{'renderer':>9}{'cpu %':>9}{'fps':>8}{'frame ms':>10}{'p95 ms':>9}")
+    for label, baseline in (("before", args.baseline), ("after", None)):
+        with tempfile.TemporaryDirectory(prefix="steel-web-") as directory:
+            path = write_scene(directory, args.copies, baseline)
+            grab = f"{args.grab}-{label}.png" if args.grab else None
+            result = run(path, args.seconds, args.warmup, grab)
+        print(f"{label:>9}{result['cpu']:>9.1f}{result['fps']:>8.1f}"
+              f"{result['median']:>10.2f}{result['p95']:>9.2f}")
+    del app
+
+
+if __name__ == "__main__":
+    main()